@@ -14,29 +14,98 @@ High-level architecture:
   we auto-wrap them with a small adapter so they appear as MCP tools with clean
   signatures. The adapter injects a DB connection and sets QueryBand from the
   request context when using HTTP.
+- Handlers are blocking, so the MCP wrappers run them on a bounded worker pool
+  (DBExecutor) with per-tool concurrency limits; cancelling an MCP call cancels
+  the request on its database connection.
 """
+import asyncio
+import importlib.util
 import inspect
 import os
-import re
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass, field
 from importlib.resources import files as pkg_files
-from typing import Any
+from typing import Any, Callable
 
-import yaml
 from fastmcp import FastMCP
 from fastmcp.prompts.prompt import TextContent, Message
 from pydantic import Field
 
 from teradata_mcp_server.config import Settings
 from teradata_mcp_server import utils as config_utils
-from teradata_mcp_server.utils import setup_logging, format_text_response, format_error_response
+from teradata_mcp_server.utils import ProfileMatcher, load_yaml, setup_logging, format_text_response, format_error_response
 from teradata_mcp_server.middleware import RequestContextMiddleware
-from teradata_mcp_server.tools.utils.queryband import build_queryband
+from teradata_mcp_server.tools.utils.queryband import build_queryband, SessionQueryBandCache
+from teradata_mcp_server.tools.utils.encoder import set_json_backend
+from teradata_mcp_server.tools.utils.lazy_import import get_deferred_imports
+from teradata_mcp_server.tools.utils.catalog_delta import get_watermark_store
+from teradata_mcp_server.tools.utils.pagination import configure_pagination
+from teradata_mcp_server.tools.utils.sql_metadata import configure_sql_metadata
+from teradata_mcp_server.tools.utils.prepared import get_prepared_stats, prepare_query
+from teradata_mcp_server.tools.utils.sql_validator import SQLValidationError, configure_validation_cache
+from teradata_mcp_server.tools.utils.response_format import normalize_response_format, use_response_format
+from teradata_mcp_server.tools.auth_executor import AuthValidationExecutor
+from teradata_mcp_server.tools.db_executor import DBExecutor, current_call, parse_concurrency_limits
+from teradata_mcp_server.tools.pool_maintenance import PoolMaintainer, warm_up_pool
+from teradata_mcp_server.tools.catalog_cache import CatalogCache, CatalogWatcher
+from teradata_mcp_server.tools.resilience import CircuitOpenError, ConnectionGuard, is_idempotent
 from sqlalchemy.engine import Connection
 from fastmcp.server.dependencies import get_context
 
 
+@dataclass(frozen=True)
+class ToolDispatch:
+    """Per-handler dispatch descriptor, computed once when a tool is registered.
+
+    - handler: the protocol-agnostic handler function
+    - tool_name: name reported in QueryBand and logs
+    - use_sqla: inject a SQLAlchemy Connection (True) or a raw DB-API connection
+    - inject_kwargs: internal arguments injected on every call (e.g. fs_config)
+    - retryable: the tool is idempotent and may be re-run after a dropped session
+      (handlers marked @idempotent, YAML tools and cubes with ``idempotent: true``)
+    - inject_session: pass the caller's MCP session (and principal) as ``session_id``
+    """
+    handler: Callable[..., Any]
+    tool_name: str
+    use_sqla: bool
+    inject_kwargs: dict[str, Any] = field(default_factory=dict)
+    retryable: bool = False
+    inject_session: bool = False
+
+
+@dataclass(frozen=True)
+class RetryAfter:
+    """Result of a failed tool attempt that should be run again after ``delay`` seconds."""
+    delay: float
+
+
+def build_dispatch(
+    handler: Callable[..., Any],
+    tool_name: str | None = None,
+    inject_kwargs: dict[str, Any] | None = None,
+    retryable: bool | None = None,
+) -> ToolDispatch:
+    """Introspect a handler's signature once and return its dispatch descriptor."""
+    parameters = inspect.signature(handler).parameters
+    first_param = next(iter(parameters.values()), None)
+    ann = first_param.annotation if first_param is not None else inspect.Parameter.empty
+    tool_name = tool_name or getattr(handler, "__name__", "unknown_tool")
+    return ToolDispatch(
+        handler=handler,
+        tool_name=tool_name,
+        use_sqla=inspect.isclass(ann) and issubclass(ann, Connection),
+        inject_kwargs=dict(inject_kwargs or {}),
+        retryable=is_idempotent(handler) if retryable is None else retryable,
+        inject_session="session_id" in parameters,
+    )
+
+
 def create_mcp_app(settings: Settings):
     """Create and configure the FastMCP app with middleware, tools, prompts, resources."""
+    startup_start = time.perf_counter()
     logger = setup_logging(settings.logging_level, settings.mcp_transport)
 
     # Load tool module loader via teradata tools package
@@ -45,7 +114,14 @@ def create_mcp_app(settings: Settings):
     except ImportError:
         import tools as td  # dev fallback
 
-    mcp = FastMCP("teradata-mcp-server")
+    @asynccontextmanager
+    async def lifespan(server):
+        try:
+            yield {}
+        finally:
+            shutdown()
+
+    mcp = FastMCP("teradata-mcp-server", lifespan=lifespan)
 
     # Profiles (load via utils to honor packaged + working-dir overrides)
     profile_name = settings.profile
@@ -53,32 +129,55 @@ def create_mcp_app(settings: Settings):
         logger.info("No profile specified, load all tools, prompts and resources.")
     config = config_utils.get_profile_config(profile_name)
 
+    # Tabular result layout: explicit setting wins over the profile's response_format
+    response_format = normalize_response_format(settings.response_format or config.get('response_format'))
+    logger.info(f"JSON backend: {set_json_backend(settings.json_backend)}")
+    page_store = configure_pagination(settings.max_rows, settings.page_token_ttl, settings.page_max_tokens)
+    validation_cache = configure_validation_cache(settings.sql_validation_cache_size)
+    sql_metadata = configure_sql_metadata(settings.sql_metadata or config.get('sql_metadata'), settings.sql_metadata_max_chars)
+    logger.info(f"SQL metadata: {sql_metadata}")
+
+    # Profile patterns, compiled once; decisions are cached per object name
+    tool_matcher = ProfileMatcher(config.get('tool', []))
+    prompt_matcher = ProfileMatcher(config.get('prompt', []))
+    resource_matcher = ProfileMatcher(config.get('resource', []))
+
     # Feature flags from profiles
-    enableEFS = True if any(re.match(pattern, 'fs_*') for pattern in config.get('tool', [])) else False
-    enableEVS = True if any(re.match(pattern, 'evs_*') for pattern in config.get('tool', [])) else False
+    enableEFS = tool_matcher('fs_*')
+    enableEVS = tool_matcher('evs_*')
 
     # Initialize TD connection and optional teradataml/EFS context
     # Pass settings object to TDConn instead of just connection_url
     tdconn = td.TDConn(settings=settings)
     fs_config = None
+    fs_context_ready = False
+    fs_context_lock = threading.Lock()
     if enableEFS:
         # Only import FeatureStoreConfig (which depends on tdfs4ds) when EFS tools are enabled
         try:
             from teradata_mcp_server.tools.fs.fs_utils import FeatureStoreConfig
             fs_config = FeatureStoreConfig()
             # teradataml is optional; warn if unavailable but keep EFS enabled
-            try:
-                import teradataml as tdml
-                try:
-                    tdml.create_context(tdsqlengine=tdconn.engine)
-                except Exception as e:
-                    logger.warning(f"Error creating teradataml context: {e}")
-            except (AttributeError, ImportError, ModuleNotFoundError):
+            if importlib.util.find_spec("teradataml") is None:
                 logger.warning("teradataml not installed; EFS tools will operate without a teradataml context")
+                fs_context_ready = True
         except (AttributeError, ImportError, ModuleNotFoundError) as e:
             logger.warning(f"Feature Store module not available - disabling EFS functionality: {e}")
             enableEFS = False
 
+    def ensure_fs_context(tdconn_local):
+        """Create the teradataml context on the first fs tool call (teradataml takes seconds to import)."""
+        nonlocal fs_context_ready
+        with fs_context_lock:
+            if fs_context_ready:
+                return
+            try:
+                import teradataml as tdml
+                tdml.create_context(tdsqlengine=tdconn_local.engine)
+            except Exception as e:
+                logger.warning(f"Error creating teradataml context: {e}")
+            fs_context_ready = True
+
     # EVS connection (optional)
     evs = None
     if len(os.getenv("VS_NAME", "").strip()) > 0:
@@ -91,121 +190,274 @@ def create_mcp_app(settings: Settings):
 
     # Middleware (auth + request context)
     from teradata_mcp_server.tools.auth_cache import SecureAuthCache
-    auth_cache = SecureAuthCache(ttl_seconds=settings.auth_cache_ttl)
+    auth_cache = SecureAuthCache(ttl_seconds=settings.auth_cache_ttl, max_entries=settings.auth_cache_max_entries)
+    if settings.auth_mode == "basic":
+        auth_cache.start_sweeper(settings.auth_cache_sweep_interval)
+    auth_executor = AuthValidationExecutor(
+        max_workers=settings.auth_validation_workers,
+        timeout=settings.auth_validation_timeout,
+    )
 
     def get_tdconn(recreate: bool = False):
-        nonlocal tdconn, fs_config
+        nonlocal tdconn, fs_config, fs_context_ready
         if recreate:
             tdconn = td.TDConn(settings=settings)
             if enableEFS:
                 try:
-                    import teradataml as tdml
                     fs_config = td.FeatureStoreConfig()
-                    try:
-                        tdml.create_context(tdsqlengine=tdconn.engine)
-                    except Exception:
-                        pass
+                    fs_context_ready = importlib.util.find_spec("teradataml") is None
                 except Exception:
                     pass
+            warm_up(tdconn)
         return tdconn
 
     middleware = RequestContextMiddleware(
         logger=logger,
         auth_cache=auth_cache,
+        auth_executor=auth_executor,
         tdconn_supplier=get_tdconn,
         auth_mode=settings.auth_mode,
         transport=settings.mcp_transport,
     )
     mcp.add_middleware(middleware)
 
+    # Worker pool for blocking DB calls, sized to the connection pool capacity
+    db_executor = DBExecutor(
+        max_workers=settings.max_workers or (settings.pool_size + settings.max_overflow),
+        tool_concurrency=settings.tool_concurrency,
+        tool_limits=parse_concurrency_limits(settings.tool_concurrency_limits),
+    )
+
     # Adapters (inlined for simplicity)
     import socket
     hostname = socket.gethostname()
     process_id = f"{hostname}:{os.getpid()}"
 
-    def execute_db_tool(tool, *args, **kwargs):
+    def cancellable(dbapi_conn):
+        """Let a client-side cancel abort the request running on dbapi_conn."""
+        call = current_call()
+        cancel = getattr(dbapi_conn, "cancel", None)
+        if call is None or cancel is None:
+            return nullcontext()
+        return call.cancellable(cancel)
+
+    # Invalidate only failed sessions, retry idempotent tools, fail fast while the database is down
+    conn_guard = ConnectionGuard(
+        retry_attempts=settings.retry_attempts,
+        retry_backoff=settings.retry_backoff,
+        failure_threshold=settings.circuit_breaker_threshold,
+        reset_timeout=settings.circuit_breaker_reset,
+    )
+
+    # Pooled sessions remember their QueryBand so identical bands are not re-sent
+    qb_cache = SessionQueryBandCache()
+
+    # Open pooled sessions up front so the first tool calls do not pay the logon
+    warmup_stats: dict[str, Any] = {}
+
+    def warm_up(tdconn_local):
+        if not settings.pool_warmup or getattr(tdconn_local, "engine", None) is None:
+            return
+        base_qb = None
+        if settings.pool_warmup_queryband:
+            base_qb = build_queryband(
+                application=mcp.name,
+                profile=profile_name,
+                process_id=process_id,
+                tool_name=None,
+                request_context=None,
+            )
+        result = warm_up_pool(tdconn_local.engine, settings.pool_size, query_band=base_qb)
+        warmup_stats.update(result)
+        logger.info(f"Connection pool warm-up: {result['sessions']} sessions in {result['elapsed_ms']} ms")
+
+    warm_up(tdconn)
+
+    # Replace dead or expired idle sessions before a tool call checks them out
+    pool_maintainer = None
+    if settings.pool_ping_interval > 0:
+        pool_maintainer = PoolMaintainer(get_tdconn, settings.pool_ping_interval)
+        pool_maintainer.start()
+
+    # Cache catalog tool results per principal; optionally drop them after DDL
+    catalog_cache = None
+    catalog_watcher = None
+    if settings.catalog_cache_ttl > 0:
+        catalog_cache = CatalogCache(
+            ttl_seconds=settings.catalog_cache_ttl,
+            max_bytes=settings.catalog_cache_max_mb * 1024 * 1024,
+            require_principal=settings.auth_mode.lower() == "basic",
+        )
+        if settings.catalog_cache_poll_interval > 0:
+            catalog_watcher = CatalogWatcher(get_tdconn, catalog_cache, settings.catalog_cache_poll_interval)
+            catalog_watcher.start()
+
+    def get_catalog_cache_stats() -> dict:
+        stats = catalog_cache.get_stats()
+        if catalog_watcher is not None:
+            stats["polling"] = catalog_watcher.get_stats()
+        return stats
+
+    def get_pool_stats() -> dict:
+        engine = getattr(get_tdconn(), "engine", None)
+        pool = getattr(engine, "pool", None)
+        stats: dict[str, Any] = {"status": pool.status() if hasattr(pool, "status") else None}
+        if warmup_stats:
+            stats["warmup"] = dict(warmup_stats)
+        if pool_maintainer is not None:
+            stats["health_checks"] = pool_maintainer.get_stats()
+        return stats
+
+    def set_queryband(pooled_conn, execute_sql, dispatch: ToolDispatch, request_context) -> str | None:
+        """Set the session QueryBand for this call; return an error message if the
+        tool must not run (Basic auth without proxying), else None."""
+        qb = build_queryband(
+            application=mcp.name,
+            profile=profile_name,
+            process_id=process_id,
+            tool_name=dispatch.tool_name,
+            request_context=request_context,
+            include_request_id=settings.queryband_request_id,
+        )
+        try:
+            # Apply at session scope so it persists across statements
+            if qb_cache.apply(pooled_conn, qb, execute_sql):
+                logger.debug(f"QueryBand set: {qb}")
+            else:
+                logger.debug(f"QueryBand already set on session: {qb}")
+            logger.debug(f"Tool request context: {request_context}")
+        except Exception as qb_error:
+            logger.debug(f"Could not set QueryBand: {qb_error}")
+            # If in Basic auth, do not run the tool without proxying
+            if str(getattr(request_context, "auth_scheme", "")).lower() == "basic":
+                return f"Cannot run tool '{dispatch.tool_name}': failed to set QueryBand for Basic auth. Error: {qb_error}"
+        return None
+
+    def lease_engine(tdconn_local, request_context):
+        """Return a context manager yielding the engine for this call: the
+        principal's own pool when per-principal pools are enabled and the request
+        is proxied, else the shared engine."""
+        principal = getattr(request_context, "assume_user", None)
+        if tdconn_local.principal_pools is not None and principal:
+            return tdconn_local.principal_pools.lease(principal)
+        return nullcontext(tdconn_local.engine)
+
+    async def run_db_tool(tool_name: str, dispatch: ToolDispatch, *args, **kwargs):
+        """Run a tool call on the DB workers, retrying it after a dropped session.
+
+        The backoff is awaited here, after the attempt returned its worker and
+        concurrency slot, so a retrying call holds neither while it waits.
+        """
+        attempt = 0
+        while True:
+            result = await db_executor.run(tool_name, execute_db_tool, dispatch, attempt, *args, **kwargs)
+            if not isinstance(result, RetryAfter):
+                return result
+            attempt += 1
+            await asyncio.sleep(result.delay)
+
+    def execute_db_tool(dispatch: ToolDispatch, attempt: int, *args, **kwargs):
         """Execute a handler with a DB connection and MCP concerns.
 
-        - Detects whether the handler expects a SQLAlchemy Connection or a raw
-          DB-API connection and injects appropriately.
+        - Injects a SQLAlchemy Connection or a raw DB-API connection according to
+          the dispatch descriptor computed at registration time.
         - For HTTP transport, builds and sets Teradata QueryBand per request using
           the RequestContext captured by middleware.
         - Formats return values into FastMCP content and captures exceptions with
           context for easier debugging.
+        - Returns RetryAfter when attempt number ``attempt`` failed and the call
+          should be run again after a backoff (see run_db_tool).
         """
-        tool_name = kwargs.pop('tool_name', getattr(tool, '__name__', 'unknown_tool'))
         tdconn_local = get_tdconn()
 
         if not getattr(tdconn_local, "engine", None):
             logger.info("Reinitializing TDConn")
             tdconn_local = get_tdconn(recreate=True)
 
-        sig = inspect.signature(tool)
-        first_param = next(iter(sig.parameters.values()))
-        ann = first_param.annotation
-        use_sqla = inspect.isclass(ann) and issubclass(ann, Connection)
+        if dispatch.inject_kwargs:
+            kwargs.update(dispatch.inject_kwargs)
+        if enableEFS and not fs_context_ready and dispatch.tool_name.startswith("handle_fs_"):
+            ensure_fs_context(tdconn_local)
 
         try:
-            if use_sqla:
-                from sqlalchemy import text
-                with tdconn_local.engine.connect() as conn:
-                    # Always attempt to set QueryBand when a request context is present
-                    ctx = get_context()
-                    request_context = ctx.get_state("request_context") if ctx else None
+            # Always attempt to set QueryBand when a request context is present
+            ctx = get_context()
+            request_context = ctx.get_state("request_context") if ctx else None
+            if dispatch.inject_session:
+                kwargs["session_id"] = session_key(request_context)
+            catalog_tool = dispatch.tool_name.removeprefix("handle_")
+            cacheable = catalog_cache is not None and not args and catalog_cache.handles(catalog_tool)
+            if cacheable:
+                principal = getattr(request_context, "assume_user", None)
+                cached = catalog_cache.get(catalog_tool, kwargs, principal)
+                if cached is not None:
+                    return cached
+            conn_guard.before_call()
+            with use_response_format(response_format):
+                response = run_handler(tdconn_local, dispatch, request_context, args, kwargs)
+            conn_guard.on_success()
+            if cacheable:
+                catalog_cache.put(catalog_tool, kwargs, principal, response)
+            return response
+        except CircuitOpenError as e:
+            return format_error_response(str(e))
+        except Exception as e:
+            delay = conn_guard.on_failure(e, dispatch.retryable, attempt)
+            call = current_call()
+            if delay is None or (call is not None and call.cancelled):
+                logger.error(f"Error in execute_db_tool: {e}", exc_info=True, extra={"session_info": {"tool_name": dispatch.tool_name}})
+                return format_error_response(str(e))
+            logger.warning(f"Retrying tool '{dispatch.tool_name}' in {delay:.2f}s (attempt {attempt + 1}) after: {e}")
+            return RetryAfter(delay)
+
+    def session_key(request_context) -> str | None:
+        """Identify the caller's MCP session; assumed users get their own key."""
+        session_id = getattr(request_context, "session_id", None)
+        principal = getattr(request_context, "assume_user", None)
+        if session_id is None or principal is None:
+            return session_id
+        return f"{session_id}/{principal.upper()}"
+
+    def run_handler(tdconn_local, dispatch: ToolDispatch, request_context, args, kwargs):
+        """Run the handler once on a pooled session and format its result.
+
+        A session that fails with a connection-level error is invalidated so the
+        pool replaces it; the rest of the pool is left untouched.
+        """
+        with lease_engine(tdconn_local, request_context) as engine:
+            if dispatch.use_sqla:
+                with engine.connect() as conn:
                     if request_context is not None:
-                        qb = build_queryband(
-                            application=mcp.name,
-                            profile=profile_name,
-                            process_id=process_id,
-                            tool_name=tool_name,
-                            request_context=request_context,
-                        )
-                        try:
-                            conn.execute(text(f"SET QUERY_BAND = '{qb}' FOR SESSION"))
-                            logger.debug(f"QueryBand set: {qb}")
-                            logger.debug(f"Tool request context: {request_context}")
-                        except Exception as qb_error:
-                            logger.debug(f"Could not set QueryBand: {qb_error}")
-                            # If in Basic auth, do not run the tool without proxying
-                            if str(getattr(request_context, "auth_scheme", "")).lower() == "basic":
-                                return format_error_response(
-                                    f"Cannot run tool '{tool_name}': failed to set QueryBand for Basic auth. Error: {qb_error}"
-                                )
-                    result = tool(conn, *args, **kwargs)
+                        qb_error = set_queryband(conn.connection, conn.exec_driver_sql, dispatch, request_context)
+                        if qb_error:
+                            return format_error_response(qb_error)
+                    try:
+                        with cancellable(conn.connection.dbapi_connection):
+                            result = dispatch.handler(conn, *args, **kwargs)
+                    except Exception as e:
+                        conn_guard.invalidate(conn, e)
+                        raise
             else:
-                raw = tdconn_local.engine.raw_connection()
+                raw = engine.raw_connection()
                 try:
-                    # Always attempt to set QueryBand when a request context is present
-                    ctx = get_context()
-                    request_context = ctx.get_state("request_context") if ctx else None
                     if request_context is not None:
-                        qb = build_queryband(
-                            application=mcp.name,
-                            profile=profile_name,
-                            process_id=process_id,
-                            tool_name=tool_name,
-                            request_context=request_context,
-                        )
-                        try:
+                        def _execute(sql):
                             cursor = raw.cursor()
-                            # Apply at session scope so it persists across statements
-                            cursor.execute(f"SET QUERY_BAND = '{qb}' FOR SESSION")
-                            cursor.close()
-                            logger.debug(f"QueryBand set: {qb}")
-                            logger.debug(f"Tool request context: {request_context}")
-                        except Exception as qb_error:
-                            logger.debug(f"Could not set QueryBand: {qb_error}")
-                            if str(getattr(request_context, "auth_scheme", "")).lower() == "basic":
-                                return format_error_response(
-                                    f"Cannot run tool '{tool_name}': failed to set QueryBand for Basic auth. Error: {qb_error}"
-                                )
-                    result = tool(raw, *args, **kwargs)
+                            try:
+                                cursor.execute(sql)
+                            finally:
+                                cursor.close()
+                        qb_error = set_queryband(raw, _execute, dispatch, request_context)
+                        if qb_error:
+                            return format_error_response(qb_error)
+                    with cancellable(raw.dbapi_connection):
+                        result = dispatch.handler(raw, *args, **kwargs)
+                except Exception as e:
+                    conn_guard.invalidate(raw, e)
+                    raise
                 finally:
                     raw.close()
-            return format_text_response(result)
-        except Exception as e:
-            logger.error(f"Error in execute_db_tool: {e}", exc_info=True, extra={"session_info": {"tool_name": tool_name}})
-            return format_error_response(str(e))
+        return format_text_response(result)
 
     def make_tool_wrapper(func):
         """Create an MCP-facing wrapper for a handle_* function.
@@ -214,10 +466,11 @@ def create_mcp_app(settings: Settings):
           signature while still injecting them into the underlying handler.
         - Preserves the handler's parameter names and types so MCP clients can
           render friendly forms.
+        - Runs the handler on the DB worker pool so it never blocks the event loop.
         """
         sig = inspect.signature(func)
         inject_kwargs = {}
-        removable = {"conn", "tool_name"}
+        removable = {"conn", "tool_name", "session_id"}
         if "fs_config" in sig.parameters:
             inject_kwargs["fs_config"] = fs_config
             removable.add("fs_config")
@@ -238,8 +491,11 @@ def create_mcp_app(settings: Settings):
             if p.annotation is not inspect._empty:
                 annotations[name] = p.annotation
 
-        def _exec(*args, **kwargs):
-            return execute_db_tool(func, **inject_kwargs, **kwargs)
+        tool_name = getattr(func, "__name__", "wrapped_tool")[len("handle_"):]
+        dispatch = build_dispatch(func, inject_kwargs=inject_kwargs)
+
+        async def _exec(*args, **kwargs):
+            return await run_db_tool(tool_name, dispatch, **kwargs)
 
         _exec.__name__ = getattr(func, "__name__", "wrapped_tool")
         _exec.__signature__ = new_sig
@@ -248,15 +504,42 @@ def create_mcp_app(settings: Settings):
             _exec.__annotations__ = annotations
         return _exec
 
+    # Runtime statistics, served by the stats://server resource when enabled
+    stats_providers: dict[str, Callable[[], dict]] = {
+        "executor": db_executor.get_stats,
+        "queryband": qb_cache.get_stats,
+        "pool": get_pool_stats,
+        "resilience": conn_guard.get_stats,
+        "pagination": page_store.get_stats,
+        "catalog_delta": get_watermark_store().get_stats,
+        "sql_validation": validation_cache.get_stats,
+        "yaml_tools": get_prepared_stats,
+    }
+    if settings.auth_mode == "basic":
+        stats_providers["auth_cache"] = auth_cache.get_stats
+        stats_providers["credential_cache"] = lambda: get_tdconn().credential_cache.get_stats()
+        stats_providers["auth_validation"] = auth_executor.get_stats
+        stats_providers["auth_rate_limit"] = lambda: get_tdconn().rate_limiter.get_stats()
+        if tdconn.jwt_verifier is not None:
+            stats_providers["jwt_verification"] = lambda: get_tdconn().jwt_verifier.get_stats()
+    if catalog_cache is not None:
+        stats_providers["catalog_cache"] = get_catalog_cache_stats
+    if tdconn.principal_pools is not None:
+        stats_providers["principal_pools"] = lambda: get_tdconn().principal_pools.get_stats()
+    startup_report: dict[str, Any] = {}
+    stats_providers["startup"] = lambda: dict(startup_report, deferred_imports=get_deferred_imports())
+
     # Register code tools via module loader
+    phase_start = time.perf_counter()
     module_loader = td.initialize_module_loader(config)
     if module_loader:
         all_functions = module_loader.get_all_functions()
+        startup_report["load_modules_ms"] = round((time.perf_counter() - phase_start) * 1000, 1)
         for name, func in all_functions.items():
             if not (inspect.isfunction(func) and name.startswith("handle_")):
                 continue
             tool_name = name[len("handle_"):]
-            if not any(re.match(p, tool_name) for p in config.get('tool', [])):
+            if not tool_matcher(tool_name):
                 continue
             wrapped = make_tool_wrapper(func)
             mcp.tool(name=tool_name, description=wrapped.__doc__)(wrapped)
@@ -264,7 +547,10 @@ def create_mcp_app(settings: Settings):
     else:
         logger.warning("No module loader available, skipping code-defined tool registration")
 
+    startup_report["code_tools_ms"] = round((time.perf_counter() - phase_start) * 1000, 1)
+
     # Load YAML-defined tools/resources/prompts
+    phase_start = time.perf_counter()
     custom_object_files = [file for file in os.listdir() if file.endswith("_objects.yml")]
     if module_loader and profile_name:
         profile_yml_files = module_loader.get_required_yaml_paths()
@@ -291,7 +577,7 @@ def create_mcp_app(settings: Settings):
             else:
                 with open(file, encoding='utf-8', errors='replace') as f:
                     text = f.read()
-            loaded = yaml.safe_load(text)
+            loaded = load_yaml(text)
             if loaded:
                 custom_objects.update(loaded)
         except Exception as e:
@@ -357,11 +643,20 @@ def create_mcp_app(settings: Settings):
             )
             annotations[param_name] = type_hint
         sig = inspect.Signature(parameters)
+        # Validate and prepare the SQL once; calls bind values natively
+        try:
+            query = prepare_query(name, tool["sql"], param_defs)
+        except SQLValidationError as e:
+            logger.error(f"Tool {name} not registered, SQL validation failed: {e}")
+            return None
+        if query.undeclared:
+            logger.warning(f"Tool {name} uses bind parameters not declared in its YAML: {list(query.undeclared)}")
+        dispatch = build_dispatch(td.util_base_preparedQuery, tool_name=name, retryable=tool.get("idempotent", False) is True)
         async def _dynamic_tool(**kwargs):
             missing = [n for n in annotations if n not in kwargs]
             if missing:
                 raise ValueError(f"Missing parameters: {missing}")
-            return execute_db_tool(td.handle_base_readQuery, tool["sql"], tool_name=name, **kwargs)
+            return await run_db_tool(name, dispatch, query, **kwargs)
         _dynamic_tool.__signature__ = sig
         _dynamic_tool.__annotations__ = annotations
         return mcp.tool(name=name, description=tool.get("description", ""))(_dynamic_tool)
@@ -428,11 +723,14 @@ def create_mcp_app(settings: Settings):
         return _cube_query_tool
 
     def make_custom_cube_tool(name, cube):
+        dispatch = build_dispatch(td.util_base_dynamicQuery, retryable=cube.get("idempotent", False) is True)
+        sql_generator = generate_cube_query_tool(name, cube)
         async def _dynamic_tool(dimensions, measures, dim_filters="", meas_filters="", order_by="", top=None):
             # Accept dimensions and measures as comma-separated strings, parse to lists
-            return execute_db_tool(
-                td.util_base_dynamicQuery,
-                sql_generator=generate_cube_query_tool(name, cube),
+            return await run_db_tool(
+                _dynamic_tool.__name__,
+                dispatch,
+                sql_generator=sql_generator,
                 dimensions=dimensions,
                 measures=measures,
                 dim_filters=dim_filters,
@@ -487,26 +785,27 @@ def create_mcp_app(settings: Settings):
     custom_terms: list[tuple[str, Any, str]] = []
     for name, obj in custom_objects.items():
         obj_type = obj.get("type")
-        if obj_type == "tool" and any(re.match(pattern, name) for pattern in config.get('tool',[])):
+        if obj_type == "tool" and tool_matcher(name):
             fn = make_custom_query_tool(name, obj)
-            globals()[name] = fn
-            logger.info(f"Created tool: {name}")
-        elif obj_type == "prompt"  and any(re.match(pattern, name) for pattern in config.get('prompt',[])):
+            if fn is not None:
+                globals()[name] = fn
+                logger.info(f"Created tool: {name}")
+        elif obj_type == "prompt" and prompt_matcher(name):
             fn = make_custom_prompt(name, obj["prompt"], obj.get("description", ""), obj.get("parameters", {}))
             globals()[name] = fn
             logger.info(f"Created prompt: {name}")
-        elif obj_type == "cube"  and any(re.match(pattern, name) for pattern in config.get('tool',[])):
+        elif obj_type == "cube" and tool_matcher(name):
             fn = make_custom_cube_tool(name, obj)
             globals()[name] = fn
             logger.info(f"Created cube: {name}")
-        elif obj_type == "glossary"  and any(re.match(pattern, name) for pattern in config.get('resource',[])):
+        elif obj_type == "glossary" and resource_matcher(name):
             custom_glossary = {k: v for k, v in obj.items() if k != "type"}
             logger.info(f"Added custom glossary entries for: {name}.")
         else:
             logger.info(f"Type {obj_type if obj_type else ''} for custom object {name} is {'unknown' if obj_type else 'undefined'}.")
 
         for section in ("measures", "dimensions"):
-            if section in obj and  any(re.match(pattern, name) for pattern in config.get('tool',[])):
+            if section in obj and tool_matcher(name):
                 custom_terms.extend((term, details, name) for term, details in obj[section].items())
 
     # Enrich glossary
@@ -537,5 +836,45 @@ def create_mcp_app(settings: Settings):
             else:
                 return {"error": f"Glossary term not found: {term_name}"}
 
+    if resource_matcher("server_stats"):
+        @mcp.resource("stats://server")
+        def get_server_stats() -> dict:
+            return {name: provider() for name, provider in stats_providers.items()}
+
+    startup_report["yaml_objects_ms"] = round((time.perf_counter() - phase_start) * 1000, 1)
+    startup_report["create_app_ms"] = round((time.perf_counter() - startup_start) * 1000, 1)
+    if module_loader:
+        startup_report["module_imports_ms"] = module_loader.get_import_times()
+    if settings.profile_startup:
+        report_startup(dict(startup_report, deferred_imports=get_deferred_imports()))
+
+    def shutdown():
+        """Stop background threads and worker pools and close all database sessions."""
+        for component in (pool_maintainer, catalog_watcher, auth_cache):
+            if component is not None:
+                component.stop()
+        auth_executor.shutdown()
+        db_executor.shutdown()
+        try:
+            get_tdconn().close()
+        except Exception as e:
+            logger.warning(f"Error closing database connections: {e}")
+        logger.info("Server resources released")
+
     # Return the configured app and some handles used by the entrypoint if needed
     return mcp, logger
+
+
+def report_startup(report: dict[str, Any]):
+    """Print the startup timing report to stderr (stdout carries the MCP protocol in stdio mode)."""
+    lines = ["Startup profile:"]
+    for key in ("load_modules_ms", "code_tools_ms", "yaml_objects_ms", "create_app_ms"):
+        if key in report:
+            lines.append(f"  {key[:-3]:<24} {report[key]:10.1f} ms")
+    lines.append("  module imports:")
+    for name, ms in report.get("module_imports_ms", {}).items():
+        lines.append(f"    {name:<22} {ms:10.1f} ms")
+    deferred = report.get("deferred_imports") or {}
+    if deferred:
+        lines.append("  deferred until first use: " + ", ".join(sorted(deferred)))
+    print("\n".join(lines), file=sys.stderr)
@@ -25,14 +25,75 @@ class Settings:
     # Auth
     auth_mode: str = "none"  # none | basic
     auth_cache_ttl: int = 300
+    auth_cache_max_entries: int = 10000  # sessions kept; least recently used are evicted
+    auth_cache_sweep_interval: int = 60  # seconds between expired-entry sweeps, 0 = disabled
+    auth_credential_cache_ttl: int = 0  # seconds a verified Authorization header is reused across sessions, 0 = disabled
+    auth_credential_cache_max_entries: int = 1000
+    auth_validation_workers: int = 4  # threads running credential logons off the event loop
+    auth_validation_timeout: float = 15.0  # seconds before a pending validation is rejected
+    auth_jwt_verify: str = "database"  # database | local (signature checked against AUTH_JWT_JWKS)
+    auth_jwt_jwks: str | None = None  # JWKS file path or http(s) URL
+    auth_jwt_jwks_refresh: int = 3600  # seconds before the JWKS is re-read
+    auth_jwt_issuer: str | None = None
+    auth_jwt_audience: str | None = None  # comma-separated accepted audiences
+    auth_jwt_algorithms: str = "RS256,ES256"
+    auth_jwt_principal_claim: str = "sub"  # claim holding the database username
+    auth_jwt_db_fallback: bool = False  # logon with LOGMECH=JWT when no local key matches the token
 
     # Database configuration
     logmech: str = "TD2"
     auth_rate_limit_attempts: int = 5
     auth_rate_limit_window: int = 60
+    auth_rate_limit_max_clients: int = 100000  # tracked clients; new clients are refused when full
     pool_size: int = 5
     max_overflow: int = 10
     pool_timeout: int = 30
+    pool_recycle: int = -1  # seconds before a session is replaced, -1 = never
+    pool_warmup: bool = False  # open pool_size sessions at startup
+    pool_warmup_queryband: bool = True  # pre-set the base QueryBand on warmed sessions
+    pool_ping_interval: int = 0  # seconds between background health checks, 0 = disabled
+
+    # Connection failure handling
+    retry_attempts: int = 2  # retries of idempotent tools after a dropped session
+    retry_backoff: float = 0.5  # first retry delay in seconds, doubled each attempt
+    circuit_breaker_threshold: int = 5  # consecutive connection failures before failing fast
+    circuit_breaker_reset: int = 30  # seconds before a probe call is let through
+
+    # Per-principal pools (AUTH_MODE=basic proxying)
+    pool_mode: str = "shared"  # shared | principal
+    principal_pool_size: int = 2
+    principal_max_overflow: int = 2
+    principal_max_pools: int = 50
+    principal_pool_idle_timeout: int = 600
+    max_total_sessions: int = 0  # 0 = pool_size + max_overflow
+
+    # Tool execution (worker pool for blocking database calls)
+    max_workers: int = 0  # 0 = pool_size + max_overflow
+    tool_concurrency: int = 0  # default per-tool cap, 0 = half of max_workers
+    tool_concurrency_limits: str | None = None  # e.g. "dba_flowControl=2,base_readQuery=8"
+
+    # Tool results
+    response_format: str | None = None  # rows | columnar | csv | tsv; unset = profile's response_format, else rows
+    json_backend: str = "auto"  # auto | json | orjson (auto = orjson when installed)
+    max_rows: int = 0  # rows per response before truncating, 0 = unlimited
+    page_token_ttl: int = 600  # seconds a continuation token stays valid
+    page_max_tokens: int = 1000  # continuation tokens kept, least recently used evicted first
+    sql_metadata: str | None = None  # none | hash | truncated | full; unset = profile's sql_metadata, else full
+    sql_metadata_max_chars: int = 200  # characters kept in 'truncated' mode
+
+    # Catalog tool result cache
+    catalog_cache_ttl: int = 0  # seconds a cached catalog result stays valid, 0 = disabled
+    catalog_cache_max_mb: int = 64  # memory for cached catalog results
+    catalog_cache_poll_interval: int = 0  # seconds between DBC.TablesV change polls, 0 = TTL only
+
+    # SQL validation
+    sql_validation_cache_size: int = 1024  # cached statement analyses, 0 = disabled
+
+    # QueryBand
+    queryband_request_id: bool = True  # false drops REQUEST_ID so session QueryBands can be reused
+
+    # Print per-phase and per-module startup timings to stderr
+    profile_startup: bool = False
 
     # Logging
     logging_level: str = os.getenv("LOGGING_LEVEL", "WARNING")
@@ -51,11 +112,56 @@ def settings_from_env() -> Settings:
         mcp_path=os.getenv("MCP_PATH", "/mcp/"),
         auth_mode=os.getenv("AUTH_MODE", "none").lower(),
         auth_cache_ttl=int(os.getenv("AUTH_CACHE_TTL", "300")),
+        auth_cache_max_entries=int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000")),
+        auth_cache_sweep_interval=int(os.getenv("AUTH_CACHE_SWEEP_INTERVAL", "60")),
+        auth_credential_cache_ttl=int(os.getenv("AUTH_CREDENTIAL_CACHE_TTL", "0")),
+        auth_credential_cache_max_entries=int(os.getenv("AUTH_CREDENTIAL_CACHE_MAX_ENTRIES", "1000")),
+        auth_validation_workers=int(os.getenv("AUTH_VALIDATION_WORKERS", "4")),
+        auth_validation_timeout=float(os.getenv("AUTH_VALIDATION_TIMEOUT", "15")),
+        auth_jwt_verify=os.getenv("AUTH_JWT_VERIFY", "database").lower(),
+        auth_jwt_jwks=os.getenv("AUTH_JWT_JWKS") or None,
+        auth_jwt_jwks_refresh=int(os.getenv("AUTH_JWT_JWKS_REFRESH", "3600")),
+        auth_jwt_issuer=os.getenv("AUTH_JWT_ISSUER") or None,
+        auth_jwt_audience=os.getenv("AUTH_JWT_AUDIENCE") or None,
+        auth_jwt_algorithms=os.getenv("AUTH_JWT_ALGORITHMS", "RS256,ES256"),
+        auth_jwt_principal_claim=os.getenv("AUTH_JWT_PRINCIPAL_CLAIM", "sub"),
+        auth_jwt_db_fallback=os.getenv("AUTH_JWT_DB_FALLBACK", "false").lower() in {"1", "true", "yes"},
         logmech=os.getenv("LOGMECH", "TD2"),
         auth_rate_limit_attempts=int(os.getenv("AUTH_RATE_LIMIT_ATTEMPTS", "5")),
         auth_rate_limit_window=int(os.getenv("AUTH_RATE_LIMIT_WINDOW", "60")),
+        auth_rate_limit_max_clients=int(os.getenv("AUTH_RATE_LIMIT_MAX_CLIENTS", "100000")),
         pool_size=int(os.getenv("TD_POOL_SIZE", "5")),
         max_overflow=int(os.getenv("TD_MAX_OVERFLOW", "10")),
         pool_timeout=int(os.getenv("TD_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("TD_POOL_RECYCLE", "-1")),
+        pool_warmup=os.getenv("TD_POOL_WARMUP", "false").lower() in {"1", "true", "yes"},
+        pool_warmup_queryband=os.getenv("TD_POOL_WARMUP_QUERYBAND", "true").lower() in {"1", "true", "yes"},
+        pool_ping_interval=int(os.getenv("TD_POOL_PING_INTERVAL", "0")),
+        retry_attempts=int(os.getenv("TD_RETRY_ATTEMPTS", "2")),
+        retry_backoff=float(os.getenv("TD_RETRY_BACKOFF", "0.5")),
+        circuit_breaker_threshold=int(os.getenv("TD_CIRCUIT_BREAKER_THRESHOLD", "5")),
+        circuit_breaker_reset=int(os.getenv("TD_CIRCUIT_BREAKER_RESET", "30")),
+        pool_mode=os.getenv("TD_POOL_MODE", "shared").lower(),
+        principal_pool_size=int(os.getenv("TD_PRINCIPAL_POOL_SIZE", "2")),
+        principal_max_overflow=int(os.getenv("TD_PRINCIPAL_MAX_OVERFLOW", "2")),
+        principal_max_pools=int(os.getenv("TD_PRINCIPAL_MAX_POOLS", "50")),
+        principal_pool_idle_timeout=int(os.getenv("TD_PRINCIPAL_POOL_IDLE_TIMEOUT", "600")),
+        max_total_sessions=int(os.getenv("TD_MAX_TOTAL_SESSIONS", "0")),
+        max_workers=int(os.getenv("TD_MAX_WORKERS", "0")),
+        tool_concurrency=int(os.getenv("TD_TOOL_CONCURRENCY", "0")),
+        tool_concurrency_limits=os.getenv("TD_TOOL_CONCURRENCY_LIMITS") or None,
+        response_format=os.getenv("RESPONSE_FORMAT") or None,
+        json_backend=os.getenv("TD_JSON_BACKEND", "auto").lower(),
+        max_rows=int(os.getenv("TD_MAX_ROWS", "0")),
+        page_token_ttl=int(os.getenv("TD_PAGE_TOKEN_TTL", "600")),
+        page_max_tokens=int(os.getenv("TD_PAGE_MAX_TOKENS", "1000")),
+        sql_metadata=os.getenv("SQL_METADATA") or None,
+        sql_metadata_max_chars=int(os.getenv("SQL_METADATA_MAX_CHARS", "200")),
+        catalog_cache_ttl=int(os.getenv("TD_CATALOG_CACHE_TTL", "0")),
+        catalog_cache_max_mb=int(os.getenv("TD_CATALOG_CACHE_MAX_MB", "64")),
+        catalog_cache_poll_interval=int(os.getenv("TD_CATALOG_CACHE_POLL_INTERVAL", "0")),
+        sql_validation_cache_size=int(os.getenv("TD_SQL_VALIDATION_CACHE_SIZE", "1024")),
+        queryband_request_id=os.getenv("QUERYBAND_REQUEST_ID", "true").lower() in {"1", "true", "yes"},
+        profile_startup=os.getenv("TD_PROFILE_STARTUP", "false").lower() in {"1", "true", "yes"},
         logging_level=os.getenv("LOGGING_LEVEL", "WARNING"),
     )
@@ -8,7 +8,9 @@ access it at execution time (e.g., to build Teradata QueryBand).
 
 Behavior by transport:
 - stdio: fast-path, generates minimal request/session identifiers, skips headers/auth
-- http/sse: parses headers, enforces auth when configured, caches principals per session
+- http/sse: parses headers, enforces auth when configured, caches principals per session;
+  credential validation (a blocking database logon) runs on an AuthValidationExecutor
+  so it does not stall the event loop
 """
 
 import hashlib
@@ -21,6 +23,8 @@ from uuid import uuid4
 from fastmcp.server.dependencies import get_http_headers
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
+from teradata_mcp_server.tools.auth_executor import AuthValidationExecutor, AuthValidationTimeoutError
+
 
 @dataclass
 class RequestContext:
@@ -46,10 +50,12 @@ class RequestContextMiddleware(Middleware):
         tdconn_supplier: Callable[[], object],
         auth_mode: str = "none",
         transport: str | None = None,
+        auth_executor: AuthValidationExecutor | None = None,
     ) -> None:
         self.logger = logger
         self.auth_cache = auth_cache
         self.tdconn_supplier = tdconn_supplier
+        self.auth_executor = auth_executor or AuthValidationExecutor()
         self.auth_mode = (auth_mode or "none").lower()
         self.transport = (transport or "stdio").lower()
 
@@ -146,7 +152,12 @@ class RequestContextMiddleware(Middleware):
 
                 tdconn = self.tdconn_supplier()
                 try:
-                    validated_user = tdconn.validate_auth_header(auth_hdr)
+                    validated_user = await self.auth_executor.validate(
+                        scheme, auth_token_sha256, lambda: tdconn.validate_auth_header(auth_hdr)
+                    )
+                except AuthValidationTimeoutError as e:
+                    self.logger.warning(f"AUTH_MODE=basic: {e}")
+                    raise PermissionError("Authentication timed out. Please try again later.")
                 except Exception as e:
                     from teradata_mcp_server.tools.auth_validation import (
                         RateLimitExceededError, InvalidUsernameError, InvalidTokenFormatError,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import dataclasses
 import os
 import signal
 from dotenv import load_dotenv
@@ -27,11 +28,14 @@ def parse_args_to_settings() -> Settings:
     parser.add_argument('--auth_mode', type=str, required=False)
     parser.add_argument('--auth_cache_ttl', type=int, required=False)
     parser.add_argument('--logging_level', type=str, required=False)
+    parser.add_argument('--profile-startup', action='store_true', help='Print per-module import and registration timings to stderr')
 
     args, _ = parser.parse_known_args()
 
     env = settings_from_env()
-    return Settings(
+    # Command-line values override the environment; settings without a flag keep their env value
+    return dataclasses.replace(
+        env,
         profile=args.profile if args.profile is not None else env.profile,
         database_uri=args.database_uri if args.database_uri is not None else env.database_uri,
         mcp_transport=(args.mcp_transport or env.mcp_transport).lower(),
@@ -41,6 +45,7 @@ def parse_args_to_settings() -> Settings:
         auth_mode=(args.auth_mode or env.auth_mode).lower(),
         auth_cache_ttl=args.auth_cache_ttl if args.auth_cache_ttl is not None else env.auth_cache_ttl,
         logging_level=(args.logging_level or env.logging_level).upper(),
+        profile_startup=args.profile_startup or env.profile_startup,
     )
 
 
@@ -49,22 +54,28 @@ async def main():
     settings = parse_args_to_settings()
     mcp, logger = create_mcp_app(settings)
 
-    # Graceful shutdown
+    # Graceful shutdown: cancelling the run lets the app's lifespan stop its
+    # threads and close database sessions before the process exits
+    main_task = asyncio.current_task()
     try:
         loop = asyncio.get_running_loop()
         for s in (signal.SIGTERM, signal.SIGINT):
             logger.info(f"Registering signal handler for {s.name}")
-            loop.add_signal_handler(s, lambda s=s: os._exit(0))
+            loop.add_signal_handler(s, main_task.cancel)
     except NotImplementedError:
         logger.warning("Signal handling not supported on this platform")
 
     # Run transport
-    if settings.mcp_transport == 'sse':
-        await mcp.run_sse_async(host=settings.mcp_host, port=settings.mcp_port, path=settings.mcp_path)
-    elif settings.mcp_transport == 'streamable-http':
-        await mcp.run_http_async(transport='streamable-http', host=settings.mcp_host, port=settings.mcp_port, path=settings.mcp_path)
-    else:
-        await mcp.run_stdio_async()
+    try:
+        if settings.mcp_transport == 'sse':
+            await mcp.run_sse_async(host=settings.mcp_host, port=settings.mcp_port, path=settings.mcp_path)
+        elif settings.mcp_transport == 'streamable-http':
+            await mcp.run_http_async(transport='streamable-http', host=settings.mcp_host, port=settings.mcp_port, path=settings.mcp_path)
+        else:
+            await mcp.run_stdio_async()
+    except asyncio.CancelledError:
+        # Don't wait for tool calls still blocked in the database
+        os._exit(0)
 
 
 if __name__ == '__main__':
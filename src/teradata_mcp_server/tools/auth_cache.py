@@ -1,11 +1,20 @@
 """
 Secure authentication session cache with expiration and thread safety.
+
+Entries are spread over independently locked shards (by session id), so
+concurrent requests of different sessions rarely wait on each other. Each
+shard is a bounded LRU; an optional background sweeper removes expired
+entries instead of leaving them until the session's next request.
 """
 
-import time
+import logging
 import threading
-from typing import Optional, NamedTuple
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger("teradata_mcp_server")
 
 
 @dataclass
@@ -17,95 +26,163 @@ class AuthCacheEntry:
     created_at: float
 
 
+class _Shard:
+    __slots__ = ("lock", "entries", "hits", "misses", "mismatches", "expired", "evicted")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[str, AuthCacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.mismatches = 0
+        self.expired = 0
+        self.evicted = 0
+
+
 class SecureAuthCache:
-    """Thread-safe authentication cache with TTL expiration."""
-    
-    def __init__(self, ttl_seconds: int = 300):  # 5-minute default
-        self._cache: dict[str, AuthCacheEntry] = {}
-        self._lock = threading.RLock()
+    """Thread-safe, sharded authentication cache with TTL expiration and LRU eviction."""
+
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 10000, shards: int = 16):  # 5-minute default
         self._ttl = ttl_seconds
-    
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._max_entries = max(len(self._shards), max_entries)
+        self._shard_max = -(-self._max_entries // len(self._shards))  # ceil
+        self._stop = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweep_interval = 0
+        self._sweeps = 0
+
+    def _shard(self, session_id: str) -> _Shard:
+        return self._shards[hash(session_id) % len(self._shards)]
+
     def get(self, session_id: str, auth_hash: str) -> Optional[str]:
         """
         Get cached principal if session_id + auth_hash match and not expired.
         Returns None if not found, hash mismatch, or expired.
         """
-        with self._lock:
-            entry = self._cache.get(session_id)
+        shard = self._shard(session_id)
+        current_time = time.time()
+        with shard.lock:
+            entry = shard.entries.get(session_id)
             if not entry:
+                shard.misses += 1
                 return None
-                
-            current_time = time.time()
-            
+
             # Check expiration
             if current_time >= entry.expires_at:
-                del self._cache[session_id]
+                del shard.entries[session_id]
+                shard.expired += 1
+                shard.misses += 1
                 return None
-            
+
             # Check auth hash match (prevents session hijacking)
             if entry.auth_hash != auth_hash:
+                shard.mismatches += 1
+                shard.misses += 1
                 return None
-                
+
+            shard.entries.move_to_end(session_id)
+            shard.hits += 1
             return entry.principal
-    
+
     def set(self, session_id: str, principal: str, auth_hash: str):
         """Cache authenticated principal for session with auth hash."""
         current_time = time.time()
-        with self._lock:
-            self._cache[session_id] = AuthCacheEntry(
-                principal=principal,
-                auth_hash=auth_hash,
-                expires_at=current_time + self._ttl,
-                created_at=current_time
-            )
-            
-    
+        entry = AuthCacheEntry(
+            principal=principal,
+            auth_hash=auth_hash,
+            expires_at=current_time + self._ttl,
+            created_at=current_time
+        )
+        shard = self._shard(session_id)
+        with shard.lock:
+            shard.entries.pop(session_id, None)
+            while len(shard.entries) >= self._shard_max:
+                shard.entries.popitem(last=False)
+                shard.evicted += 1
+            shard.entries[session_id] = entry
+
     def invalidate(self, session_id: str):
         """Remove cached entry for session."""
-        with self._lock:
-            self._cache.pop(session_id, None)
-    
+        shard = self._shard(session_id)
+        with shard.lock:
+            shard.entries.pop(session_id, None)
+
     def cleanup_expired(self) -> int:
         """Remove expired entries and return count removed."""
-        current_time = time.time()
-        expired_sessions = []
-        
-        with self._lock:
-            for session_id, entry in self._cache.items():
-                if current_time >= entry.expires_at:
-                    expired_sessions.append(session_id)
-            
-            for session_id in expired_sessions:
-                del self._cache[session_id]
-        
-        return len(expired_sessions)
-    
+        removed = 0
+        for shard in self._shards:
+            # One shard at a time, so requests on other shards are not blocked
+            with shard.lock:
+                current_time = time.time()
+                expired_sessions = [sid for sid, entry in shard.entries.items() if current_time >= entry.expires_at]
+                for session_id in expired_sessions:
+                    del shard.entries[session_id]
+                shard.expired += len(expired_sessions)
+            removed += len(expired_sessions)
+        return removed
+
+    def start_sweeper(self, interval: int):
+        """Remove expired entries every ``interval`` seconds on a daemon thread."""
+        if self._sweeper is not None or interval <= 0:
+            return
+        self._sweep_interval = interval
+        self._sweeper = threading.Thread(target=self._sweep, name="td-auth-cache-sweeper", daemon=True)
+        self._sweeper.start()
+        logger.info(f"Auth cache sweep every {interval}s")
+
+    def stop(self):
+        self._stop.set()
+
+    def _sweep(self):
+        while not self._stop.wait(self._sweep_interval):
+            try:
+                self.cleanup_expired()
+                self._sweeps += 1
+            except Exception as e:
+                logger.warning(f"Auth cache sweep failed: {e}")
+
     def clear(self):
         """Clear all cached entries."""
-        with self._lock:
-            self._cache.clear()
-    
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+
     def size(self) -> int:
         """Return current cache size."""
-        with self._lock:
-            return len(self._cache)
-    
+        return sum(len(shard.entries) for shard in self._shards)
+
     def get_stats(self) -> dict:
         """Get cache statistics."""
         current_time = time.time()
-        active_count = 0
-        expired_count = 0
-        
-        with self._lock:
-            for entry in self._cache.values():
-                if current_time < entry.expires_at:
-                    active_count += 1
-                else:
-                    expired_count += 1
-        
+        totals = {"active": 0, "expired": 0, "hits": 0, "misses": 0, "mismatches": 0, "expirations": 0, "evictions": 0}
+
+        for shard in self._shards:
+            with shard.lock:
+                for entry in shard.entries.values():
+                    if current_time < entry.expires_at:
+                        totals["active"] += 1
+                    else:
+                        totals["expired"] += 1
+                totals["hits"] += shard.hits
+                totals["misses"] += shard.misses
+                totals["mismatches"] += shard.mismatches
+                totals["expirations"] += shard.expired
+                totals["evictions"] += shard.evicted
+
+        lookups = totals["hits"] + totals["misses"]
         return {
-            "total_entries": len(self._cache),
-            "active_entries": active_count,
-            "expired_entries": expired_count,
-            "ttl_seconds": self._ttl
+            "total_entries": totals["active"] + totals["expired"],
+            "active_entries": totals["active"],
+            "expired_entries": totals["expired"],
+            "ttl_seconds": self._ttl,
+            "max_entries": self._max_entries,
+            "shards": len(self._shards),
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "hit_rate": round(totals["hits"] / lookups, 4) if lookups else 0.0,
+            "hash_mismatches": totals["mismatches"],
+            "expirations": totals["expirations"],
+            "evictions": totals["evictions"],
+            "sweeps": self._sweeps,
         }
@@ -0,0 +1,146 @@
+"""
+Bounded executor for credential validation in the async request middleware.
+
+Validating an Authorization header is a synchronous teradatasql logon. Called
+directly from ``RequestContextMiddleware.on_request`` it blocked the event
+loop, and with it every in-flight request, for the duration of the logon.
+Validation runs here instead:
+
+- on a small dedicated ThreadPoolExecutor, so logons neither stall the loop
+  nor take workers from the database tool executor,
+- with a timeout; a request whose validation does not finish in time is
+  rejected (the logon itself cannot be interrupted and finishes in the
+  background, still bounded by the worker count),
+- coalesced: concurrent requests with the same header await one validation,
+- timed: per-scheme (basic/bearer) latency histograms are kept for stats.
+"""
+
+import asyncio
+import bisect
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+logger = logging.getLogger("teradata_mcp_server")
+
+# Upper bounds (ms) of the latency histogram buckets; larger values fall in "+Inf"
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class AuthValidationTimeoutError(Exception):
+    """Raised when credential validation does not complete within the timeout."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        super().__init__(f"Credential validation timed out after {timeout}s")
+
+
+class LatencyHistogram:
+    """Thread-safe latency histogram with fixed buckets (each value counted in its first bucket)."""
+
+    def __init__(self, bounds_ms: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self._bounds = tuple(bounds_ms)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, ms: float):
+        with self._lock:
+            self._counts[bisect.bisect_left(self._bounds, ms)] += 1
+            self._sum_ms += ms
+            self._max_ms = max(self._max_ms, ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            count = sum(self._counts)
+            buckets = {f"le_{bound:g}ms": n for bound, n in zip(self._bounds, self._counts)}
+            buckets["le_inf"] = self._counts[-1]
+            return {
+                "count": count,
+                "mean_ms": round(self._sum_ms / count, 2) if count else 0.0,
+                "max_ms": round(self._max_ms, 2),
+                "buckets": buckets,
+            }
+
+
+class AuthValidationExecutor:
+    """Runs credential validations off the event loop, bounded, coalesced and timed."""
+
+    def __init__(self, max_workers: int = 4, timeout: float = 15.0):
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="td-auth")
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._running = 0
+        self._validations = 0
+        self._coalesced = 0
+        self._timeouts = 0
+        self._errors = 0
+
+    def _histogram(self, scheme: str) -> LatencyHistogram:
+        histogram = self._histograms.get(scheme)
+        if histogram is None:
+            histogram = self._histograms.setdefault(scheme, LatencyHistogram())
+        return histogram
+
+    async def validate(self, scheme: str, key: str, func: Callable[[], Any]) -> Any:
+        """Await ``func()`` run on a worker, sharing it with concurrent calls of the same key.
+
+        ``key`` identifies the credential (e.g. the SHA-256 of the header
+        value). Raises AuthValidationTimeoutError after ``timeout`` seconds;
+        exceptions of ``func`` propagate to every waiting caller.
+        """
+        scheme = (scheme or "unknown").lower()
+        flight_key = (scheme, key)
+        future = self._inflight.get(flight_key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            ctx = contextvars.copy_context()
+            start = time.perf_counter()
+            self._validations += 1
+            self._running += 1
+
+            def _done(cf):
+                self._running -= 1
+                self._histogram(scheme).observe((time.perf_counter() - start) * 1000)
+                if self._inflight.get(flight_key) is future:
+                    del self._inflight[flight_key]
+                if not cf.cancelled() and cf.exception() is not None:
+                    self._errors += 1
+
+            future = loop.run_in_executor(self._pool, functools.partial(ctx.run, func))
+            future.add_done_callback(_done)
+            self._inflight[flight_key] = future
+        else:
+            self._coalesced += 1
+
+        try:
+            # shield: a timed-out or cancelled waiter must not cancel the shared validation
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            logger.warning(f"{scheme} credential validation timed out after {self.timeout}s")
+            raise AuthValidationTimeoutError(self.timeout) from None
+
+    def get_stats(self) -> dict:
+        """Get validation statistics with per-scheme latency histograms."""
+        return {
+            "max_workers": self.max_workers,
+            "timeout_seconds": self.timeout,
+            "running": self._running,
+            "validations": self._validations,
+            "coalesced": self._coalesced,
+            "timeouts": self._timeouts,
+            "errors": self._errors,
+            "latency": {scheme: h.snapshot() for scheme, h in sorted(self._histograms.items())},
+        }
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting work and release worker threads."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
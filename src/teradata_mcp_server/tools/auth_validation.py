@@ -3,10 +3,11 @@ Input validation and rate limiting for authentication attempts.
 """
 
 import re
+import math
 import time
 import hashlib
 import threading
-from collections import defaultdict, deque
+from collections import OrderedDict
 from typing import Optional
 from functools import wraps
 
@@ -45,75 +46,151 @@ class AuthValidator:
             return False
 
 
+class _ClientWindow:
+    """Attempt counters of one client: the current and the previous fixed window."""
+    __slots__ = ("window", "current", "previous")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.current = 0
+        self.previous = 0
+
+    def roll(self, window: int):
+        if window == self.window:
+            return
+        self.previous = self.current if window == self.window + 1 else 0
+        self.current = 0
+        self.window = window
+
+
+class _LimiterShard:
+    __slots__ = ("lock", "clients", "swept", "refused", "expired", "denied")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clients: "OrderedDict[str, _ClientWindow]" = OrderedDict()
+        self.swept = -1  # window of the last expiry pass
+        self.refused = 0
+        self.expired = 0
+        self.denied = 0
+
+
 class RateLimiter:
-    """Thread-safe rate limiter using sliding window."""
-    
-    def __init__(self, max_attempts: int = 5, window_seconds: int = 60):
+    """Thread-safe, memory-bounded rate limiter using a sliding window counter.
+
+    Each client keeps two counters (current and previous fixed window); the
+    attempts in the sliding window are estimated as
+    ``previous * (1 - elapsed fraction of current window) + current``.
+
+    Clients are spread over independently locked shards. Each shard keeps its
+    clients in least-recently-seen order, so clients idle for two windows
+    (whose counters no longer matter) are dropped from the front once per
+    window, touching only the expired clients. At most ``max_clients`` are
+    tracked. Counters that are still live are never evicted, since that would
+    reset them: when a shard is full, clients it does not track yet are
+    refused until older clients expire.
+    """
+
+    def __init__(self, max_attempts: int = 5, window_seconds: int = 60, max_clients: int = 100000, shards: int = 16):
         self.max_attempts = max_attempts
         self.window_seconds = window_seconds
-        self._attempts: dict[str, deque] = defaultdict(deque)
-        self._lock = threading.RLock()
-    
+        self._shards = [_LimiterShard() for _ in range(max(1, shards))]
+        self.max_clients = max(len(self._shards), max_clients)
+        self._shard_max = -(-self.max_clients // len(self._shards))  # ceil
+
+    def _shard(self, client_id: str) -> _LimiterShard:
+        return self._shards[hash(client_id) % len(self._shards)]
+
+    def _expire(self, shard: _LimiterShard, window: int):
+        # Oldest first: stop at the first client seen within the last two windows
+        clients = shard.clients
+        while clients:
+            oldest = next(iter(clients.values()))
+            if oldest.window >= window - 1:
+                break
+            clients.popitem(last=False)
+            shard.expired += 1
+
+    def _estimate(self, entry: _ClientWindow, current_time: float) -> float:
+        elapsed = (current_time % self.window_seconds) / self.window_seconds
+        return entry.previous * (1 - elapsed) + entry.current
+
     def is_allowed(self, client_id: str) -> bool:
         """Check if client is allowed to make a request."""
         current_time = time.time()
-        window_start = current_time - self.window_seconds
-        
-        with self._lock:
-            # Clean old attempts
-            attempts_queue = self._attempts[client_id]
-            while attempts_queue and attempts_queue[0] < window_start:
-                attempts_queue.popleft()
-            
+        window = int(current_time // self.window_seconds)
+        shard = self._shard(client_id)
+
+        with shard.lock:
+            if shard.swept != window:
+                self._expire(shard, window)
+                shard.swept = window
+            entry = shard.clients.get(client_id)
+            if entry is None:
+                if len(shard.clients) >= self._shard_max:
+                    shard.refused += 1
+                    return False
+                entry = shard.clients[client_id] = _ClientWindow(window)
+            else:
+                shard.clients.move_to_end(client_id)
+                entry.roll(window)
+
             # Check if under limit
-            if len(attempts_queue) >= self.max_attempts:
+            if self._estimate(entry, current_time) >= self.max_attempts:
+                shard.denied += 1
                 return False
-            
+
             # Record this attempt
-            attempts_queue.append(current_time)
+            entry.current += 1
             return True
-    
+
     def get_remaining_attempts(self, client_id: str) -> int:
         """Get number of remaining attempts for client."""
         current_time = time.time()
-        window_start = current_time - self.window_seconds
-        
-        with self._lock:
-            attempts_queue = self._attempts[client_id]
-            # Clean old attempts
-            while attempts_queue and attempts_queue[0] < window_start:
-                attempts_queue.popleft()
-            
-            return max(0, self.max_attempts - len(attempts_queue))
-    
+        window = int(current_time // self.window_seconds)
+        shard = self._shard(client_id)
+
+        with shard.lock:
+            entry = shard.clients.get(client_id)
+            if entry is None:
+                return self.max_attempts
+            entry.roll(window)
+            return max(0, self.max_attempts - math.ceil(self._estimate(entry, current_time)))
+
     def clear_client(self, client_id: str):
         """Clear rate limit history for client (e.g., successful auth)."""
-        with self._lock:
-            self._attempts.pop(client_id, None)
-    
+        shard = self._shard(client_id)
+        with shard.lock:
+            shard.clients.pop(client_id, None)
+
     def cleanup_old_entries(self) -> int:
-        """Remove old entries and return count of cleaned clients."""
-        current_time = time.time()
-        window_start = current_time - self.window_seconds
+        """Remove clients idle for two windows and return count of cleaned clients."""
+        window = int(time.time() // self.window_seconds)
         cleaned_count = 0
-        
-        with self._lock:
-            clients_to_remove = []
-            for client_id, attempts_queue in self._attempts.items():
-                # Clean old attempts
-                while attempts_queue and attempts_queue[0] < window_start:
-                    attempts_queue.popleft()
-                
-                # Remove empty queues
-                if not attempts_queue:
-                    clients_to_remove.append(client_id)
-            
-            for client_id in clients_to_remove:
-                del self._attempts[client_id]
-                cleaned_count += 1
-        
+        for shard in self._shards:
+            with shard.lock:
+                before = len(shard.clients)
+                self._expire(shard, window)
+                cleaned_count += before - len(shard.clients)
         return cleaned_count
 
+    def size(self) -> int:
+        """Return the number of tracked clients."""
+        return sum(len(shard.clients) for shard in self._shards)
+
+    def get_stats(self) -> dict:
+        """Get rate limiter statistics."""
+        return {
+            "max_attempts": self.max_attempts,
+            "window_seconds": self.window_seconds,
+            "clients": self.size(),
+            "max_clients": self.max_clients,
+            "shards": len(self._shards),
+            "denied": sum(shard.denied for shard in self._shards),
+            "expired_clients": sum(shard.expired for shard in self._shards),
+            "refused_clients": sum(shard.refused for shard in self._shards),
+        }
+
 
 def generate_client_id(auth_header: str, forwarded_for: Optional[str] = None) -> str:
     """Generate a client ID for rate limiting based on auth header and IP."""
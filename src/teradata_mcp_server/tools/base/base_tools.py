@@ -1,16 +1,32 @@
 import logging
-import re
+import time
 
 from sqlalchemy import text
 from sqlalchemy.engine import Connection, default
 from teradatasql import TeradataConnection
 
-from teradata_mcp_server.tools.utils import create_response, rows_to_json, validate_sql, SQLValidationError
+from teradata_mcp_server.tools.resilience import idempotent
+from teradata_mcp_server.tools.utils import (
+    PageQuery,
+    PreparedQuery,
+    SQLValidationError,
+    SchemaState,
+    add_sql_metadata,
+    create_response,
+    get_page_store,
+    get_watermark_store,
+    paged_sql,
+    rows_to_json,
+    skip_rows,
+    stream_response,
+    validate_sql,
+)
 
 logger = logging.getLogger("teradata_mcp_server")
 
 #------------------ Tool  ------------------#
 # Read query tool
+@idempotent
 def handle_base_readQuery(
     conn: Connection,
     sql: str | None = None,
@@ -31,7 +47,7 @@ def handle_base_readQuery(
 
     # Validate SQL for security before execution
     try:
-        validate_sql(sql)
+        analysis = validate_sql(sql)
     except SQLValidationError as e:
         logger.error(f"SQL validation failed: {e}")
         return create_response(
@@ -46,8 +62,7 @@ def handle_base_readQuery(
         )
 
     # Secondary security check: Ensure this is truly a read-only operation
-    sql_upper = sql.upper().strip()
-    if not sql_upper.startswith('SELECT') and not sql_upper.startswith('WITH'):
+    if not analysis.read_only:
         logger.error(f"SECURITY VIOLATION: Non-SELECT statement attempted: {sql[:50]}...")
         return create_response(
             [],
@@ -62,10 +77,9 @@ def handle_base_readQuery(
 
     # CRITICAL SECURITY CHECK: Final SQL interception before database execution
     # This is the last line of defense against dangerous operations
-    sql_final_check = sql.upper().strip()
     dangerous_final_check = ['DELETE', 'UPDATE', 'INSERT', 'DROP', 'CREATE', 'ALTER', 'TRUNCATE', 'MERGE']
     for dangerous_op in dangerous_final_check:
-        if re.search(rf'\b{dangerous_op}\b', sql_final_check):
+        if dangerous_op in analysis.operations:
             logger.critical(f"SECURITY ALERT: Dangerous operation '{dangerous_op}' blocked at final execution stage")
             raise SQLValidationError(f"CRITICAL SECURITY: Operation '{dangerous_op}' is strictly prohibited and blocked at execution level")
     
@@ -77,8 +91,6 @@ def handle_base_readQuery(
 
     # 3. Fetch rows & column metadata
     cursor = result.cursor  # underlying DB-API cursor
-    raw_rows = cursor.fetchall() or []
-    data = rows_to_json(cursor.description, raw_rows)
     columns = [
         {
             "name": col[0],
@@ -87,28 +99,92 @@ def handle_base_readQuery(
         for col in (cursor.description or [])
     ]
 
-    # 4. Compile the statement with literal binds for “final SQL”
-    #    Fallback to DefaultDialect if conn has no `.dialect`
-    dialect = getattr(conn, "dialect", default.DefaultDialect())
-    compiled = stmt.compile(
-        dialect=dialect,
-        compile_kwargs={"literal_binds": True}
-    )
-    final_sql = str(compiled)
+    # 4. Compile the statement with literal binds for “final SQL”, only if the
+    #    SQL metadata mode shows it. Fallback to DefaultDialect if conn has no `.dialect`
+    def render_sql():
+        dialect = getattr(conn, "dialect", default.DefaultDialect())
+        compiled = stmt.compile(
+            dialect=dialect,
+            compile_kwargs={"literal_binds": True}
+        )
+        return str(compiled)
 
     # 5. Build metadata using the rendered SQL
-    metadata = {
-        "tool_name": tool_name if tool_name else "base_readQuery",
-        "sql": final_sql,
-        "columns": columns,
-        "row_count": len(data),
-    }
+    metadata = {"tool_name": tool_name if tool_name else "base_readQuery"}
+    add_sql_metadata(metadata, sql, kwargs, render_sql)
+    metadata["columns"] = columns
+    metadata["row_count"] = 0  # set once all rows are streamed
     logger.debug(f"Tool: handle_base_readQuery: metadata: {metadata}")
-    return create_response(data, metadata)
+    page_query = PageQuery(tool_name=metadata["tool_name"], sql=sql, params=dict(kwargs))
+    try:
+        return stream_response(cursor, metadata, page_query=page_query)
+    finally:
+        result.close()
+
+
+#------------------ Tool  ------------------#
+# Next page tool
+@idempotent
+def handle_base_nextPage(
+    conn: Connection,
+    continuation_token: str,
+    *args,
+    **kwargs
+):
+    """
+    Fetch the next page of a query result that was truncated by the server row limit. Use the continuation_token from the metadata.next_page of the previous response.
+
+    Arguments:
+      continuation_token - token from metadata.next_page of the truncated response
+
+    Returns:
+      ResponseType: formatted response with the next rows + metadata
+    """
+    logger.debug(f"Tool: handle_base_nextPage: Args: continuation_token: {continuation_token}")
+
+    resolved = get_page_store().resolve(continuation_token)
+    if resolved is None:
+        return create_response(
+            [],
+            {
+                "tool_name": "base_nextPage",
+                "error": "Continuation token is unknown or expired; re-run the original query",
+                "row_count": 0,
+            }
+        )
+    page_query, offset = resolved
+
+    # The query is re-issued under the caller's identity, so validate it again
+    validate_sql(page_query.sql)
+    # Skip the earlier rows in the database when the statement allows it,
+    # else re-run it unchanged and discard them
+    sql = paged_sql(page_query.sql, offset)
+    if page_query.bind:
+        result = conn.execute(text(sql or page_query.sql), page_query.params)
+    else:
+        result = conn.exec_driver_sql(sql or page_query.sql)
+    try:
+        cursor = result.cursor
+        if sql is None:
+            skip_rows(cursor, offset)
+        metadata = {
+            "tool_name": page_query.tool_name,
+            "sql": page_query.sql,
+            "columns": [
+                {"name": col[0], "type": getattr(col[1], "__name__", str(col[1]))}
+                for col in (cursor.description or [])
+            ],
+            "row_offset": offset,
+            "row_count": 0,  # set once all rows are streamed
+        }
+        return stream_response(cursor, metadata, page_query=page_query, offset=offset)
+    finally:
+        result.close()
 
 
 #------------------ Tool  ------------------#
 # List databases tool
+@idempotent
 def handle_base_databaseList(conn: TeradataConnection, *args, **kwargs):
     """
     Lists all databases in the Teradata System.
@@ -138,6 +214,10 @@ def handle_base_databaseList(conn: TeradataConnection, *args, **kwargs):
 
 #------------------ Tool  ------------------#
 # List tables tool
+TABLE_LIST_FROM = "from dbc.TablesV tv where tv.TableKind in ('T','V', 'O', 'Q')"
+
+
+@idempotent
 def handle_base_tableList(conn: TeradataConnection, database_name: str | None = None, *args, **kwargs):
     """
     Lists all tables in a database.
@@ -150,7 +230,7 @@ def handle_base_tableList(conn: TeradataConnection, database_name: str | None =
     """
     logger.debug(f"Tool: handle_base_tableList: Args: database_name: {database_name}")
 
-    sql = "select TableName from dbc.TablesV tv where tv.TableKind in ('T','V', 'O', 'Q')"
+    sql = "select TableName " + TABLE_LIST_FROM
     params = []
 
     if database_name:
@@ -173,8 +253,86 @@ def handle_base_tableList(conn: TeradataConnection, database_name: str | None =
         return create_response(data, metadata)
 
 
+#------------------ Tool  ------------------#
+# Incremental table list tool
+@idempotent
+def handle_base_tableChanges(
+    conn: TeradataConnection,
+    database_name: str,
+    reset: bool = False,
+    session_id: str | None = None,
+    *args,
+    **kwargs
+):
+    """
+    Lists the tables of a database that were created, altered or dropped since this session last called the tool. The first call (or reset=True) lists all tables.
+
+    Arguments:
+      database_name - Database name
+      reset - forget the session's watermark and list all tables again
+
+    Returns:
+      ResponseType: formatted response with the changed tables + metadata
+    """
+    logger.debug(f"Tool: handle_base_tableChanges: Args: database_name: {database_name}, reset: {reset}")
+
+    store = get_watermark_store()
+    state = None if reset else store.get(session_id, database_name)
+    where = TABLE_LIST_FROM + " and UPPER(tv.DatabaseName) = UPPER(?)"
+    sql = "select TableName, TableKind, CreateTimeStamp, LastAlterTimeStamp " + where
+    data = []
+
+    with conn.cursor() as cur:
+        if state is None:
+            rows = cur.execute(sql, [database_name]).fetchall()
+            tables = {}
+            for name, kind, created, altered in rows:
+                tables[name.strip()] = altered
+                data.append({"TableName": name.strip(), "TableKind": kind, "Change": "listed", "LastAlterTimeStamp": altered})
+            watermark = max((ts for ts in tables.values() if ts is not None), default=None)
+        else:
+            # Created and altered objects move the watermark; drops only show in the count
+            if state.watermark is None:
+                rows = cur.execute(sql, [database_name]).fetchall()
+            else:
+                rows = cur.execute(sql + " and tv.LastAlterTimeStamp >= ?", [database_name, state.watermark]).fetchall()
+            tables = dict(state.tables)
+            for name, kind, created, altered in rows:
+                name = name.strip()
+                if name not in tables or (state.watermark is not None and created is not None and created > state.watermark):
+                    change = "created"
+                elif tables[name] != altered:
+                    change = "altered"
+                else:
+                    continue  # already returned at the watermark
+                tables[name] = altered
+                data.append({"TableName": name, "TableKind": kind, "Change": change, "LastAlterTimeStamp": altered})
+            count = cur.execute("select count(*) " + where, [database_name]).fetchall()[0][0]
+            if count != len(tables):
+                current = {row[0].strip() for row in cur.execute("select TableName " + where, [database_name]).fetchall()}
+                for name in sorted(tables.keys() - current):
+                    del tables[name]
+                    data.append({"TableName": name, "TableKind": None, "Change": "dropped", "LastAlterTimeStamp": None})
+            watermark = max((ts for ts in tables.values() if ts is not None), default=state.watermark)
+        store.put(session_id, database_name, SchemaState(watermark, tables), incremental=state is not None)
+
+    metadata = {
+        "tool_name": "base_tableChanges",
+        "database": database_name,
+        "incremental": state is not None,
+        "watermark": watermark,
+        "table_count": len(tables),
+        "row_count": len(data),
+    }
+    if session_id is None:
+        metadata["note"] = "No session id; the watermark is not kept between calls"
+    logger.debug(f"Tool: handle_base_tableChanges: metadata: {metadata}")
+    return create_response(data, metadata)
+
+
 #------------------ Tool  ------------------#
 # get DDL tool
+@idempotent
 def handle_base_tableDDL(conn: TeradataConnection, database_name: str | None, table_name: str, *args, **kwargs):
     """
     Displays the DDL definition of a table via SQLAlchemy, bind parameters if provided (prepared SQL), and return the fully rendered SQL (with literals) in metadata.
@@ -222,6 +380,7 @@ def handle_base_tableDDL(conn: TeradataConnection, database_name: str | None, ta
 
 #------------------ Tool  ------------------#
 # Read column description tool
+@idempotent
 def handle_base_columnDescription(conn: TeradataConnection, database_name: str | None, obj_name: str, *args, **kwargs):
     """
     Shows detailed column information about a database table via SQLAlchemy, bind parameters if provided (prepared SQL), and return the fully rendered SQL (with literals) in metadata.
@@ -301,8 +460,106 @@ def handle_base_columnDescription(conn: TeradataConnection, database_name: str |
         return create_response(data, metadata)
 
 
+#------------------ Tool  ------------------#
+# Whole-database schema snapshot tool
+SCHEMA_SNAPSHOT_SQL = """
+    select t.TableName, t.TableKind, t.CommentString as TableComment,
+        c.ColumnName, c.ColumnType, c.ColumnLength, c.DecimalTotalDigits, c.DecimalFractionalDigits,
+        c.CharType, c.Nullable, c.CommentString as ColumnComment, i.ColumnPosition as PIPosition
+    from DBC.TablesV t
+    left join DBC.ColumnsV c
+        on c.DatabaseName = t.DatabaseName and c.TableName = t.TableName
+    left join DBC.IndicesV i
+        on i.DatabaseName = c.DatabaseName and i.TableName = c.TableName
+        and i.ColumnName = c.ColumnName and i.IndexType in ('P', 'Q')
+    where t.DatabaseName = ? and t.TableKind in ('T', 'V', 'O', 'Q')
+    order by t.TableName, c.ColumnId
+"""
+
+COLUMN_TYPE_NAMES = {
+    '++': 'TD_ANYTYPE', 'A1': 'UDT', 'AN': 'UDT', 'AT': 'TIME', 'BF': 'BYTE', 'BO': 'BLOB', 'BV': 'VARBYTE',
+    'CF': 'CHAR', 'CO': 'CLOB', 'CV': 'VARCHAR', 'D': 'DECIMAL', 'DA': 'DATE', 'DH': 'INTERVAL DAY TO HOUR',
+    'DM': 'INTERVAL DAY TO MINUTE', 'DS': 'INTERVAL DAY TO SECOND', 'DT': 'DATASET', 'DY': 'INTERVAL DAY',
+    'F': 'FLOAT', 'HM': 'INTERVAL HOUR TO MINUTE', 'HR': 'INTERVAL HOUR', 'HS': 'INTERVAL HOUR TO SECOND',
+    'I1': 'BYTEINT', 'I2': 'SMALLINT', 'I8': 'BIGINT', 'I': 'INTEGER', 'JN': 'JSON', 'MI': 'INTERVAL MINUTE',
+    'MO': 'INTERVAL MONTH', 'MS': 'INTERVAL MINUTE TO SECOND', 'N': 'NUMBER', 'PD': 'PERIOD(DATE)',
+    'PM': 'PERIOD(TIMESTAMP WITH TIME ZONE)', 'PS': 'PERIOD(TIMESTAMP)', 'PT': 'PERIOD(TIME)',
+    'PZ': 'PERIOD(TIME WITH TIME ZONE)', 'SC': 'INTERVAL SECOND', 'SZ': 'TIMESTAMP WITH TIME ZONE',
+    'TS': 'TIMESTAMP', 'TZ': 'TIME WITH TIME ZONE', 'UT': 'UDT', 'XM': 'XML', 'YM': 'INTERVAL YEAR TO MONTH',
+    'YR': 'INTERVAL YEAR',
+}
+
+
+def _column_type(code, length, digits, fraction, char_type) -> str | None:
+    """Render a DBC.ColumnsV type code with its length or precision, e.g. VARCHAR(100)."""
+    if code is None:  # view columns carry no type in DBC
+        return None
+    code = code.strip()
+    name = COLUMN_TYPE_NAMES.get(code, code)
+    if code in ('CF', 'CV') and length:
+        return f"{name}({length // 2 if char_type == 2 else length})"
+    if code in ('BF', 'BV') and length:
+        return f"{name}({length})"
+    if code in ('D', 'N') and digits:
+        return f"{name}({digits},{fraction or 0})"
+    return name
+
+
+@idempotent
+def handle_base_schemaSnapshot(conn: TeradataConnection, database_name: str, *args, **kwargs):
+    """
+    Returns the tables, columns, column types, comments and primary indexes of a whole database in one call.
+
+    Use this instead of calling base_tableList and then base_columnDescription once per table.
+
+    Arguments:
+      database_name - Database name
+
+    Returns:
+      ResponseType: formatted response with a schema document + metadata
+    """
+    logger.debug(f"Tool: handle_base_schemaSnapshot: Args: database_name: {database_name}")
+
+    tables: dict[str, dict] = {}
+    with conn.cursor() as cur:
+        rows = cur.execute(SCHEMA_SNAPSHOT_SQL, [database_name]).fetchall()
+    column_count = 0
+    for (table_name, kind, table_comment, column_name, code, length, digits, fraction,
+         char_type, nullable, column_comment, pi_position) in rows:
+        table = tables.get(table_name)
+        if table is None:
+            table = tables[table_name] = {"name": table_name.strip(), "kind": kind.strip()}
+            if table_comment:
+                table["comment"] = table_comment
+            table["primary_index"] = []
+            table["columns"] = []
+        if column_name is None:  # no column rows in DBC (e.g. a view it cannot resolve)
+            continue
+        column = {"name": column_name.strip(), "type": _column_type(code, length, digits, fraction, char_type)}
+        if nullable == 'N':
+            column["nullable"] = False
+        if column_comment:
+            column["comment"] = column_comment
+        table["columns"].append(column)
+        if pi_position is not None:
+            table["primary_index"].append((pi_position, column["name"]))
+        column_count += 1
+    for table in tables.values():
+        table["primary_index"] = [name for _, name in sorted(table["primary_index"])]
+
+    metadata = {
+        "tool_name": "base_schemaSnapshot",
+        "database": database_name,
+        "table_count": len(tables),
+        "column_count": column_count,
+    }
+    logger.debug(f"Tool: handle_base_schemaSnapshot: metadata: {metadata}")
+    return create_response({"database": database_name, "tables": list(tables.values())}, metadata)
+
+
 #------------------ Tool  ------------------#
 # Read table preview tool
+@idempotent
 def handle_base_tablePreview(conn: TeradataConnection, table_name: str, database_name: str | None = None, *args, **kwargs):
     """
     This function returns data sample and inferred structure from a database table or view via SQLAlchemy, bind parameters if provided (prepared SQL), and return the fully rendered SQL (with literals) in metadata.
@@ -360,6 +617,7 @@ def handle_base_tablePreview(conn: TeradataConnection, table_name: str, database
 
 #------------------ Tool  ------------------#
 # Read table affinity tool
+@idempotent
 def handle_base_tableAffinity(conn: TeradataConnection, database_name: str, obj_name: str, *args, **kwargs):
     """
     Get tables commonly used together by database users, this is helpful to infer relationships between tables via SQLAlchemy, bind parameters if provided (prepared SQL), and return the fully rendered SQL (with literals) in metadata.
@@ -437,6 +695,7 @@ def handle_base_tableAffinity(conn: TeradataConnection, database_name: str, obj_
 
 #------------------ Tool  ------------------#
 # Read table usage tool
+@idempotent
 def handle_base_tableUsage(conn: TeradataConnection, database_name: str | None = None, *args, **kwargs):
     """
     Measure the usage of a table and views by users in a given schema, this is helpful to infer what database objects are most actively used or drive most value via SQLAlchemy, bind parameters if provided (prepared SQL), and return the fully rendered SQL (with literals) in metadata.
@@ -552,15 +811,70 @@ def util_base_dynamicQuery(conn: TeradataConnection, sql_generator: callable, *a
         if rows is None:
             return create_response([])
 
-        data = rows_to_json(cur.description, rows.fetchall())
-        metadata = {
-            "tool_name": sql_generator.__name__,
-            "sql": sql,
-            "columns": [
-                {"name": col[0], "type": col[1].__name__ if hasattr(col[1], '__name__') else str(col[1])}
-                for col in cur.description
-            ] if cur.description else [],
-            "row_count": len(data)
-        }
+        metadata = {"tool_name": sql_generator.__name__}
+        add_sql_metadata(metadata, sql)
+        metadata["columns"] = [
+            {"name": col[0], "type": col[1].__name__ if hasattr(col[1], '__name__') else str(col[1])}
+            for col in cur.description
+        ] if cur.description else []
+        metadata["row_count"] = 0  # set once all rows are streamed
         logger.debug(f"Tool: util_base_dynamicQuery: metadata: {metadata}")
-        return create_response(data, metadata)
+        page_query = PageQuery(tool_name=sql_generator.__name__, sql=sql, bind=False)
+        return stream_response(cur, metadata, page_query=page_query)
+
+
+#------------------ Tool  ------------------#
+# Prepared YAML query execution tool
+def util_base_preparedQuery(conn: TeradataConnection, query: PreparedQuery, *args, **kwargs):
+    """
+    This tool is used to execute the SQL of a YAML-defined query tool, prepared once at registration, with native parameter binding.
+
+    Arguments:
+      query (PreparedQuery) - the prepared SQL of the tool
+      **kwargs - bind parameter values
+
+    Returns:
+      ResponseType: formatted response with query results + metadata
+    """
+    logger.debug(f"Tool: util_base_preparedQuery: Args: tool: {query.tool_name}, kwargs={kwargs!r}")
+
+    try:
+        query.revalidate()
+        params = query.bind(kwargs)
+    except (SQLValidationError, ValueError) as e:
+        logger.error(f"Prepared query {query.tool_name} failed: {e}")
+        return create_response(
+            [],
+            {
+                "tool_name": query.tool_name,
+                "error": f"SQL validation failed: {str(e)}" if isinstance(e, SQLValidationError) else str(e),
+                "columns": [],
+                "row_count": 0,
+            }
+        )
+
+    start = time.perf_counter()
+    executed = None
+    try:
+        with conn.cursor() as cur:
+            if params:
+                cur.execute(query.driver_sql, params)
+            else:
+                cur.execute(query.driver_sql)
+            executed = time.perf_counter()
+            metadata = {"tool_name": query.tool_name}
+            add_sql_metadata(metadata, query.sql, kwargs, lambda: query.render(kwargs))
+            metadata["columns"] = [
+                {"name": col[0], "type": getattr(col[1], "__name__", str(col[1]))}
+                for col in (cur.description or [])
+            ]
+            metadata["row_count"] = 0  # set once all rows are streamed
+            logger.debug(f"Tool: util_base_preparedQuery: metadata: {metadata}")
+            page_query = PageQuery(tool_name=query.tool_name, sql=query.sql, params=dict(kwargs))
+            response = stream_response(cur, metadata, page_query=page_query)
+    except Exception:
+        end = time.perf_counter()
+        query.record((executed or end) - start, end - (executed or end), failed=True)
+        raise
+    query.record(executed - start, time.perf_counter() - executed)
+    return response
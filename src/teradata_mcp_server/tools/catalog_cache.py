@@ -0,0 +1,276 @@
+"""
+Result cache for read-only catalog tools.
+
+Agents call the catalog tools (database, table and column lists, table DDL, schema snapshots)
+again and again during one conversation, and each call queries the DBC views.
+``CatalogCache`` keeps their formatted responses in a memory-bounded LRU keyed
+by (tool, arguments, principal), so a principal only ever sees results that
+were produced under its own identity. Entries expire after a TTL.
+
+``CatalogWatcher`` optionally polls ``DBC.TablesV`` for the latest
+``LastAlterTimeStamp`` and table count of each database that has cached
+entries, and drops the entries of databases whose objects were created,
+altered or dropped. Cross-database results (``base_databaseList``) expire by
+TTL, or along with any invalidated database.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("teradata_mcp_server")
+
+# Cacheable tools and the arguments that name the database they read
+CATALOG_TOOLS: dict[str, tuple[str, ...]] = {
+    "base_databaseList": (),
+    "base_tableList": ("database_name",),
+    "base_columnDescription": ("database_name", "obj_name"),
+    "base_tableDDL": ("database_name", "table_name"),
+    "base_schemaSnapshot": ("database_name",),
+}
+
+WATERMARK_SQL = (
+    "SELECT DataBaseName, MAX(LastAlterTimeStamp), COUNT(*) "
+    "FROM DBC.TablesV WHERE DataBaseName IN ({}) GROUP BY DataBaseName"
+)
+# Databases per watermark query (one bind parameter each)
+WATERMARK_BATCH = 500
+
+
+def _database_of(tool_name: str, kwargs: dict[str, Any]) -> str | None:
+    """Return the (upper-cased) database a call reads, or None when it spans databases."""
+    for arg in CATALOG_TOOLS.get(tool_name, ()):
+        value = kwargs.get(arg)
+        if not value:
+            continue
+        value = str(value).strip().strip('"')
+        if arg == "database_name":
+            return value.upper()
+        if "." in value:  # qualified object name, e.g. table_name="db.tbl"
+            return value.split(".", 1)[0].strip('"').upper()
+    return None
+
+
+def _response_size(response: Any) -> int:
+    if isinstance(response, list):
+        return sum(len(getattr(item, "text", "") or "") for item in response) + 64
+    return len(str(response)) + 64
+
+
+def _is_error(response: Any) -> bool:
+    text = response[0].text if isinstance(response, list) and response else str(response)
+    return text.startswith("Error:") or '"status": "error"' in text or '"error": ' in text
+
+
+@dataclass
+class _Entry:
+    response: Any
+    size: int
+    expires_at: float
+    database: str | None
+
+
+class CatalogCache:
+    """Memory-bounded, expiring cache of catalog tool responses.
+
+    When ``require_principal`` is set (basic auth), calls without an
+    authenticated principal bypass the cache instead of sharing entries.
+    """
+
+    def __init__(self, ttl_seconds: int, max_bytes: int, require_principal: bool = False):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max(0, max_bytes)
+        self.require_principal = require_principal
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._tool_stats: dict[str, dict[str, int]] = {
+            name: {"hits": 0, "misses": 0, "stores": 0} for name in CATALOG_TOOLS
+        }
+        self._evicted = 0
+        self._expired = 0
+        self._invalidated = 0
+        self._bypassed = 0
+
+    def handles(self, tool_name: str) -> bool:
+        return tool_name in CATALOG_TOOLS
+
+    def _key(self, tool_name: str, kwargs: dict[str, Any], principal: str | None) -> tuple | None:
+        if principal is None:
+            if self.require_principal:
+                return None
+            principal = ""
+        return (tool_name, json.dumps(kwargs, sort_keys=True, default=str), principal.upper())
+
+    def get(self, tool_name: str, kwargs: dict[str, Any], principal: str | None) -> Any:
+        """Return the cached response for this call, or None."""
+        key = self._key(tool_name, kwargs, principal)
+        now = time.time()
+        with self._lock:
+            if key is None:
+                self._bypassed += 1
+                return None
+            stats = self._tool_stats[tool_name]
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key)
+                self._expired += 1
+                entry = None
+            if entry is None:
+                stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            stats["hits"] += 1
+            return entry.response
+
+    def put(self, tool_name: str, kwargs: dict[str, Any], principal: str | None, response: Any):
+        """Store a successful response; error responses and oversized ones are not cached."""
+        key = self._key(tool_name, kwargs, principal)
+        if key is None or _is_error(response):
+            return
+        size = _response_size(response)
+        if size > self.max_bytes:
+            return
+        entry = _Entry(response, size, time.time() + self.ttl_seconds, _database_of(tool_name, kwargs))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            self._tool_stats[tool_name]["stores"] += 1
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evicted += 1
+
+    def _remove(self, key: tuple):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def databases(self) -> set[str]:
+        """Return the databases read by unexpired entries."""
+        now = time.time()
+        with self._lock:
+            return {e.database for e in self._entries.values() if e.database is not None and e.expires_at > now}
+
+    def invalidate(self, databases: set[str] | None = None) -> int:
+        """Drop entries reading any of ``databases`` (and cross-database entries); all when None."""
+        with self._lock:
+            if databases is None:
+                keys = list(self._entries)
+            else:
+                keys = [k for k, e in self._entries.items() if e.database is None or e.database in databases]
+            for key in keys:
+                self._remove(key)
+            self._invalidated += len(keys)
+            return len(keys)
+
+    def get_stats(self) -> dict:
+        """Get catalog cache statistics."""
+        with self._lock:
+            tools = {}
+            for name, stats in self._tool_stats.items():
+                lookups = stats["hits"] + stats["misses"]
+                tools[name] = dict(stats, hit_rate=round(stats["hits"] / lookups, 4) if lookups else 0.0)
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "expired": self._expired,
+                "evicted": self._evicted,
+                "invalidated": self._invalidated,
+                "bypassed": self._bypassed,
+                "tools": tools,
+            }
+
+
+class CatalogWatcher:
+    """Background thread that invalidates cached catalog results after DDL.
+
+    Each pass reads the latest ``LastAlterTimeStamp`` and the object count of
+    the databases with cached entries from ``DBC.TablesV``; a changed
+    timestamp or count (objects created, altered or dropped) since the
+    previous pass invalidates that database's entries. The poll is skipped
+    while nothing is cached.
+    """
+
+    def __init__(self, tdconn_supplier: Callable[[], Any], cache: CatalogCache, interval: int):
+        self.tdconn_supplier = tdconn_supplier
+        self.cache = cache
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watermarks: dict[str, tuple | None] = {}
+        self._polls = 0
+        self._skipped = 0
+        self._changes = 0
+        self._last_poll_ms: float | None = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="td-catalog-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Catalog change polling every {self.interval}s")
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning(f"Catalog change poll failed: {e}")
+
+    def run_once(self):
+        """Poll the DDL watermarks once and invalidate changed databases."""
+        start = time.perf_counter()
+        databases = sorted(self.cache.databases())
+        if not databases:
+            # Nothing to invalidate; a database cached later is compared from its first poll
+            self._watermarks = {}
+            self._skipped += 1
+            return
+        engine = getattr(self.tdconn_supplier(), "engine", None)
+        if engine is None:
+            return
+        rows = []
+        pooled_conn = engine.raw_connection()
+        try:
+            cursor = pooled_conn.cursor()
+            try:
+                for i in range(0, len(databases), WATERMARK_BATCH):
+                    batch = databases[i:i + WATERMARK_BATCH]
+                    cursor.execute(WATERMARK_SQL.format(", ".join("?" * len(batch))), batch)
+                    rows.extend(cursor.fetchall())
+            finally:
+                cursor.close()
+        finally:
+            pooled_conn.close()
+        found = {str(name).strip().upper(): (str(ts), count) for name, ts, count in rows}
+        # A database without rows has no objects (or is gone): watermark None
+        current = {db: found.get(db) for db in databases}
+        previous, self._watermarks = self._watermarks, current
+        self._polls += 1
+        self._last_poll_ms = round((time.perf_counter() - start) * 1000, 1)
+        changed = {db for db in current.keys() & previous.keys() if previous[db] != current[db]}
+        if changed:
+            self._changes += len(changed)
+            dropped = self.cache.invalidate(changed)
+            logger.info(f"Catalog changed in {sorted(changed)[:10]}; dropped {dropped} cached results")
+
+    def get_stats(self) -> dict:
+        """Get catalog polling statistics."""
+        return {
+            "interval_seconds": self.interval,
+            "polls": self._polls,
+            "skipped_polls": self._skipped,
+            "watched_databases": len(self._watermarks),
+            "changed_databases": self._changes,
+            "last_poll_ms": self._last_poll_ms,
+        }
@@ -0,0 +1,155 @@
+"""
+Verified-credential cache shared by all MCP sessions.
+
+SecureAuthCache remembers the principal of a session, so every new session
+validated its Authorization header with a full Teradata logon even when the
+same token had just been verified for another session. This cache remembers
+verified credentials themselves, keyed by an HMAC of the header under a
+random per-process salt (the header is never stored, and the keys are useless
+outside this process).
+
+The cache is opt-in (``ttl_seconds`` > 0): a cached credential keeps being
+accepted for up to ``ttl_seconds`` after the password is changed, the user is
+locked or the token is revoked in the database or IdP.
+
+- Entries live for ``ttl_seconds``, but never past the ``exp`` claim of a
+  Bearer JWT; expired tokens are not cached at all. That claim is read
+  without verifying the token, so it can only shorten an entry's lifetime.
+- The cache is a bounded LRU.
+
+Concurrent first requests with the same header are coalesced before they get
+here, by AuthValidationExecutor in the request middleware.
+
+Failed validations are not cached; repeated bad credentials stay subject to
+the rate limiter.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+logger = logging.getLogger("teradata_mcp_server")
+
+
+def jwt_expiry(auth_header: str) -> Optional[float]:
+    """Return the ``exp`` claim of a Bearer JWT header, or None.
+
+    The payload is decoded without verifying the signature; the value only
+    shortens how long a database-verified token stays cached.
+    """
+    scheme, _, token = (auth_header or "").partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    parts = token.strip().split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = parts[1] + "=" * (-len(parts[1]) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if isinstance(exp, (int, float)) else None
+    except Exception:
+        return None
+
+
+class CredentialCache:
+    """Bounded cache of verified Authorization headers."""
+
+    def __init__(self, ttl_seconds: int = 0, max_entries: int = 1000):
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._salt = os.urandom(32)
+        self._entries: "OrderedDict[bytes, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def _key(self, auth_header: str) -> bytes:
+        return hmac.new(self._salt, auth_header.encode("utf-8"), hashlib.sha256).digest()
+
+    def get(self, auth_header: str) -> Optional[str]:
+        """Return the cached principal for a verified header, or None."""
+        key = self._key(auth_header)
+        with self._lock:
+            return self._lookup(key, time.time())
+
+    def _lookup(self, key: bytes, current_time: float) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        principal, expires_at = entry
+        if current_time >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return principal
+
+    def get_or_validate(self, auth_header: str, validate: Callable[[], Optional[str]]) -> Optional[str]:
+        """Return the cached principal for ``auth_header``, or call ``validate`` and cache its result.
+
+        ``validate`` returns the principal or None, or raises; only a principal
+        is cached.
+        """
+        if not self.enabled:
+            return validate()
+
+        key = self._key(auth_header)
+        with self._lock:
+            principal = self._lookup(key, time.time())
+            if principal is not None:
+                self._hits += 1
+                return principal
+            self._misses += 1
+
+        principal = validate()
+        if principal:
+            self._store(key, principal, jwt_expiry(auth_header))
+        return principal
+
+    def _store(self, key: bytes, principal: str, token_expiry: Optional[float]):
+        current_time = time.time()
+        expires_at = current_time + self._ttl
+        if token_expiry is not None:
+            expires_at = min(expires_at, token_expiry)
+        if expires_at <= current_time:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            self._entries[key] = (principal, expires_at)
+
+    def invalidate(self, auth_header: str):
+        """Forget a verified header (e.g. after the database rejected it)."""
+        key = self._key(auth_header)
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+            }
@@ -0,0 +1,188 @@
+"""
+Bounded executor that runs blocking database tool handlers off the event loop.
+
+Tool handlers are synchronous (teradatasql / SQLAlchemy). Running them directly
+inside FastMCP's async handlers stalls every other session on the HTTP
+transports, so the MCP wrappers hand them to a dedicated worker pool instead:
+
+- a bounded ThreadPoolExecutor sized to the connection pool capacity,
+- a per-tool asyncio.Semaphore so one slow tool cannot occupy every worker,
+- cancellation: when the MCP client aborts a call, queued work is dropped and
+  in-flight requests are cancelled on the database connection.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("teradata_mcp_server")
+
+_current_call: contextvars.ContextVar[Optional["CallHandle"]] = contextvars.ContextVar(
+    "td_current_call", default=None
+)
+
+
+class ToolCancelledError(Exception):
+    """Raised inside a worker when its MCP call was cancelled before it started."""
+    pass
+
+
+class CallHandle:
+    """Cancellation handle for one tool call running on the executor."""
+
+    def __init__(self, tool_name: str):
+        self.tool_name = tool_name
+        self.cancelled = False
+        self._callbacks: list[Callable[[], Any]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def cancellable(self, callback: Callable[[], Any]):
+        """Register ``callback`` to abort the in-flight work while the block runs.
+
+        The callback is removed on exit so that a late cancellation can never
+        reach a pooled connection that has already been handed to another call.
+        """
+        with self._lock:
+            if self.cancelled:
+                raise ToolCancelledError(f"Tool '{self.tool_name}' was cancelled")
+            self._callbacks.append(callback)
+        try:
+            yield
+        finally:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+    def cancel(self):
+        """Mark the call cancelled and fire any registered callbacks."""
+        with self._lock:
+            self.cancelled = True
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"Cancel callback failed for tool '{self.tool_name}': {e}")
+
+
+def current_call() -> Optional[CallHandle]:
+    """Return the CallHandle of the tool call running in this worker, if any."""
+    return _current_call.get()
+
+
+def parse_concurrency_limits(spec: str | None) -> dict[str, int]:
+    """Parse 'tool_a=2,tool_b=4' into {'tool_a': 2, 'tool_b': 4}."""
+    limits: dict[str, int] = {}
+    if not spec:
+        return limits
+    for item in spec.split(","):
+        name, sep, value = item.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            continue
+        try:
+            limits[name] = max(1, int(value.strip()))
+        except ValueError:
+            logger.warning(f"Ignoring invalid tool concurrency limit: {item.strip()}")
+    return limits
+
+
+class DBExecutor:
+    """Runs blocking tool calls on a bounded worker pool with per-tool limits."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        tool_concurrency: int = 0,
+        tool_limits: dict[str, int] | None = None,
+    ):
+        self.max_workers = max(1, max_workers)
+        # Default per-tool cap keeps headroom for other tools when one is slow
+        self.tool_concurrency = tool_concurrency if tool_concurrency > 0 else max(1, self.max_workers // 2)
+        self.tool_limits = dict(tool_limits or {})
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="td-db")
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._waiting: dict[str, int] = {}
+        self._running: dict[str, int] = {}
+        self._cancelled = 0
+
+    def _semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(tool_name)
+        if sem is None:
+            sem = asyncio.Semaphore(self.tool_limits.get(tool_name, self.tool_concurrency))
+            self._semaphores[tool_name] = sem
+        return sem
+
+    async def run(self, tool_name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` on a worker thread and await its result.
+
+        The caller's context variables (FastMCP context, request state) are
+        copied into the worker. If the awaiting task is cancelled, the call is
+        cancelled too and CancelledError is re-raised.
+        """
+        loop = asyncio.get_running_loop()
+        handle = CallHandle(tool_name)
+
+        def _invoke():
+            if handle.cancelled:
+                raise ToolCancelledError(f"Tool '{tool_name}' was cancelled")
+            _current_call.set(handle)
+            return func(*args, **kwargs)
+
+        sem = self._semaphore(tool_name)
+        self._waiting[tool_name] = self._waiting.get(tool_name, 0) + 1
+        try:
+            await sem.acquire()
+        finally:
+            self._waiting[tool_name] -= 1
+        self._running[tool_name] = self._running.get(tool_name, 0) + 1
+        release_now = True
+        ctx = contextvars.copy_context()
+        cf = self._pool.submit(functools.partial(ctx.run, _invoke))
+        try:
+            return await asyncio.wrap_future(cf)
+        except asyncio.CancelledError:
+            self._cancelled += 1
+            handle.cancel()
+            logger.info(f"Tool call '{tool_name}' cancelled by client")
+            # A worker that already started keeps its slot until the database returns
+            if not cf.cancel() and not cf.done():
+                release_now = False
+                cf.add_done_callback(lambda _: self._release_threadsafe(loop, tool_name, sem))
+            raise
+        finally:
+            if release_now:
+                self._release(tool_name, sem)
+
+    def _release(self, tool_name: str, sem: asyncio.Semaphore):
+        self._running[tool_name] -= 1
+        sem.release()
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop, tool_name: str, sem: asyncio.Semaphore):
+        try:
+            loop.call_soon_threadsafe(self._release, tool_name, sem)
+        except RuntimeError:
+            # Event loop already closed (shutdown), nothing left to release
+            pass
+
+    def get_stats(self) -> dict:
+        """Get executor statistics."""
+        return {
+            "max_workers": self.max_workers,
+            "default_tool_concurrency": self.tool_concurrency,
+            "tool_limits": dict(self.tool_limits),
+            "running": {k: v for k, v in self._running.items() if v},
+            "waiting": {k: v for k, v in self._waiting.items() if v},
+            "cancelled_calls": self._cancelled,
+        }
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting work and release worker threads."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
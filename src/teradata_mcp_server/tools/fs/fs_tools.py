@@ -2,14 +2,12 @@ import logging
 from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
 
-# Suppress stdout/stderr during tdfs4ds import to prevent contamination of MCP JSON protocol
-stdout_buffer = StringIO()
-stderr_buffer = StringIO()
-with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-    import tdfs4ds
 from teradatasql import TeradataConnection
 
-from teradata_mcp_server.tools.utils import create_response, rows_to_json
+from teradata_mcp_server.tools.utils import create_response, lazy_import, rows_to_json
+
+# tdfs4ds is imported on first use; its output is suppressed to keep the MCP JSON protocol clean
+tdfs4ds = lazy_import("tdfs4ds", quiet=True)
 
 logger = logging.getLogger("teradata_mcp_server")
 
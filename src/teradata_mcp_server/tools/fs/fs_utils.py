@@ -1,16 +1,13 @@
 import logging
-from contextlib import redirect_stderr, redirect_stdout
-from io import StringIO
 
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
 
-# Suppress stdout/stderr during tdfs4ds import to prevent contamination of MCP JSON protocol
-stdout_buffer = StringIO()
-stderr_buffer = StringIO()
-with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-    import tdfs4ds
+from teradata_mcp_server.tools.utils import lazy_import
+
+# tdfs4ds is imported on first use; its output is suppressed to keep the MCP JSON protocol clean
+tdfs4ds = lazy_import("tdfs4ds", quiet=True)
 
 logger = logging.getLogger("teradata_mcp_server")
 
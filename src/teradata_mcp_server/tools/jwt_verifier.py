@@ -0,0 +1,249 @@
+"""
+Local verification of Bearer JWTs against a cached JWKS.
+
+By default a Bearer token is validated by logging on to Teradata with
+LOGMECH=JWT, a full database logon per new token. With AUTH_JWT_VERIFY=local
+the server verifies the token itself: signature (key chosen by the token's
+``kid`` from a JWKS, and only with an algorithm of that key's type),
+``exp``/``nbf``, issuer and audience. Local mode is only
+enabled when both the issuer and the audience are configured, so a token minted
+by the same IdP for another application is not accepted. The principal is
+taken from a claim (``sub`` by default), which must be a valid database
+username since it is used to proxy the database session.
+
+The JWKS is read from a local file or an http(s) URL and cached. It is
+re-read after ``refresh_interval`` seconds, and immediately (at most once per
+``min_refresh_interval``) when a token names an unknown ``kid``, so signing
+key rotation is picked up without a restart. A failed refresh keeps the
+previous keys.
+
+Requires PyJWT with crypto support (``pip install teradata-mcp-server[jwt]``).
+"""
+
+import json
+import logging
+import threading
+import time
+import urllib.request
+from typing import Any, Optional
+
+try:
+    import jwt
+except ImportError:  # optional dependency
+    jwt = None
+
+logger = logging.getLogger("teradata_mcp_server")
+
+JWT_VERIFY_MODES = ("database", "local")
+
+# Algorithms a key may sign with when its JWK does not name one ("alg")
+_KTY_ALGORITHMS = {
+    "RSA": frozenset({"RS256", "RS384", "RS512", "PS256", "PS384", "PS512"}),
+    "OKP": frozenset({"EdDSA"}),
+}
+
+
+class JWTVerificationError(Exception):
+    """The token is invalid (signature, expiry, issuer, audience or claims)."""
+    pass
+
+
+class JWTKeyUnavailableError(JWTVerificationError):
+    """The token cannot be checked locally: no JWKS or no key for its ``kid``."""
+    pass
+
+
+class JWKSCache:
+    """Thread-safe cache of the signing keys of a JWKS file or URL, keyed by ``kid``."""
+
+    def __init__(self, source: str, refresh_interval: int = 3600, min_refresh_interval: int = 60, timeout: float = 10.0):
+        if jwt is None:
+            raise ImportError("Local JWT verification requires PyJWT: pip install teradata-mcp-server[jwt]")
+        self.source = source
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._keys: dict[str, tuple[Any, frozenset[str]]] = {}
+        self._loaded_at = 0.0
+        self._attempted_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshes = 0
+        self._refresh_errors = 0
+
+    def _fetch(self) -> dict:
+        if self.source.startswith(("http://", "https://")):
+            with urllib.request.urlopen(self.source, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        with open(self.source, encoding="utf-8") as f:
+            return json.load(f)
+
+    def refresh(self, force: bool = False) -> bool:
+        """Reload the JWKS; without ``force`` at most once per ``min_refresh_interval``."""
+        with self._lock:
+            now = time.time()
+            if not force and now - self._attempted_at < self.min_refresh_interval:
+                return False
+            self._attempted_at = now
+            try:
+                keys = {}
+                for jwk in self._fetch().get("keys", []):
+                    # Keys without a kid can never be selected by a token
+                    if jwk.get("use", "sig") != "sig" or not jwk.get("kid"):
+                        continue
+                    try:
+                        key = jwt.PyJWK(jwk)
+                        keys[jwk.get("kid")] = (key, _key_algorithms(jwk, key))
+                    except Exception as e:
+                        logger.warning(f"Skipping unusable JWKS key {jwk.get('kid')!r}: {e}")
+                self._keys = keys
+                self._loaded_at = now
+                self._refreshes += 1
+                logger.debug(f"Loaded {len(keys)} JWT signing keys from {self.source}")
+                return True
+            except Exception as e:
+                self._refresh_errors += 1
+                logger.warning(f"Could not load JWKS from {self.source}: {e}")
+                return False
+
+    def get_key(self, kid: str) -> tuple[Any, frozenset[str]]:
+        """Return the PyJWK for ``kid`` and the algorithms it may be used with,
+        refreshing when stale or when ``kid`` is unknown."""
+        if time.time() - self._loaded_at >= self.refresh_interval:
+            self.refresh(force=self._loaded_at == 0.0)
+        key = self._keys.get(kid)
+        if key is None and self.refresh():
+            key = self._keys.get(kid)
+        if key is None:
+            raise JWTKeyUnavailableError(f"No JWKS signing key for kid {kid!r}")
+        return key
+
+    def get_stats(self) -> dict:
+        return {
+            "source": self.source,
+            "keys": len(self._keys),
+            "loaded_age_seconds": round(time.time() - self._loaded_at) if self._loaded_at else None,
+            "refreshes": self._refreshes,
+            "refresh_errors": self._refresh_errors,
+        }
+
+
+class JWTVerifier:
+    """Verifies Bearer JWTs locally and returns the principal claim."""
+
+    def __init__(
+        self,
+        jwks: JWKSCache,
+        issuer: str,
+        audience: list[str],
+        algorithms: Optional[list[str]] = None,
+        principal_claim: str = "sub",
+        leeway: int = 30,
+    ):
+        self.jwks = jwks
+        self.issuer = issuer
+        self.audience = audience
+        self.algorithms = algorithms or ["RS256", "ES256"]
+        self.principal_claim = principal_claim
+        self.leeway = leeway
+        self._verified = 0
+        self._rejected = 0
+        self._unavailable = 0
+
+    def verify(self, token: str) -> str:
+        """Return the principal of a valid token.
+
+        Raises JWTKeyUnavailableError when the token cannot be checked locally
+        and JWTVerificationError when it is invalid.
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+            if header.get("alg") not in self.algorithms:
+                raise JWTVerificationError(f"JWT algorithm {header.get('alg')!r} is not allowed")
+            if not header.get("kid"):
+                raise JWTKeyUnavailableError("JWT has no 'kid' header")
+            key, key_algorithms = self.jwks.get_key(header["kid"])
+            # Verify with the token's algorithm only, and only if it fits the key
+            if header["alg"] not in key_algorithms:
+                raise JWTVerificationError(
+                    f"JWT algorithm {header['alg']!r} does not match key {header['kid']!r}"
+                )
+            claims = jwt.decode(
+                token,
+                key.key,
+                algorithms=[header["alg"]],
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.leeway,
+                options={"require": ["exp", "iss", "aud"]},
+            )
+        except JWTKeyUnavailableError:
+            self._unavailable += 1
+            raise
+        except JWTVerificationError:
+            self._rejected += 1
+            raise
+        except jwt.PyJWTError as e:
+            self._rejected += 1
+            raise JWTVerificationError(str(e)) from e
+
+        principal = claims.get(self.principal_claim)
+        if not isinstance(principal, str) or not principal:
+            self._rejected += 1
+            raise JWTVerificationError(f"JWT has no '{self.principal_claim}' claim")
+        self._verified += 1
+        return principal
+
+    def get_stats(self) -> dict:
+        return {
+            "verified": self._verified,
+            "rejected": self._rejected,
+            "key_unavailable": self._unavailable,
+            "jwks": self.jwks.get_stats(),
+        }
+
+
+def _key_algorithms(jwk: dict, key: Any) -> frozenset[str]:
+    """Algorithms a JWK may verify: the one it declares, else those of its key type.
+
+    EC keys are tied to the algorithm of their curve; symmetric ("oct") keys are
+    never accepted, since a JWKS is public.
+    """
+    if jwk.get("kty") == "oct":
+        return frozenset()
+    if jwk.get("alg") or jwk.get("kty") == "EC":
+        return frozenset({key.algorithm_name})
+    return _KTY_ALGORITHMS.get(jwk.get("kty"), frozenset())
+
+
+def _split_csv(value: Optional[str]) -> list[str]:
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+def build_jwt_verifier(settings: Any) -> Optional[JWTVerifier]:
+    """Create the JWTVerifier configured by ``settings``, or None for database verification."""
+    mode = (settings.auth_jwt_verify or "database").lower()
+    if mode not in JWT_VERIFY_MODES:
+        logger.warning(f"Unknown AUTH_JWT_VERIFY '{mode}', verifying JWTs with the database")
+    if mode != "local":
+        return None
+    audience = _split_csv(settings.auth_jwt_audience)
+    if not settings.auth_jwt_jwks or not settings.auth_jwt_issuer or not audience:
+        logger.error(
+            "AUTH_JWT_VERIFY=local requires AUTH_JWT_JWKS, AUTH_JWT_ISSUER and AUTH_JWT_AUDIENCE; "
+            "verifying JWTs with the database"
+        )
+        return None
+    try:
+        jwks = JWKSCache(settings.auth_jwt_jwks, refresh_interval=settings.auth_jwt_jwks_refresh)
+    except ImportError as e:
+        logger.error(f"{e}; verifying JWTs with the database")
+        return None
+    jwks.refresh(force=True)
+    logger.info(f"Local JWT verification enabled with JWKS {settings.auth_jwt_jwks}")
+    return JWTVerifier(
+        jwks,
+        issuer=settings.auth_jwt_issuer,
+        audience=audience,
+        algorithms=_split_csv(settings.auth_jwt_algorithms),
+        principal_claim=settings.auth_jwt_principal_claim,
+    )
@@ -5,9 +5,11 @@ Module loader for lazy loading of tool modules based on profile requirements.
 import importlib
 import inspect
 import logging
-import re
+import time
 from typing import Any, Dict, List, Optional
 
+from teradata_mcp_server.utils import ProfileMatcher
+
 logger = logging.getLogger("teradata_mcp_server.module_loader")
 
 
@@ -34,6 +36,9 @@ class ModuleLoader:
         self._loaded_modules: dict[str, Any] = {}
         self._failed_modules: set = set()  # Track modules that failed to load
         self._required_modules: set = set()
+        self._functions: dict[str, Any] | None = None  # registry, rebuilt when a module loads
+        self._duplicates: dict[str, list[str]] = {}
+        self._import_ms: dict[str, float] = {}
 
     def determine_required_modules(self, config: dict) -> list[str]:
         """
@@ -52,20 +57,19 @@ class ModuleLoader:
         required_modules.add('td_connect')
         required_modules.add('base')  # Always load base tools for custom queries
 
-        # Check each tool pattern against module prefixes
-        for pattern in tool_patterns:
-            for prefix, module_path in self.MODULE_MAP.items():
-                # Create a test tool name to see if pattern matches
-                test_name = f"{prefix}_test"
-                if re.match(pattern, test_name):
-                    required_modules.add(prefix)
-                    logger.info(f"Pattern '{pattern}' matches module '{prefix}'")
+        # Check the tool patterns against module prefixes with a test tool name
+        matcher = ProfileMatcher(tool_patterns)
+        for prefix in self.MODULE_MAP:
+            if matcher(f"{prefix}_test"):
+                required_modules.add(prefix)
+                logger.info(f"Tool patterns match module '{prefix}'")
 
         # Add EVS connection if EVS tools are needed
         if 'evs' in required_modules:
             required_modules.add('evs_connect')
 
         self._required_modules = required_modules
+        self._functions = None
         return list(required_modules)
 
     def load_module(self, module_name: str) -> Any | None:
@@ -88,20 +92,29 @@ class ModuleLoader:
         try:
             if module_name in self.MODULE_MAP:
                 module_path = self.MODULE_MAP[module_name]
+                start = time.perf_counter()
                 module = importlib.import_module(module_path)
+                self._import_ms[module_name] = (time.perf_counter() - start) * 1000
                 self._loaded_modules[module_name] = module
+                self._functions = None
                 logger.info(f"Loaded module: {module_path}")
                 return module
             elif module_name == 'td_connect':
                 # Use absolute import to avoid circular dependency
+                start = time.perf_counter()
                 td_connect = importlib.import_module('teradata_mcp_server.tools.td_connect')
+                self._import_ms['td_connect'] = (time.perf_counter() - start) * 1000
                 self._loaded_modules['td_connect'] = td_connect
+                self._functions = None
                 logger.info("Loaded td_connect module")
                 return td_connect
             elif module_name == 'evs_connect':
                 # Use absolute import to avoid circular dependency
+                start = time.perf_counter()
                 evs_connect = importlib.import_module('teradata_mcp_server.tools.evs_connect')
+                self._import_ms['evs_connect'] = (time.perf_counter() - start) * 1000
                 self._loaded_modules['evs_connect'] = evs_connect
+                self._functions = None
                 logger.info("Loaded evs_connect module")
                 return evs_connect
             else:
@@ -128,28 +141,58 @@ class ModuleLoader:
                 logger.error(f"Failed to load module {module_name}: {e}")
             return None
 
+    def _load_order(self) -> list[str]:
+        """Required modules in a fixed order: connections first, then MODULE_MAP order."""
+        order = [name for name in ('td_connect', 'evs_connect') if name in self._required_modules]
+        order += [name for name in self.MODULE_MAP if name in self._required_modules]
+        return order
+
     def get_all_functions(self) -> dict[str, Any]:
         """
         Get all functions from loaded modules in the same format as the original td import.
-        
+
+        The registry is built once (and again only after another module loads).
+        Modules are scanned in a fixed order; when two modules define different
+        objects under the same name, the first one is kept and the name is
+        reported by get_duplicates().
+
         Returns:
             Dictionary mapping function names to function objects
         """
-        all_functions = {}
+        if self._functions is not None:
+            return self._functions
+
+        all_functions: dict[str, Any] = {}
+        duplicates: dict[str, list[str]] = {}
 
         # Load required modules
-        for module_name in self._required_modules:
+        for module_name in self._load_order():
             module = self.load_module(module_name)
-            if module:
-                # Get all functions from the module
-                for name, func in inspect.getmembers(module, inspect.isfunction):
-                    all_functions[name] = func
+            if not module:
+                continue
+            # Functions, plus any classes (like TDConn)
+            for name, obj in inspect.getmembers(module, lambda m: inspect.isfunction(m) or inspect.isclass(m)):
+                existing = all_functions.get(name)
+                if existing is None:
+                    all_functions[name] = obj
+                elif existing is not obj and name.startswith(('handle_', 'util_')):
+                    duplicates.setdefault(name, [getattr(existing, '__module__', '?')]).append(
+                        getattr(obj, '__module__', '?'))
+
+        for name, modules in duplicates.items():
+            logger.warning(f"Duplicate handler '{name}' defined in {', '.join(modules)}; using {modules[0]}")
+        self._functions = all_functions
+        self._duplicates = duplicates
+        return all_functions
 
-                # Also get any classes (like TDConn)
-                for name, cls in inspect.getmembers(module, inspect.isclass):
-                    all_functions[name] = cls
+    def get_duplicates(self) -> dict[str, list[str]]:
+        """Handler names defined by more than one module, with the defining modules (first one wins)."""
+        self.get_all_functions()
+        return dict(self._duplicates)
 
-        return all_functions
+    def get_import_times(self) -> dict[str, float]:
+        """Import time in ms of each loaded module, slowest first."""
+        return {name: round(ms, 1) for name, ms in sorted(self._import_ms.items(), key=lambda item: -item[1])}
 
     def get_required_yaml_paths(self) -> list:
         """
@@ -0,0 +1,143 @@
+"""
+Connection pool warm-up and background health checks.
+
+Logons to Teradata are expensive (hundreds of milliseconds with LDAP), and the
+SQLAlchemy pool opens sessions lazily, so the first tool calls after a start or
+a reconnect would each pay that latency. ``warm_up_pool`` opens the sessions in
+parallel up front, and ``PoolMaintainer`` periodically pings idle sessions so
+dead or expired ones are replaced before a tool call checks them out.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from sqlalchemy.engine import Engine
+
+from .utils.queryband import SessionQueryBandCache
+
+logger = logging.getLogger("teradata_mcp_server")
+
+PING_SQL = "SELECT 1"
+
+
+def _execute(pooled_conn, sql: str):
+    cursor = pooled_conn.cursor()
+    try:
+        cursor.execute(sql)
+    finally:
+        cursor.close()
+
+
+def warm_up_pool(engine: Engine, sessions: int, query_band: str | None = None) -> dict:
+    """Open ``sessions`` pooled sessions in parallel and return them to the pool.
+
+    If ``query_band`` is given it is set on each session (FOR SESSION) and
+    recorded so the per-call QueryBand logic knows what the session carries.
+    Returns the number of sessions opened, failures and elapsed milliseconds.
+    """
+    start = time.perf_counter()
+    opened, errors = [], []
+
+    def _open():
+        pooled_conn = engine.raw_connection()
+        try:
+            if query_band:
+                _execute(pooled_conn, f"SET QUERY_BAND = '{query_band}' FOR SESSION")
+                pooled_conn.info[SessionQueryBandCache.INFO_KEY] = query_band
+        except Exception:
+            pooled_conn.close()
+            raise
+        return pooled_conn
+
+    with ThreadPoolExecutor(max_workers=max(1, sessions), thread_name_prefix="td-warmup") as pool:
+        futures = [pool.submit(_open) for _ in range(sessions)]
+        for future in futures:
+            try:
+                opened.append(future.result())
+            except Exception as e:
+                errors.append(str(e))
+
+    # Hold every session until all are open so each worker got a distinct one
+    for pooled_conn in opened:
+        pooled_conn.close()
+
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+    if errors:
+        logger.warning(f"Connection pool warm-up: {len(errors)} of {sessions} sessions failed: {errors[0]}")
+    return {"sessions": len(opened), "failed": len(errors), "elapsed_ms": elapsed_ms}
+
+
+class PoolMaintainer:
+    """Background thread that pre-pings idle pooled sessions.
+
+    Each pass checks out every idle session once (the pool hands them out in
+    FIFO order), which also applies ``pool_recycle`` to sessions that are too
+    old. Sessions that fail the ping are invalidated and replaced.
+    """
+
+    def __init__(self, tdconn_supplier: Callable[[], Any], interval: int):
+        self.tdconn_supplier = tdconn_supplier
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._passes = 0
+        self._pinged = 0
+        self._replaced = 0
+        self._last_pass_ms: float | None = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="td-pool-maintainer", daemon=True)
+        self._thread.start()
+        logger.info(f"Connection pool health checks every {self.interval}s")
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning(f"Connection pool health check failed: {e}")
+
+    def run_once(self):
+        """Ping each idle session of the shared pool once."""
+        start = time.perf_counter()
+        tdconn = self.tdconn_supplier()
+        engine = getattr(tdconn, "engine", None)
+        if engine is not None:
+            idle = engine.pool.checkedin() if hasattr(engine.pool, "checkedin") else 0
+            for _ in range(idle):
+                self._ping(engine)
+        self._passes += 1
+        self._last_pass_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    def _ping(self, engine: Engine):
+        pooled_conn = engine.raw_connection()
+        try:
+            _execute(pooled_conn, PING_SQL)
+            self._pinged += 1
+        except Exception as e:
+            logger.info(f"Replacing dead pooled session: {e}")
+            pooled_conn.invalidate()
+            self._replaced += 1
+            pooled_conn.close()
+            # Open the replacement now rather than on the next tool call
+            engine.raw_connection().close()
+            return
+        pooled_conn.close()
+
+    def get_stats(self) -> dict:
+        """Get health check statistics."""
+        return {
+            "interval_seconds": self.interval,
+            "passes": self._passes,
+            "sessions_pinged": self._pinged,
+            "sessions_replaced": self._replaced,
+            "last_pass_ms": self._last_pass_ms,
+        }
@@ -0,0 +1,276 @@
+"""
+Per-principal connection pools for proxied (AUTH_MODE=basic) sessions.
+
+Each authenticated principal gets a small QueuePool of service-account sessions
+that are bound to that principal at logon with a PROXYUSER QueryBand, so one
+noisy user exhausts only their own pool. The per-call QueryBand (tool, MCP
+session, ...) is still set when it differs from the one a session carries.
+
+Physical sessions across all pools are capped: a slot is taken before each
+logon and given back when the session is closed, invalidated or its pool
+disposed. When the cap is reached, least recently used idle pools are disposed
+to make room. Pools idle for longer than ``idle_timeout`` are disposed by a
+background reaper.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from .utils.queryband import SessionQueryBandCache, sanitize_qb_value
+
+logger = logging.getLogger("teradata_mcp_server")
+
+# Connection-record ``info`` key marking a session bound to a principal at logon
+PRINCIPAL_INFO_KEY = "td_principal"
+
+
+class SessionLimitError(Exception):
+    """Raised when the global session cap is reached and no slot frees up in time."""
+    pass
+
+
+class _SessionSlots:
+    """Counts open physical sessions against a cap."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.open = 0
+        self._cond = threading.Condition()
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if self.open >= self.limit:
+                return False
+            self.open += 1
+            return True
+
+    def acquire(self, timeout: float) -> bool:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.open < self.limit, timeout=timeout):
+                return False
+            self.open += 1
+            return True
+
+    def release(self):
+        with self._cond:
+            self.open = max(0, self.open - 1)
+            self._cond.notify()
+
+
+@dataclass
+class PrincipalPool:
+    """A principal's engine plus bookkeeping."""
+    principal: str
+    engine: Engine
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    in_use: int = 0
+    total_checkouts: int = 0
+
+
+class PrincipalPoolManager:
+    """LRU registry of per-principal engines with a global session cap."""
+
+    def __init__(
+        self,
+        sqlalchemy_url: str,
+        pool_size: int = 2,
+        max_overflow: int = 2,
+        pool_timeout: int = 30,
+        max_pools: int = 50,
+        idle_timeout: int = 600,
+        max_total_sessions: int = 15,
+    ):
+        self._url = sqlalchemy_url
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.max_pools = max(1, max_pools)
+        self.idle_timeout = idle_timeout
+        self.max_total_sessions = max(1, max_total_sessions)
+        self._pools: "OrderedDict[str, PrincipalPool]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._session_slots = _SessionSlots(self.max_total_sessions)
+        self._evictions = 0
+        self._slot_timeouts = 0
+        self._stop = threading.Event()
+        self._reaper: threading.Thread | None = None
+
+    def _create_engine(self, principal: str) -> Engine:
+        engine = create_engine(
+            self._url,
+            poolclass=QueuePool,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+        )
+        proxy_band = f"PROXYUSER={sanitize_qb_value(principal)};"
+
+        @event.listens_for(engine, "do_connect")
+        def _take_slot(dialect, connection_record, cargs, cparams):
+            # Every physical session counts against the cap, idle ones included
+            self._acquire_slot(principal)
+            try:
+                return dialect.connect(*cargs, **cparams)
+            except BaseException:
+                self._session_slots.release()
+                raise
+
+        @event.listens_for(engine, "connect")
+        def _bind_principal(dbapi_conn, connection_record):
+            # The session is bound to the principal at logon, before any tool call
+            try:
+                cursor = dbapi_conn.cursor()
+                try:
+                    cursor.execute(f"SET QUERY_BAND = '{proxy_band}' FOR SESSION")
+                finally:
+                    cursor.close()
+            except BaseException:
+                # The pool never sees this session, so close it and give its slot back here
+                dbapi_conn.close()
+                self._session_slots.release()
+                raise
+            connection_record.info[SessionQueryBandCache.INFO_KEY] = proxy_band
+            connection_record.info[PRINCIPAL_INFO_KEY] = principal
+
+        @event.listens_for(engine, "close")
+        def _release_slot(dbapi_conn, connection_record):
+            self._session_slots.release()
+
+        @event.listens_for(engine, "close_detached")
+        def _release_detached_slot(dbapi_conn):
+            self._session_slots.release()
+
+        return engine
+
+    def _acquire_slot(self, principal: str):
+        """Take a session slot, disposing idle pools of other principals when the cap is reached."""
+        if self._session_slots.try_acquire():
+            return
+        self._evict_lru_idle(1, exclude=principal)
+        if not self._session_slots.acquire(timeout=self.pool_timeout):
+            with self._lock:
+                self._slot_timeouts += 1
+            raise SessionLimitError(
+                f"All {self.max_total_sessions} database sessions are open and busy; try again later"
+            )
+
+    def _get_or_create(self, principal: str) -> PrincipalPool:
+        pool = self._pools.get(principal)
+        if pool is not None:
+            self._pools.move_to_end(principal)
+            return pool
+        if len(self._pools) >= self.max_pools:
+            self._evict_lru_idle(len(self._pools) - self.max_pools + 1)
+        pool = PrincipalPool(principal=principal, engine=self._create_engine(principal))
+        self._pools[principal] = pool
+        logger.info(f"Created connection pool for principal {principal} ({len(self._pools)} pools)")
+        return pool
+
+    @contextmanager
+    def lease(self, principal: str):
+        """Yield the principal's engine.
+
+        The principal's own QueuePool bounds how many sessions it can use, and
+        the session slots, taken at logon, bound the open sessions across principals.
+        """
+        with self._lock:
+            pool = self._get_or_create(principal)
+            pool.in_use += 1
+            pool.total_checkouts += 1
+        try:
+            yield pool.engine
+        finally:
+            with self._lock:
+                pool.in_use -= 1
+                pool.last_used = time.time()
+
+    def _evict_lru_idle(self, count: int, exclude: str | None = None) -> int:
+        """Dispose up to ``count`` least recently used pools with no session in use."""
+        evicted = 0
+        with self._lock:
+            for principal in list(self._pools.keys()):
+                if evicted >= count:
+                    break
+                pool = self._pools[principal]
+                if pool.in_use == 0 and principal != exclude:
+                    self._dispose(principal)
+                    evicted += 1
+        if evicted < count:
+            logger.warning("No idle principal pool to evict; all pools are busy")
+        return evicted
+
+    def _dispose(self, principal: str):
+        pool = self._pools.pop(principal)
+        try:
+            pool.engine.dispose()
+        except Exception as e:
+            logger.debug(f"Error disposing pool for principal {principal}: {e}")
+        self._evictions += 1
+        logger.info(f"Evicted connection pool for principal {principal}")
+
+    def evict_idle(self) -> int:
+        """Dispose pools that have been idle longer than idle_timeout."""
+        cutoff = time.time() - self.idle_timeout
+        evicted = 0
+        with self._lock:
+            for principal in list(self._pools.keys()):
+                pool = self._pools[principal]
+                if pool.in_use == 0 and pool.last_used < cutoff:
+                    self._dispose(principal)
+                    evicted += 1
+        return evicted
+
+    def start_reaper(self, interval: int):
+        """Dispose pools idle longer than idle_timeout every ``interval`` seconds on a daemon thread."""
+        if self._reaper is not None or interval <= 0 or self.idle_timeout <= 0:
+            return
+        self._reaper = threading.Thread(target=self._reap, args=(interval,), name="td-principal-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reap(self, interval: int):
+        while not self._stop.wait(interval):
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Principal pool eviction failed: {e}")
+
+    def dispose_all(self):
+        """Stop the reaper and dispose every principal pool."""
+        self._stop.set()
+        with self._lock:
+            for principal in list(self._pools.keys()):
+                self._dispose(principal)
+
+    def get_stats(self) -> dict:
+        """Get pool occupancy per principal and global counters."""
+        now = time.time()
+        with self._lock:
+            principals = {}
+            for principal, pool in self._pools.items():
+                qp = pool.engine.pool
+                principals[principal] = {
+                    "in_use": pool.in_use,
+                    "checked_out": qp.checkedout() if hasattr(qp, "checkedout") else None,
+                    "checked_in": qp.checkedin() if hasattr(qp, "checkedin") else None,
+                    "total_checkouts": pool.total_checkouts,
+                    "idle_seconds": round(now - pool.last_used, 1),
+                }
+            return {
+                "pools": len(self._pools),
+                "max_pools": self.max_pools,
+                "sessions_in_use": sum(p.in_use for p in self._pools.values()),
+                "sessions_open": self._session_slots.open,
+                "max_total_sessions": self.max_total_sessions,
+                "evictions": self._evictions,
+                "slot_timeouts": self._slot_timeouts,
+                "principals": principals,
+            }
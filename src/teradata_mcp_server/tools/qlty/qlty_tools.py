@@ -2,6 +2,7 @@ import logging
 
 from teradatasql import TeradataConnection
 
+from teradata_mcp_server.tools.resilience import idempotent
 from teradata_mcp_server.tools.utils import create_response, rows_to_json
 
 logger = logging.getLogger("teradata_mcp_server")
@@ -9,6 +10,7 @@ logger = logging.getLogger("teradata_mcp_server")
 #------------------ Tool  ------------------#
 # Missing Values tool
 
+@idempotent
 def handle_qlty_missingValues(conn: TeradataConnection, database_name: str | None, table_name: str, *args, **kwargs):
     """
     Get the column names that having missing values in a table.
@@ -39,6 +41,7 @@ def handle_qlty_missingValues(conn: TeradataConnection, database_name: str | Non
 #------------------ Tool  ------------------#
 # negative values tool
 
+@idempotent
 def handle_qlty_negativeValues(conn: TeradataConnection, database_name: str | None, table_name: str, *args, **kwargs):
     """
     Get the column names that having negative values in a table.
@@ -69,6 +72,7 @@ def handle_qlty_negativeValues(conn: TeradataConnection, database_name: str | No
 #------------------ Tool  ------------------#
 # distinct categories tool
 
+@idempotent
 def handle_qlty_distinctCategories(
     conn: TeradataConnection,
     database_name: str | None,
@@ -107,6 +111,7 @@ def handle_qlty_distinctCategories(
 
 #------------------ Tool  ------------------#
 # standard deviation tool
+@idempotent
 def handle_qlty_standardDeviation(
     conn: TeradataConnection,
     database_name: str | None,
@@ -149,6 +154,7 @@ def handle_qlty_standardDeviation(
 #------------------ Tool  ------------------#
 # column summary tool
 
+@idempotent
 def handle_qlty_columnSummary(conn: TeradataConnection, database_name: str | None, table_name: str, *args, **kwargs):
     """
     Get the column summary statistics for a table.
@@ -179,6 +185,7 @@ def handle_qlty_columnSummary(conn: TeradataConnection, database_name: str | Non
 
 #------------------ Tool  ------------------#
 # Univariate statistics tool
+@idempotent
 def handle_qlty_univariateStatistics(
     conn: TeradataConnection,
     database_name: str | None,
@@ -219,6 +226,7 @@ def handle_qlty_univariateStatistics(
 
 #------------------ Tool  ------------------#
 # Get Rows with Miissing Values tool
+@idempotent
 def handle_qlty_rowsWithMissingValues(
     conn: TeradataConnection,
     database_name: str | None,
@@ -1,13 +1,11 @@
-import json
 import logging
-from datetime import date, datetime
-from decimal import Decimal
-from typing import Any
 from pathlib import Path
 
 import yaml
 from teradatasql import TeradataConnection
 
+from teradata_mcp_server.tools.utils import create_response, rows_to_json
+
 logger = logging.getLogger("teradata_mcp_server")
 
 # Load RAG configuration
@@ -105,44 +103,6 @@ def build_search_query(vector_db, dst_table, chunk_embed_table, k, config):
         ORDER BY similarity DESC;
         """
 
-def serialize_teradata_types(obj: Any) -> Any:
-    """Convert Teradata-specific types to JSON serializable formats"""
-    if isinstance(obj, date | datetime):
-        return obj.isoformat()
-    if isinstance(obj, Decimal):
-        return float(obj)
-    return str(obj)
-
-def rows_to_json(cursor_description: Any, rows: list[Any]) -> list[dict[str, Any]]:
-    """Convert database rows to JSON objects using column names as keys"""
-    if not cursor_description or not rows:
-        return []
-
-    columns = [col[0] for col in cursor_description]
-    return [
-        {
-            col: serialize_teradata_types(value)
-            for col, value in zip(columns, row)
-        }
-        for row in rows
-    ]
-
-def create_response(data: Any, metadata: dict[str, Any] | None = None) -> str:
-    """Create a standardized JSON response structure"""
-    if metadata:
-        response = {
-            "status": "success",
-            "metadata": metadata,
-            "results": data
-        }
-    else:
-        response = {
-            "status": "success",
-            "results": data
-        }
-
-    return json.dumps(response, default=serialize_teradata_types)
-
 def handle_rag_Execute_Workflow(
     conn: TeradataConnection,
     question: str,
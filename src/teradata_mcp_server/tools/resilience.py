@@ -0,0 +1,217 @@
+"""
+Connection-level error handling for database tool calls.
+
+- classify_error maps teradatasql / SQLAlchemy exceptions to a failure kind
+  (session dropped, database restart, logon failure, no pooled session free,
+  or an ordinary SQL error),
+- ConnectionGuard invalidates only the pooled session a failure came from,
+  decides whether and after what backoff a connection-level failure is retried,
+  and keeps a circuit breaker that fails calls fast while the database is
+  unreachable instead of letting them queue on the pool timeout,
+- idempotent marks the handlers that may be retried; tools are not retried
+  unless marked.
+"""
+
+import logging
+import random
+import re
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from .principal_pools import SessionLimitError
+
+logger = logging.getLogger("teradata_mcp_server")
+
+DISCONNECT = "disconnect"
+RESTART = "restart"
+LOGON = "logon"
+BUSY = "busy"
+OTHER = "other"
+
+# Teradata error codes, as reported by teradatasql ("[Error 2828] ...")
+_RESTART_CODES = {2825, 2826, 2828, 3120}
+_LOGON_CODES = {3055, 8017}
+_ERROR_CODE_RE = re.compile(r"\[Error (\d+)\]")
+_DISCONNECT_RE = re.compile(
+    r"socket|connection (reset|refused|closed|aborted)|broken pipe|"
+    r"session is not (active|logged on)|not connected|failed to connect|unexpected eof",
+    re.IGNORECASE,
+)
+
+def idempotent(func):
+    """Mark a tool handler as safe to re-run after a dropped session (it never writes)."""
+    func.idempotent = True
+    return func
+
+
+def is_idempotent(func) -> bool:
+    """Return True if ``func`` was marked with @idempotent."""
+    return getattr(func, "idempotent", False) is True
+
+
+class CircuitOpenError(Exception):
+    """Raised when calls are rejected because the database is considered down."""
+    pass
+
+
+def classify_error(exc: BaseException) -> str:
+    """Return DISCONNECT, RESTART, LOGON, BUSY or OTHER for an exception raised by a tool call."""
+    # No session could be checked out; the database was never reached
+    if isinstance(exc, (PoolTimeoutError, SessionLimitError)):
+        return BUSY
+    if getattr(exc, "connection_invalidated", False):
+        return DISCONNECT
+    # SQLAlchemy wraps the driver exception in .orig
+    message = f"{exc} {getattr(exc, 'orig', '') or ''}"
+    codes = {int(code) for code in _ERROR_CODE_RE.findall(message)}
+    if codes & _RESTART_CODES:
+        return RESTART
+    if codes & _LOGON_CODES:
+        return LOGON
+    if _DISCONNECT_RE.search(message):
+        return DISCONNECT
+    return OTHER
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open)."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed; in half-open state only one probe is let through."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            now = time.monotonic()
+            if self.state == "open" and now - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._probe_in_flight = False
+            # A probe that never reported back (e.g. cancelled) is replaced after reset_timeout
+            if self.state == "half_open" and (
+                not self._probe_in_flight or now - self._opened_at >= self.reset_timeout
+            ):
+                self._probe_in_flight = True
+                self._opened_at = now
+                return True
+            self._rejected += 1
+            return False
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets a probe through."""
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self):
+        with self._lock:
+            if self.state != "closed":
+                logger.info("Database reachable again, closing circuit breaker")
+            self.state = "closed"
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                if self.state != "open":
+                    self._times_opened += 1
+                    logger.warning(
+                        f"Database unavailable after {self._failures} consecutive failures, "
+                        f"failing calls fast for {self.reset_timeout}s"
+                    )
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "times_opened": self._times_opened,
+                "rejected_calls": self._rejected,
+            }
+
+
+class ConnectionGuard:
+    """Applies invalidation, retry and circuit-breaker policy around tool calls."""
+
+    def __init__(
+        self,
+        retry_attempts: int = 2,
+        retry_backoff: float = 0.5,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        self.retry_attempts = max(0, retry_attempts)
+        self.retry_backoff = retry_backoff
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._invalidated = 0
+        self._retries = 0
+        self._failures: dict[str, int] = {DISCONNECT: 0, RESTART: 0, LOGON: 0, BUSY: 0}
+
+    def before_call(self):
+        """Raise CircuitOpenError if the database is considered down."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"Database unavailable; retry in {self.breaker.retry_after():.0f}s"
+            )
+
+    def on_success(self):
+        self.breaker.record_success()
+
+    def on_failure(self, exc: BaseException, retryable: bool, attempt: int) -> float | None:
+        """Record a failed attempt; return the backoff delay if it should be retried, else None.
+
+        Only connection-level failures of idempotent (``retryable``) tools are retried.
+        """
+        kind = classify_error(exc)
+        if kind == OTHER:
+            # The database answered; an SQL error says nothing about its health
+            self.breaker.record_success()
+            return None
+        self._failures[kind] += 1
+        if kind == BUSY:
+            # Pool or session cap exhaustion says nothing about the database either way
+            return None
+        self.breaker.record_failure()
+        if kind == LOGON or not retryable or attempt >= self.retry_attempts:
+            return None
+        if self.breaker.state == "open":
+            return None
+        self._retries += 1
+        delay = self.retry_backoff * (2 ** attempt)
+        return delay + random.uniform(0, delay / 2)
+
+    def invalidate(self, connection, exc: BaseException) -> bool:
+        """Invalidate ``connection`` if ``exc`` means its session is unusable."""
+        if classify_error(exc) not in (DISCONNECT, RESTART):
+            return False
+        try:
+            connection.invalidate()
+            self._invalidated += 1
+            logger.info(f"Invalidated pooled session after error: {exc}")
+            return True
+        except Exception as e:
+            logger.debug(f"Could not invalidate pooled session: {e}")
+            return False
+
+    def get_stats(self) -> dict:
+        """Get failure, retry and circuit breaker statistics."""
+        return {
+            "circuit_breaker": self.breaker.get_stats(),
+            "failures": dict(self._failures),
+            "retries": self._retries,
+            "invalidated_sessions": self._invalidated,
+        }
@@ -2,12 +2,14 @@ import logging
 
 from teradatasql import TeradataConnection
 
+from teradata_mcp_server.tools.resilience import idempotent
 from teradata_mcp_server.tools.utils import create_response, rows_to_json
 
 logger = logging.getLogger("teradata_mcp_server")
 
 #------------------ Tool  ------------------#
 # get user permissions tool
+@idempotent
 def handle_sec_userDbPermissions(conn: TeradataConnection, user_name: str, *args, **kwargs):
     """
     Get permissions for a user.
@@ -49,6 +51,7 @@ def handle_sec_userDbPermissions(conn: TeradataConnection, user_name: str, *args
 
 #------------------ Tool  ------------------#
 # get role permissions tool
+@idempotent
 def handle_sec_rolePermissions(conn: TeradataConnection, role_name: str, *args, **kwargs):
     """
     Get permissions for a role.
@@ -150,6 +153,7 @@ def handle_sec_rolePermissions(conn: TeradataConnection, role_name: str, *args,
 
 #------------------ Tool  ------------------#
 # get roles that a user belongs to tool
+@idempotent
 def handle_sec_userRoles(conn: TeradataConnection, user_name: str, *args, **kwargs):
     """
     Get roles assigned to a user.
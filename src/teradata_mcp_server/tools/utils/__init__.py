@@ -9,46 +9,106 @@ from __future__ import annotations
 
 import base64
 import hashlib
-import json
-from datetime import date, datetime
-from decimal import Decimal
 from typing import Any, Optional
 
-from .queryband import build_queryband, sanitize_qb_value  # noqa: F401
+from .catalog_delta import SchemaState, SchemaWatermarkStore, get_watermark_store  # noqa: F401
+from .encoder import (  # noqa: F401
+    column_converters,
+    convert_rows,
+    dumps,
+    get_json_backend,
+    serialize_teradata_types,
+    set_json_backend,
+)
+from .lazy_import import LazyModule, get_deferred_imports, lazy_import  # noqa: F401
+from .pagination import (  # noqa: F401
+    NEXT_PAGE_TOOL,
+    PageQuery,
+    PageTokenStore,
+    configure_pagination,
+    get_max_rows,
+    get_page_store,
+    has_order_by,
+    mark_truncated,
+    paged_sql,
+    skip_rows,
+)
+from .prepared import PreparedQuery, get_prepared_stats, prepare_query, render_literal  # noqa: F401
+from .queryband import build_queryband, sanitize_qb_value, SessionQueryBandCache  # noqa: F401
+from .response_format import (  # noqa: F401
+    RESPONSE_FORMATS,
+    JSONText,
+    ResultWriter,
+    get_response_format,
+    normalize_response_format,
+    use_response_format,
+)
+from .sql_metadata import (  # noqa: F401
+    SQL_METADATA_MODES,
+    add_sql_metadata,
+    configure_sql_metadata,
+    get_sql_metadata_mode,
+    normalize_sql_metadata,
+    sql_hash,
+)
+from .sql_validator import (  # noqa: F401
+    SQLAnalysis,
+    SQLValidationError,
+    ValidationCache,
+    ValidationPolicy,
+    analyze_sql,
+    bind_parameters,
+    configure_validation_cache,
+    get_validation_cache,
+    get_validation_policy,
+    set_validation_policy,
+    tokenize,
+    validate_sql,
+)
+from .streaming import iter_batches, stream_response  # noqa: F401
 
 
 # -------------------- Serialization & response helpers -------------------- #
-def serialize_teradata_types(obj: Any) -> Any:
-    """Convert Teradata-specific types to JSON serializable formats."""
-    if isinstance(obj, (date, datetime)):
-        return obj.isoformat()
-    if isinstance(obj, Decimal):
-        return float(obj)
-    return str(obj)
-
-
 def rows_to_json(cursor_description: Any, rows: list[Any]) -> list[dict[str, Any]]:
     """Convert DB rows into JSON objects using column names as keys."""
     if not cursor_description or not rows:
         return []
     columns = [col[0] for col in cursor_description]
-    out: list[dict[str, Any]] = []
-    for row in rows:
-        out.append({col: serialize_teradata_types(val) for col, val in zip(columns, row)})
-    return out
+    converters = column_converters(cursor_description)
+    return [dict(zip(columns, row)) for row in convert_rows(converters, rows)]
 
 
 def create_response(data: Any, metadata: dict[str, Any] | None = None, error: dict[str, Any] | None = None) -> str:
-    """Create a standardized JSON response structure."""
+    """Create a standardized JSON response structure, formatted for the MCP client."""
     if error:
         resp = {"status": "error", "message": error}
         if metadata:
             resp["metadata"] = metadata
-        return json.dumps(resp, default=serialize_teradata_types)
+        return JSONText(dumps(resp, pretty=True))
+    max_rows = get_max_rows()
+    if max_rows and isinstance(data, list) and metadata is not None:
+        # Materialized results cannot be resumed, so they are only capped
+        metadata["truncated"] = len(data) > max_rows
+        if metadata["truncated"]:
+            data = data[:max_rows]
+            if "row_count" in metadata:
+                metadata["row_count"] = max_rows
+            mark_truncated(metadata, None, max_rows)
+    fmt = get_response_format()
+    if fmt != "rows" and isinstance(data, list) and all(isinstance(row, dict) for row in data):
+        # Tabular result in a compact format; empty results take column names from metadata
+        if data:
+            columns = list(data[0].keys())
+        else:
+            columns = [col.get("name") for col in (metadata or {}).get("columns", []) if isinstance(col, dict)]
+        writer = ResultWriter(columns, fmt)
+        for row in data:
+            writer.write([row.get(col) for col in columns])
+        return writer.finish(metadata)
     resp = {"status": "success", "results": data}
     if metadata:
         resp["metadata"] = metadata
-    return json.dumps(resp, default=serialize_teradata_types)
+    return JSONText(dumps(resp, pretty=True))
 
 
 # ------------------------------ Auth helpers ------------------------------ #
@@ -110,133 +170,3 @@ def infer_logmech_from_header(auth_header: Optional[str], default_basic_logmech:
     if scheme == "basic" and value:
         return default_basic_logmech.upper(), value
     return "", ""
-
-
-# ----------------------- SQL Security Validation ----------------------- #
-import logging
-import os
-import re
-
-logger = logging.getLogger("teradata_mcp_server")
-
-
-class SQLValidationError(Exception):
-    """Raised when SQL query fails validation checks"""
-    pass
-
-
-def validate_sql(sql: str) -> None:
-    """
-    Validate SQL query to prevent dangerous operations.
-    
-    This function implements mandatory security validation that cannot be bypassed.
-    All data modification operations are strictly prohibited.
-    
-    Raises:
-        SQLValidationError: If the SQL contains prohibited operations
-    """
-    if not sql or not sql.strip():
-        raise SQLValidationError("Empty SQL query not allowed")
-    
-    # Convert to uppercase for case-insensitive matching and normalize
-    sql_upper = sql.upper().strip()
-    sql_normalized = re.sub(r'\s+', ' ', sql_upper)  # Normalize whitespace
-    
-    # Log all SQL queries for security audit
-    logger.info(f"SQL Security Validation: {sql[:100]}{'...' if len(sql) > 100 else ''}")
-    
-    # Define dangerous operations that must be blocked (NO BYPASS ALLOWED)
-    dangerous_keywords = [
-        'UPDATE', 'DELETE', 'INSERT', 'DROP', 'CREATE', 'ALTER', 'TRUNCATE', 
-        'MERGE', 'REPLACE', 'GRANT', 'REVOKE', 'CALL', 'EXECUTE', 'UPSERT'
-    ]
-    
-    # Enhanced pattern matching to catch all variations
-    for keyword in dangerous_keywords:
-        # Multiple pattern checks to prevent bypass attempts
-        patterns = [
-            rf'^{keyword}\s',                    # At start of query
-            rf';\s*{keyword}\s',                 # After semicolon  
-            rf'^{keyword}$',                     # Standalone keyword
-            rf';\s*{keyword}$',                  # After semicolon at end
-            rf'\s{keyword}\s',                   # Keyword surrounded by spaces
-            rf'^\s*{keyword}\s',                 # Keyword at start with leading spaces
-            rf'\(\s*{keyword}\s',                # Keyword after opening parenthesis
-            rf'\s{keyword}\s*\(',                # Keyword before opening parenthesis
-            rf'/\*.*\*/\s*{keyword}',            # Keyword after comment block
-            rf'{keyword}\s*/\*',                 # Keyword before comment block
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, sql_normalized):
-                logger.error(f"SECURITY VIOLATION: Blocked '{keyword}' operation in SQL: {sql[:50]}...")
-                raise SQLValidationError(f"Operation '{keyword}' is strictly prohibited for security reasons")
-    
-    # Additional security check: scan for potential obfuscation attempts
-    suspicious_patterns = [
-        r'CHAR\(\d+\)',              # CHAR() functions that could build keywords
-        r'CHR\(\d+\)',               # CHR() functions  
-        r'CONCAT\(',                 # String concatenation
-        r'\|\|',                     # String concatenation operator
-        r'EXEC\s*\(',                # Dynamic execution
-        r'EXECUTE\s*\(',             # Dynamic execution
-    ]
-    
-    for pattern in suspicious_patterns:
-        if re.search(pattern, sql_normalized):
-            logger.warning(f"SECURITY WARNING: Suspicious pattern detected: {pattern} in SQL: {sql[:50]}...")
-    
-    # Check for SQL injection patterns
-    injection_patterns = [
-        r'UNION\s+SELECT',           # UNION-based injection
-        r';\s*SELECT',               # Statement stacking
-        r'--\s*',                    # Comment injection
-        r'/\*.*\*/',                 # Block comment injection
-    ]
-    
-    for pattern in injection_patterns:
-        if re.search(pattern, sql_normalized):
-            logger.warning(f"SECURITY WARNING: Potential SQL injection pattern: {pattern} in SQL: {sql[:50]}...")
-    
-    # Block SELECT * without WHERE clause to prevent full table scans
-    # Allow exceptions for system tables and small utility queries
-    if re.search(r'^SELECT\s+\*\s+FROM', sql_normalized):
-        # Check if there's a WHERE clause
-        if not re.search(r'\bWHERE\b', sql_normalized):
-            # Allow exceptions for system catalogs and limited queries
-            system_table_patterns = [
-                r'FROM\s+DBC\.',           # DBC system tables
-                r'FROM\s+INFORMATION_SCHEMA\.',  # Information schema
-                r'TOP\s+\d+',              # Queries with TOP clause
-                r'SAMPLE\s+\d+',           # Queries with SAMPLE clause
-            ]
-            
-            is_system_query = any(re.search(pattern, sql_normalized) for pattern in system_table_patterns)
-            
-            if not is_system_query:
-                raise SQLValidationError(
-                    "SELECT * without WHERE clause is not allowed. "
-                    "Use specific columns or add a WHERE clause to limit results."
-                )
-    
-    # Block potentially dangerous functions
-    dangerous_functions = [
-        'EXEC', 'EXECUTE', 'SP_', 'XP_'  # Stored procedures
-    ]
-    
-    for func in dangerous_functions:
-        if re.search(rf'\b{func}\b', sql_normalized):
-            raise SQLValidationError(f"Function '{func}' is not allowed for security reasons")
-    
-    # Warn about queries that might return large result sets
-    large_result_indicators = [
-        r'SELECT\s+\*.*FROM.*(?!.*LIMIT|.*TOP|.*SAMPLE|.*WHERE)',
-        r'COUNT\(\*\).*FROM.*(?!.*WHERE)',
-    ]
-    
-    for pattern in large_result_indicators:
-        if re.search(pattern, sql_normalized):
-            logger.warning(f"Query may return large result set: {sql[:100]}...")
-    
-    logger.info(f"SQL validation passed for query: {sql[:100]}{'...' if len(sql) > 100 else ''}")
-
@@ -0,0 +1,103 @@
+"""Per-session schema watermarks for incremental table listings.
+
+Agents in long sessions poll the table list of a database to notice schema
+changes. ``base_tableChanges`` keeps, per MCP session and database, the latest
+``LastAlterTimeStamp`` seen and the tables listed so far; later calls only
+read the objects altered since that watermark, plus an object count that
+reveals drops, and return the objects created, altered or dropped.
+
+States expire after a TTL and the least recently used ones are evicted when
+the store is full.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class SchemaState:
+    """What a session has seen of one database.
+
+    - watermark: latest LastAlterTimeStamp returned to the session
+    - tables: table name -> LastAlterTimeStamp as last returned
+    """
+    watermark: Any
+    tables: dict[str, Any]
+    expires_at: float = 0.0
+
+
+class SchemaWatermarkStore:
+    """Bounded, expiring store of per-session schema states."""
+
+    def __init__(self, ttl_seconds: int = 3600, max_states: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_states = max(1, max_states)
+        self._states: "OrderedDict[tuple[str, str], SchemaState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._full = 0
+        self._incremental = 0
+        self._expired = 0
+        self._evicted = 0
+
+    @staticmethod
+    def _key(session_id: str, database_name: str) -> tuple[str, str]:
+        return session_id, database_name.strip().upper()
+
+    def get(self, session_id: str | None, database_name: str) -> SchemaState | None:
+        """Return the live state of a session for a database, else None."""
+        if session_id is None:
+            return None
+        key = self._key(session_id, database_name)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return None
+            if state.expires_at <= time.time():
+                del self._states[key]
+                self._expired += 1
+                return None
+            self._states.move_to_end(key)
+            return state
+
+    def put(self, session_id: str | None, database_name: str, state: SchemaState, incremental: bool):
+        """Store the state a session has now seen; sessions without an id are not tracked."""
+        with self._lock:
+            if incremental:
+                self._incremental += 1
+            else:
+                self._full += 1
+            if session_id is None:
+                return
+            key = self._key(session_id, database_name)
+            state.expires_at = time.time() + self.ttl_seconds
+            self._states.pop(key, None)
+            while len(self._states) >= self.max_states:
+                self._states.popitem(last=False)
+                self._evicted += 1
+            self._states[key] = state
+
+    def get_stats(self) -> dict:
+        """Get watermark store statistics."""
+        with self._lock:
+            return {
+                "sessions": len(self._states),
+                "max_states": self.max_states,
+                "ttl_seconds": self.ttl_seconds,
+                "full_listings": self._full,
+                "incremental_listings": self._incremental,
+                "expired": self._expired,
+                "evicted": self._evicted,
+            }
+
+
+_store = SchemaWatermarkStore()
+
+
+def get_watermark_store() -> SchemaWatermarkStore:
+    """Return the schema watermark store."""
+    return _store
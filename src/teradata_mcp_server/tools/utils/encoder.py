@@ -0,0 +1,118 @@
+"""JSON encoding of Teradata result values.
+
+Result sets are converted column by column: ``column_converters`` looks at the
+Python types reported in ``cursor.description`` once per result set and picks a
+converter for each column, instead of running the generic isinstance chain of
+``serialize_teradata_types`` on every cell. A batch whose column holds only the
+declared type is converted with a single ``map``; values of any other type
+(NULLs, driver surprises) go through the generic path, so the output is the
+same either way.
+
+JSON text is produced by ``dumps``, which uses orjson when it is installed
+(``pip install teradata-mcp-server[json]``) and the standard library otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+logger = logging.getLogger("teradata_mcp_server")
+
+JSON_BACKENDS = ("auto", "json", "orjson")
+
+_backend = "orjson" if orjson is not None else "json"
+
+
+def serialize_teradata_types(obj: Any) -> Any:
+    """Convert Teradata-specific types to JSON serializable formats."""
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return str(obj)
+
+
+# ------------------------- Per-column converters ------------------------- #
+def _column_converter(type_code: type, convert: Callable[[Any], Any] | None) -> Callable[[tuple], list]:
+    def _convert(values: tuple) -> Any:
+        # Fast path: every value has the column's type, convert with a C-level map
+        if set(map(type, values)) == {type_code}:
+            return values if convert is None else list(map(convert, values))
+        if convert is None:
+            return [v if v.__class__ is type_code else serialize_teradata_types(v) for v in values]
+        return [convert(v) if v.__class__ is type_code else serialize_teradata_types(v) for v in values]
+    return _convert
+
+
+def _generic_column(values: tuple) -> list:
+    return list(map(serialize_teradata_types, values))
+
+
+_CONVERTERS: dict[Any, Callable[[tuple], Any]] = {
+    str: _column_converter(str, None),
+    int: _column_converter(int, str),
+    float: _column_converter(float, str),
+    Decimal: _column_converter(Decimal, float),
+    date: _column_converter(date, date.isoformat),
+    datetime: _column_converter(datetime, datetime.isoformat),
+    time: _column_converter(time, time.isoformat),
+}
+
+
+def column_converters(cursor_description: Any) -> list[Callable[[tuple], Any]]:
+    """Return one column converter per column of a DB-API cursor description."""
+    return [
+        _CONVERTERS.get(col[1], _generic_column) if len(col) > 1 else _generic_column
+        for col in cursor_description or []
+    ]
+
+
+def convert_rows(converters: list[Callable[[tuple], Any]], rows: list[Any]) -> list[tuple]:
+    """Convert a batch of rows column by column; returns rows of JSON-ready values."""
+    if not rows:
+        return []
+    columns = zip(*rows)
+    return list(zip(*[convert(values) for convert, values in zip(converters, columns)]))
+
+
+# ------------------------------ JSON backend ------------------------------ #
+def set_json_backend(name: str | None) -> str:
+    """Select 'json', 'orjson' or 'auto' (orjson when installed); return the backend in use."""
+    global _backend
+    name = (name or "auto").strip().lower()
+    if name not in JSON_BACKENDS:
+        logger.warning(f"Unknown JSON backend '{name}', using 'auto'")
+        name = "auto"
+    if name == "orjson" and orjson is None:
+        logger.warning("JSON backend 'orjson' requested but orjson is not installed; using json")
+        name = "json"
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    _backend = name
+    return _backend
+
+
+def get_json_backend() -> str:
+    """Return the JSON backend in use."""
+    return _backend
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize ``obj`` to JSON text (2-space indent when ``pretty``), keeping non-ASCII characters."""
+    if _backend == "orjson":
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, default=serialize_teradata_types, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; the standard library handles them
+            pass
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False, default=serialize_teradata_types)
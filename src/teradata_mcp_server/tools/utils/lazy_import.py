@@ -0,0 +1,119 @@
+"""Deferred imports of heavy optional dependencies.
+
+``tdfs4ds``, ``teradataml`` and ``teradatagenai`` take seconds to import and
+pull in pandas and friends. Tool modules bind them with ``lazy_import`` so the
+modules (and the signatures of their handlers) load at startup while the
+dependency itself is imported on first attribute access, i.e. on the first
+call of a tool that uses it, on a DB worker thread.
+
+``tdfs4ds`` prints while it is imported, which would corrupt the MCP stdio
+protocol. With ``quiet`` the output written by the importing thread is
+discarded while output from every other thread still goes through.
+
+``lazy_import`` still checks that the package is installed, without importing
+it, so a missing extra keeps failing the tool module's import as before.
+Import times of deferred modules are recorded for the startup report.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import threading
+import time
+import sys
+import types
+from io import StringIO
+from typing import Any
+
+_lock = threading.RLock()
+_deferred: dict[str, float | None] = {}  # module name -> import ms, None until imported
+
+
+class _ThreadFilteredStream:
+    """Stream wrapper that discards writes from one thread and passes the rest through."""
+
+    def __init__(self, stream, thread_id: int):
+        self._stream = stream
+        self._thread_id = thread_id
+        self._discard = StringIO()
+
+    def _target(self):
+        return self._discard if threading.get_ident() == self._thread_id else self._stream
+
+    def write(self, data):
+        return self._target().write(data)
+
+    def writelines(self, lines):
+        return self._target().writelines(lines)
+
+    def flush(self):
+        return self._target().flush()
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._stream, attr)
+
+
+def _import_quietly(name: str) -> types.ModuleType:
+    thread_id = threading.get_ident()
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = _ThreadFilteredStream(stdout, thread_id)
+    sys.stderr = _ThreadFilteredStream(stderr, thread_id)
+    try:
+        return importlib.import_module(name)
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str, quiet: bool = False):
+        super().__init__(name)
+        object.__setattr__(self, "_lazy_quiet", quiet)
+        object.__setattr__(self, "_lazy_module", None)
+
+    def _load(self) -> types.ModuleType:
+        module = object.__getattribute__(self, "_lazy_module")
+        if module is not None:
+            return module
+        with _lock:
+            module = object.__getattribute__(self, "_lazy_module")
+            if module is None:
+                name = object.__getattribute__(self, "__name__")
+                start = time.perf_counter()
+                if object.__getattribute__(self, "_lazy_quiet"):
+                    module = _import_quietly(name)
+                else:
+                    module = importlib.import_module(name)
+                _deferred[name] = (time.perf_counter() - start) * 1000
+                object.__setattr__(self, "_lazy_module", module)
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str, quiet: bool = False) -> types.ModuleType:
+    """Return a proxy for module ``name`` that imports it on first use.
+
+    Raises ModuleNotFoundError right away when the package is not installed.
+    With ``quiet`` the importing thread's stdout/stderr output is discarded.
+    """
+    if importlib.util.find_spec(name.partition(".")[0]) is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    with _lock:
+        _deferred.setdefault(name, None)
+    return LazyModule(name, quiet=quiet)
+
+
+def get_deferred_imports() -> dict[str, float | None]:
+    """Deferred modules and their import time in ms (None while not imported yet)."""
+    with _lock:
+        return {name: (round(ms, 1) if ms is not None else None) for name, ms in _deferred.items()}
@@ -0,0 +1,244 @@
+"""Row caps and continuation tokens for large results.
+
+When a maximum number of rows per response is configured, streamed results
+stop at the cap and the response metadata says so (``truncated``). If the tool
+knows how to re-run its query, a continuation token is issued and the
+``base_nextPage`` tool returns the following rows: it re-issues the query with
+``QUALIFY ROW_NUMBER() OVER (ORDER BY ...) > offset`` so the database skips
+the rows already returned, and no database session or cursor is held between
+pages. Tokens expire after a TTL and the least recently used ones are evicted
+when the store is full.
+
+Tokens are only issued for queries ending in an ORDER BY clause, and pages
+are only stable when its sort keys are unique: rows that tie on the keys may
+fall on either side of a page boundary, so they can repeat on the next page or
+be skipped. Where the offset cannot be pushed into the SQL (set operations,
+DISTINCT, QUALIFY, TOP or SAMPLE, ordinal sort keys, window functions in the
+sort keys, or function sort keys of a grouped query) the query is re-run and
+the earlier rows are fetched and discarded.
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from .sql_validator import NUMBER, OP, WORD, token_spans
+
+NEXT_PAGE_TOOL = "base_nextPage"
+
+# Top-level keywords that stop the offset from being pushed into the query
+_NO_PUSHDOWN = frozenset({"QUALIFY", "UNION", "INTERSECT", "EXCEPT", "MINUS", "TOP", "SAMPLE"})
+# QUALIFY is evaluated before DISTINCT removes duplicates, so row numbers do not match the result
+_NO_PUSHDOWN_SELECT = _NO_PUSHDOWN | {"DISTINCT"}
+
+
+@dataclass(frozen=True)
+class PageQuery:
+    """What is needed to re-issue a query for the next page.
+
+    - tool_name: tool that produced the first page (reported in metadata)
+    - sql: statement to re-run
+    - params: bind parameters, if any
+    - bind: execute through sqlalchemy.text() with params (True) or as driver SQL (False)
+    """
+    tool_name: str
+    sql: str
+    params: dict[str, Any] = field(default_factory=dict)
+    bind: bool = True
+
+
+@dataclass
+class _PageToken:
+    query: PageQuery
+    offset: int
+    expires_at: float
+
+
+class PageTokenStore:
+    """Bounded, expiring store of continuation tokens."""
+
+    def __init__(self, ttl_seconds: int = 600, max_tokens: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_tokens = max(1, max_tokens)
+        self._tokens: "OrderedDict[str, _PageToken]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._issued = 0
+        self._resolved = 0
+        self._expired = 0
+        self._evicted = 0
+
+    def issue(self, query: PageQuery, offset: int) -> str:
+        """Return a new token that resumes ``query`` after ``offset`` rows."""
+        token = secrets.token_urlsafe(16)
+        now = time.time()
+        with self._lock:
+            self._purge_expired(now)
+            while len(self._tokens) >= self.max_tokens:
+                self._tokens.popitem(last=False)
+                self._evicted += 1
+            self._tokens[token] = _PageToken(query, offset, now + self.ttl_seconds)
+            self._issued += 1
+        return token
+
+    def resolve(self, token: str) -> tuple[PageQuery, int] | None:
+        """Return (query, offset) for a live token, else None.
+
+        Tokens stay valid until they expire so a failed page can be retried.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._tokens.get(token)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                del self._tokens[token]
+                self._expired += 1
+                return None
+            self._tokens.move_to_end(token)
+            self._resolved += 1
+            return entry.query, entry.offset
+
+    def _purge_expired(self, now: float):
+        expired = [t for t, entry in self._tokens.items() if entry.expires_at <= now]
+        for t in expired:
+            del self._tokens[t]
+        self._expired += len(expired)
+
+    def get_stats(self) -> dict:
+        """Get token store statistics."""
+        with self._lock:
+            return {
+                "live_tokens": len(self._tokens),
+                "max_tokens": self.max_tokens,
+                "ttl_seconds": self.ttl_seconds,
+                "issued": self._issued,
+                "resolved": self._resolved,
+                "expired": self._expired,
+                "evicted": self._evicted,
+            }
+
+
+_max_rows = 0
+_store = PageTokenStore()
+
+
+def configure_pagination(max_rows: int, token_ttl: int = 600, max_tokens: int = 1000) -> PageTokenStore:
+    """Set the per-response row cap (0 = unlimited) and create the token store."""
+    global _max_rows, _store
+    _max_rows = max(0, max_rows)
+    _store = PageTokenStore(ttl_seconds=token_ttl, max_tokens=max_tokens)
+    return _store
+
+
+def get_max_rows() -> int:
+    """Return the per-response row cap (0 = unlimited)."""
+    return _max_rows
+
+
+def get_page_store() -> PageTokenStore:
+    """Return the continuation token store."""
+    return _store
+
+
+def _order_by_span(sql: str) -> tuple[int, int] | None:
+    """Return the offsets of the top-level trailing ORDER BY and of its sort keys."""
+    depth = 0
+    order_at = keys_at = None
+    for kind, text, start, end in token_spans(sql):
+        if kind == OP and text == "(":
+            depth += 1
+        elif kind == OP and text == ")":
+            depth -= 1
+        elif kind == WORD and depth == 0:
+            word = text.upper()
+            if word == "ORDER":
+                order_at, keys_at = start, None
+            elif word == "BY" and order_at is not None and keys_at is None:
+                keys_at = end
+            elif keys_at is not None and word in _NO_PUSHDOWN:
+                # ORDER BY of a set operation branch, not of the statement
+                order_at = keys_at = None
+    if order_at is None or keys_at is None:
+        return None
+    return order_at, keys_at
+
+
+def has_order_by(sql: str) -> bool:
+    """Return True if the statement ends with an ORDER BY clause."""
+    return _order_by_span(sql.strip().rstrip(";")) is not None
+
+
+def paged_sql(sql: str, offset: int) -> str | None:
+    """Return ``sql`` rewritten so the database skips its first ``offset`` rows.
+
+    The statement's own ORDER BY keys number the rows in a QUALIFY clause.
+    Returns None when the statement cannot be rewritten safely.
+    """
+    sql = sql.strip().rstrip(";")
+    span = _order_by_span(sql)
+    if span is None:
+        return None
+    order_at, keys_at = span
+    depth = 0
+    key_start = True
+    grouped = False
+    key_calls = False
+    for kind, text, start, _ in token_spans(sql):
+        if kind == "comment":
+            if start >= order_at:
+                return None  # a line comment would swallow the appended clauses
+        elif kind == OP and text in "()":
+            depth += 1 if text == "(" else -1
+            key_start = False
+            key_calls = key_calls or start >= keys_at
+        elif kind == WORD and start >= keys_at and text.upper() == "OVER":
+            return None  # a window function cannot be nested in ROW_NUMBER() OVER (...)
+        elif depth == 0 and start < order_at:
+            if kind == WORD and text.upper() in _NO_PUSHDOWN_SELECT:
+                return None
+            grouped = grouped or (kind == WORD and text.upper() == "GROUP")
+        elif depth == 0 and start >= keys_at:
+            # Ordinal sort keys (ORDER BY 1) would be constants inside OVER (...)
+            if key_start and kind == NUMBER:
+                return None
+            key_start = kind == OP and text == ","
+    if grouped and key_calls:
+        return None  # aggregate sort keys of a grouped query
+    keys = sql[keys_at:].strip()
+    return (
+        f"{sql[:order_at].rstrip()}\n"
+        f"QUALIFY ROW_NUMBER() OVER (ORDER BY {keys}) > {int(offset)}\n"
+        f"ORDER BY {keys}"
+    )
+
+
+def skip_rows(cursor: Any, count: int, batch_size: int = 1000) -> int:
+    """Fetch and discard up to ``count`` rows; return how many were skipped."""
+    skipped = 0
+    while skipped < count:
+        batch = cursor.fetchmany(min(batch_size, count - skipped))
+        if not batch:
+            break
+        skipped += len(batch)
+    return skipped
+
+
+def mark_truncated(metadata: dict[str, Any], query: PageQuery | None, next_offset: int):
+    """Record truncation in metadata, with a continuation token when the query can be resumed."""
+    metadata["truncated"] = True
+    if query is not None and has_order_by(query.sql):
+        metadata["next_page"] = {
+            "tool": NEXT_PAGE_TOOL,
+            "continuation_token": get_page_store().issue(query, next_offset),
+        }
+    elif query is not None:
+        metadata["truncation_note"] = (
+            f"Result capped at {_max_rows} rows; add an ORDER BY clause to page through the rest"
+        )
+    else:
+        metadata["truncation_note"] = f"Result capped at {_max_rows} rows; narrow the query to see the rest"
@@ -0,0 +1,155 @@
+"""Prepared SQL for YAML-defined query tools.
+
+A YAML tool always submits the same SQL with different bind values. Its SQL is
+prepared once, when the tool is registered: validated, its ``:name`` bind
+parameters located with the SQL lexer and rewritten to ``?`` markers. Calls
+then execute the driver SQL with teradatasql's native parameter binding, so
+the database can reuse its request cache, and no SQLAlchemy statement is
+compiled per call. The SQL with literal values, reported in the response
+metadata, is rendered from the prepared pieces only when the SQL metadata
+mode shows it.
+
+Per-tool compile and execute timings are kept for the ``stats://server``
+resource.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from typing import Any, Iterable
+
+from .sql_validator import SQLAnalysis, SQLValidationError, bind_parameters, get_validation_policy, validate_sql
+
+# Operations blocked even if validation let them through, as in handle_base_readQuery
+DANGEROUS_OPERATIONS = ('DELETE', 'UPDATE', 'INSERT', 'DROP', 'CREATE', 'ALTER', 'TRUNCATE', 'MERGE')
+
+
+def validate_read_only(sql: str) -> SQLAnalysis:
+    """Validate ``sql`` and require a read-only (SELECT/WITH) statement.
+
+    Applies the same checks as base_readQuery, which YAML tools ran through
+    before they were prepared. Raises SQLValidationError.
+    """
+    analysis = validate_sql(sql)
+    if not analysis.read_only:
+        raise SQLValidationError("Only SELECT and WITH statements are allowed in query tools")
+    for dangerous_op in DANGEROUS_OPERATIONS:
+        if dangerous_op in analysis.operations:
+            raise SQLValidationError(f"Operation '{dangerous_op}' is not allowed in query tools")
+    return analysis
+
+
+def render_literal(value: Any) -> str:
+    """Render a bind value as a Teradata SQL literal (for display only)."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return f"TIMESTAMP '{value.isoformat(sep=' ')}'"
+    if isinstance(value, date):
+        return f"DATE '{value.isoformat()}'"
+    if isinstance(value, dt_time):
+        return f"TIME '{value.isoformat()}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class PreparedQuery:
+    """SQL of a YAML query tool, validated and split at its bind parameters once.
+
+    Raises SQLValidationError when the SQL fails validation or is not read-only.
+    """
+
+    def __init__(self, tool_name: str, sql: str, declared: Iterable[str] | None = None):
+        start = time.perf_counter()
+        self.tool_name = tool_name
+        self.sql = sql
+        self.analysis = validate_read_only(sql)
+        self._policy = get_validation_policy()
+        spans = bind_parameters(sql)
+        self._binds = [name for name, _, _ in spans]
+        self.param_names = tuple(dict.fromkeys(self._binds))
+        self._pieces: list[str] = []
+        pos = 0
+        for _, begin, end in spans:
+            self._pieces.append(sql[pos:begin])
+            pos = end
+        self._pieces.append(sql[pos:])
+        self.driver_sql = "?".join(self._pieces)
+        self.undeclared = tuple(n for n in self.param_names if declared is not None and n not in declared)
+        self.compile_ms = (time.perf_counter() - start) * 1000
+
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._failures = 0
+        self._execute_ms = 0.0
+        self._execute_max_ms = 0.0
+        self._fetch_ms = 0.0
+
+    def revalidate(self):
+        """Validate the SQL again if the validation policy changed since it was prepared."""
+        policy = get_validation_policy()
+        if policy is not self._policy:
+            self.analysis = validate_read_only(self.sql)
+            self._policy = policy
+
+    def bind(self, params: dict[str, Any]) -> list[Any]:
+        """Return the positional values for driver_sql; raises ValueError for missing parameters."""
+        missing = [n for n in self.param_names if n not in params]
+        if missing:
+            raise ValueError(f"Missing parameters: {missing}")
+        return [params[n] for n in self._binds]
+
+    def render(self, params: dict[str, Any]) -> str:
+        """Return the SQL with bind parameters replaced by literals."""
+        if not self._binds:
+            return self.sql
+        parts = [self._pieces[0]]
+        for name, piece in zip(self._binds, self._pieces[1:]):
+            parts.append(render_literal(params.get(name)))
+            parts.append(piece)
+        return "".join(parts)
+
+    def record(self, execute_s: float, fetch_s: float, failed: bool = False):
+        """Record the timing of one call."""
+        with self._lock:
+            self._calls += 1
+            if failed:
+                self._failures += 1
+            self._execute_ms += execute_s * 1000
+            self._execute_max_ms = max(self._execute_max_ms, execute_s * 1000)
+            self._fetch_ms += fetch_s * 1000
+
+    def get_stats(self) -> dict:
+        """Get compile and execute timings for this tool."""
+        with self._lock:
+            calls = self._calls
+            return {
+                "parameters": list(self.param_names),
+                "compile_ms": round(self.compile_ms, 3),
+                "calls": calls,
+                "failures": self._failures,
+                "execute_ms_avg": round(self._execute_ms / calls, 3) if calls else 0.0,
+                "execute_ms_max": round(self._execute_max_ms, 3),
+                "fetch_ms_avg": round(self._fetch_ms / calls, 3) if calls else 0.0,
+            }
+
+
+_prepared: dict[str, PreparedQuery] = {}
+
+
+def prepare_query(tool_name: str, sql: str, declared: Iterable[str] | None = None) -> PreparedQuery:
+    """Prepare and register the SQL of a YAML query tool."""
+    query = PreparedQuery(tool_name, sql, declared)
+    _prepared[tool_name] = query
+    return query
+
+
+def get_prepared_stats() -> dict:
+    """Get compile/execute timings of all prepared query tools."""
+    return {name: query.get_stats() for name, query in _prepared.items()}
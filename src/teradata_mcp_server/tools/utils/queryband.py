@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+from typing import Any, Callable
+
 def sanitize_qb_value(val: str | None) -> str:
     if val is None:
         return ""
@@ -15,6 +18,7 @@ def build_queryband(
     process_id: str,
     tool_name: str,
     request_context: object | None,
+    include_request_id: bool = True,
 ) -> str:
     parts: list[str] = []
 
@@ -29,7 +33,8 @@ def build_queryband(
     add("TOOL_NAME", tool_name)
 
     if request_context is not None:
-        add("REQUEST_ID", getattr(request_context, "request_id", None))
+        if include_request_id:
+            add("REQUEST_ID", getattr(request_context, "request_id", None))
         add("SESSION_ID", getattr(request_context, "session_id", None))
         add("TENANT", getattr(request_context, "tenant", None))
         fwd = getattr(request_context, "forwarded_for", None)
@@ -48,3 +53,48 @@ def build_queryband(
 
     return "".join(parts)
 
+
+
+class SessionQueryBandCache:
+    """Remember the QueryBand carried by each pooled database session.
+
+    The band is stored in the pooled connection's ``info`` dict, which SQLAlchemy
+    keeps for the lifetime of the underlying DB-API connection across pool
+    checkouts and discards when the connection is invalidated or replaced. A
+    ``SET QUERY_BAND`` round trip is only issued when the band differs.
+    """
+
+    INFO_KEY = "td_query_band"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def apply(self, pooled_conn: Any, query_band: str, execute_sql: Callable[[str], Any]) -> bool:
+        """Set ``query_band`` on the session unless it already carries it.
+
+        Returns True if a SET QUERY_BAND statement was issued.
+        """
+        info = pooled_conn.info
+        if info.get(self.INFO_KEY) == query_band:
+            with self._lock:
+                self._hits += 1
+            return False
+        # Session state is unknown until the statement succeeds
+        info.pop(self.INFO_KEY, None)
+        execute_sql(f"SET QUERY_BAND = '{query_band}' FOR SESSION")
+        info[self.INFO_KEY] = query_band
+        with self._lock:
+            self._misses += 1
+        return True
+
+    def get_stats(self) -> dict:
+        """Get hit/miss counters (hits are saved round trips)."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits / total) if total else 0.0,
+            }
@@ -0,0 +1,111 @@
+"""Response formats for tabular tool results.
+
+- rows:     {"results": [{"col": value, ...}, ...]}  (default, one object per row)
+- columnar: {"results": {"columns": [...], "data": [[...], ...]}}
+- csv/tsv:  {"results": "<header line>\\n<row>\\n..."}
+
+The format is chosen per server or profile and carried to the handlers in a
+context variable, so create_response and stream_response honour it without any
+change to handler signatures. Non-default formats are written directly in
+their final layout (one row per line) and returned as JSONText.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from .encoder import dumps
+
+logger = logging.getLogger("teradata_mcp_server")
+
+RESPONSE_FORMATS = ("rows", "columnar", "csv", "tsv")
+
+_response_format: ContextVar[str] = ContextVar("td_response_format", default="rows")
+
+
+class JSONText(str):
+    """Response text that is already formatted for the MCP client.
+
+    format_text_response passes it through instead of parsing and re-indenting it.
+    """
+    pass
+
+
+def normalize_response_format(value: str | None) -> str:
+    """Return a supported format name; unknown values fall back to 'rows'."""
+    fmt = (value or "rows").strip().lower()
+    if fmt not in RESPONSE_FORMATS:
+        logger.warning(f"Unknown response format '{value}', using 'rows' (expected one of {', '.join(RESPONSE_FORMATS)})")
+        return "rows"
+    return fmt
+
+
+def get_response_format() -> str:
+    """Return the response format for the current tool call."""
+    return _response_format.get()
+
+
+@contextmanager
+def use_response_format(fmt: str) -> Iterator[None]:
+    """Set the response format for the duration of a tool call."""
+    token = _response_format.set(fmt)
+    try:
+        yield
+    finally:
+        _response_format.reset(token)
+
+
+def _dumps(obj: Any, indent_level: int | None = None) -> str:
+    if indent_level is None:
+        return dumps(obj)
+    return dumps(obj, pretty=True).replace("\n", "\n" + " " * indent_level)
+
+
+class ResultWriter:
+    """Writes a success response row by row in the selected format."""
+
+    def __init__(self, columns: list[str], fmt: str | None = None):
+        self.columns = columns
+        self.fmt = fmt or get_response_format()
+        self.row_count = 0
+        self._out = io.StringIO()
+        self._out.write('{\n  "status": "success",\n  "results": ')
+        if self.fmt == "columnar":
+            self._out.write('{\n    "columns": ' + _dumps(columns) + ',\n    "data": [')
+        elif self.fmt in ("csv", "tsv"):
+            self._table = io.StringIO()
+            self._csv = csv.writer(self._table, delimiter="\t" if self.fmt == "tsv" else ",", lineterminator="\n")
+            self._csv.writerow(columns)
+        else:
+            self._out.write("[")
+
+    def write(self, values: list[Any]):
+        """Append one row given as values in column order."""
+        if self.fmt == "columnar":
+            self._out.write(",\n      " if self.row_count else "\n      ")
+            self._out.write(_dumps(values))
+        elif self.fmt in ("csv", "tsv"):
+            self._csv.writerow(values)
+        else:
+            self._out.write(",\n    " if self.row_count else "\n    ")
+            self._out.write(_dumps(dict(zip(self.columns, values)), 4))
+        self.row_count += 1
+
+    def finish(self, metadata: dict[str, Any] | None = None) -> JSONText:
+        """Close the results section, append metadata and return the response text."""
+        if self.fmt == "columnar":
+            self._out.write("\n    ]\n  }" if self.row_count else "]\n  }")
+        elif self.fmt in ("csv", "tsv"):
+            self._out.write(_dumps(self._table.getvalue()))
+        else:
+            self._out.write("\n  ]" if self.row_count else "]")
+        if metadata:
+            self._out.write(',\n  "metadata": ')
+            self._out.write(_dumps(metadata, 2))
+        self._out.write("\n}")
+        return JSONText(self._out.getvalue())
@@ -0,0 +1,81 @@
+"""How the executed SQL is reported in response metadata.
+
+- full:      ``"sql"`` holds the statement with bind values rendered as literals (default)
+- truncated: ``"sql"`` holds the first characters of that statement
+- hash:      ``"sql_hash"`` identifies the statement and its bind values; nothing is rendered
+- none:      no SQL in the metadata
+
+Rendering the literal SQL (a SQLAlchemy ``literal_binds`` compile for
+base_readQuery) costs CPU on long generated statements and large IN-lists, and
+the full text is repeated in every response. Handlers pass a render callable to
+``add_sql_metadata`` and it is only called in the modes that show the SQL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger("teradata_mcp_server")
+
+SQL_METADATA_MODES = ("none", "hash", "truncated", "full")
+
+_mode = "full"
+_max_chars = 200
+
+
+def normalize_sql_metadata(value: str | None) -> str:
+    """Return a supported mode name; unknown values fall back to 'full'."""
+    mode = (value or "full").strip().lower()
+    if mode not in SQL_METADATA_MODES:
+        logger.warning(f"Unknown SQL metadata mode '{value}', using 'full' (expected one of {', '.join(SQL_METADATA_MODES)})")
+        return "full"
+    return mode
+
+
+def configure_sql_metadata(mode: str | None, max_chars: int = 200) -> str:
+    """Set the SQL metadata mode and the length kept in 'truncated' mode; return the mode."""
+    global _mode, _max_chars
+    _mode = normalize_sql_metadata(mode)
+    _max_chars = max(1, max_chars)
+    return _mode
+
+
+def get_sql_metadata_mode() -> str:
+    """Return the SQL metadata mode."""
+    return _mode
+
+
+def sql_hash(sql: str, params: dict[str, Any] | None = None) -> str:
+    """Return a short stable hash of a statement and its bind values."""
+    h = hashlib.sha256(sql.encode("utf-8", "surrogatepass"))
+    if params:
+        h.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def add_sql_metadata(
+    metadata: dict[str, Any],
+    sql: str,
+    params: dict[str, Any] | None = None,
+    render: Callable[[], str] | None = None,
+) -> dict[str, Any]:
+    """Add the SQL of a call to ``metadata`` according to the configured mode.
+
+    ``render`` returns the SQL with literal values and is only called in
+    'full' and 'truncated' modes; without it ``sql`` is shown as is.
+    """
+    if _mode == "none":
+        return metadata
+    if _mode == "hash":
+        metadata["sql_hash"] = sql_hash(sql, params)
+        return metadata
+    text = render() if render is not None else sql
+    if _mode == "truncated" and len(text) > _max_chars:
+        metadata["sql"] = text[:_max_chars] + "..."
+        metadata["sql_truncated"] = True
+    else:
+        metadata["sql"] = text
+    return metadata
@@ -4,9 +4,16 @@ This module provides comprehensive SQL interception and logging.
 """
 
 import logging
-import re
 from typing import Any
 
+from .sql_validator import (
+    WARN_COMMENT_KEYWORD,
+    WARN_DYNAMIC_EXEC,
+    WARN_PROCEDURE,
+    SQLValidationError,
+    get_validation_cache,
+)
+
 logger = logging.getLogger("teradata_mcp_server.security")
 
 class SQLSecurityMonitor:
@@ -27,49 +34,34 @@ class SQLSecurityMonitor:
         """
         if not sql or not sql.strip():
             return
-            
-        # Normalize SQL for inspection
-        sql_normalized = sql.upper().strip()
-        sql_normalized = re.sub(r'\s+', ' ', sql_normalized)
-        
+
         # Log ALL SQL executions for security audit
         logger.info(f"SQL_MONITOR [{execution_context}]: {sql[:200]}{'...' if len(sql) > 200 else ''}")
-        
+
+        try:
+            analysis = get_validation_cache().analyze(sql)
+        except SQLValidationError as e:
+            error_msg = f"SECURITY VIOLATION: {e}"
+            logger.critical(f"{error_msg} - Context: {execution_context} - SQL: {sql[:100]}")
+            raise ValueError(error_msg)
+
         # Critical security check - block dangerous operations
         dangerous_operations = [
             'DELETE', 'UPDATE', 'INSERT', 'DROP', 'CREATE', 'ALTER', 
             'TRUNCATE', 'MERGE', 'REPLACE', 'GRANT', 'REVOKE', 'UPSERT'
         ]
-        
-        for operation in dangerous_operations:
-            # Multiple pattern checks to prevent bypass
-            patterns = [
-                rf'\b{operation}\s+',        # Word boundary + space
-                rf'^{operation}\s+',         # Start of string
-                rf';\s*{operation}\s+',      # After semicolon
-                rf'\b{operation}\b',         # Word boundaries
-            ]
-            
-            for pattern in patterns:
-                if re.search(pattern, sql_normalized):
-                    error_msg = f"SECURITY VIOLATION: Operation '{operation}' detected in SQL and BLOCKED"
-                    logger.critical(f"{error_msg} - Context: {execution_context} - SQL: {sql[:100]}")
-                    raise ValueError(error_msg)
-        
+
+        for operation in analysis.operations:
+            if operation in dangerous_operations:
+                error_msg = f"SECURITY VIOLATION: Operation '{operation}' detected in SQL and BLOCKED"
+                logger.critical(f"{error_msg} - Context: {execution_context} - SQL: {sql[:100]}")
+                raise ValueError(error_msg)
+
         # Check for suspicious patterns that might indicate injection attempts
-        suspicious_patterns = [
-            r'EXEC\s*\(',
-            r'EXECUTE\s*\(',
-            r'SP_\w+',
-            r'XP_\w+',
-            r'--\s*DELETE',
-            r'/\*.*DELETE.*\*/',
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, sql_normalized):
-                error_msg = f"SECURITY WARNING: Suspicious pattern detected in SQL"
-                logger.warning(f"{error_msg} - Context: {execution_context} - SQL: {sql[:100]}")
+        suspicious = (WARN_DYNAMIC_EXEC, WARN_PROCEDURE, WARN_COMMENT_KEYWORD)
+        if any(code in suspicious for code in analysis.warnings):
+            error_msg = f"SECURITY WARNING: Suspicious pattern detected in SQL"
+            logger.warning(f"{error_msg} - Context: {execution_context} - SQL: {sql[:100]}")
 
 # Global function to be used throughout the codebase
 def monitor_sql_execution(sql: str, context: str = "general") -> None:
@@ -0,0 +1,405 @@
+"""Single-pass SQL lexer and security validator.
+
+The statement is tokenized once with one compiled pattern: string literals,
+quoted identifiers, comments and bind parameters become their own tokens, so
+keywords are only recognized where the database would see them. The token list
+is then walked once to collect everything the security checks need (statement
+kinds, prohibited keywords and functions, unbounded ``SELECT *`` and warning
+patterns) into an ``SQLAnalysis``.
+
+``validate_sql``, ``SQLSecurityMonitor`` and the final check of
+``base_readQuery`` all read the same analysis instead of running their own
+regex loops over the text.
+
+Analyses are cached in a bounded LRU keyed by a hash of the SQL with its
+whitespace normalized, so template tools that always submit the same
+statement are lexed once per process. The cache is cleared when the
+validation policy is changed with ``set_validation_policy``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+logger = logging.getLogger("teradata_mcp_server")
+
+
+class SQLValidationError(Exception):
+    """Raised when SQL query fails validation checks"""
+    pass
+
+
+# Operations that must be blocked (NO BYPASS ALLOWED)
+DANGEROUS_KEYWORDS = (
+    'UPDATE', 'DELETE', 'INSERT', 'DROP', 'CREATE', 'ALTER', 'TRUNCATE',
+    'MERGE', 'REPLACE', 'GRANT', 'REVOKE', 'CALL', 'EXECUTE', 'UPSERT'
+)
+# Stored procedure / dynamic execution functions
+DANGEROUS_FUNCTIONS = ('EXEC', 'EXECUTE', 'SP_', 'XP_')
+# Teradata statement abbreviations, resolved when classifying statements
+STATEMENT_ABBREVIATIONS = {'SEL': 'SELECT', 'DEL': 'DELETE', 'INS': 'INSERT', 'UPD': 'UPDATE', 'CT': 'CREATE'}
+READ_STATEMENTS = frozenset({'SELECT', 'WITH'})
+
+# Warning codes reported in SQLAnalysis.warnings
+WARN_OBFUSCATION = "obfuscation"            # CHAR(n), CHR(n), CONCAT(...), ||
+WARN_DYNAMIC_EXEC = "dynamic_exec"          # EXEC(...), EXECUTE(...)
+WARN_PROCEDURE = "procedure_name"           # SP_xxx / XP_xxx identifiers
+WARN_UNION_SELECT = "union_select"
+WARN_STACKED = "stacked_statements"
+WARN_COMMENT = "comment"
+WARN_COMMENT_KEYWORD = "comment_keyword"    # prohibited keyword inside a comment
+WARN_LARGE_RESULT = "large_result"
+
+_LOCK_TYPES = frozenset({'ACCESS', 'READ', 'WRITE', 'EXCLUSIVE', 'SHARE', 'LOAD', 'CHECKSUM'})
+_SYSTEM_SCHEMAS = frozenset({'DBC', 'INFORMATION_SCHEMA'})
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+      (?P<comment>--[^\r\n]*|/\*.*?\*/)
+    | (?P<string>'(?:[^']|'')*')
+    | (?P<quoted>"(?:[^"]|"")*")
+    | (?P<param>(?<![\w:]):\w+(?!:)|\?)
+    | (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<word>[^\W\d][\w$\#]*)
+    | (?P<unterminated>['"]|/\*)
+    | (?P<op>\|\||<>|<=|>=|!=|\S))
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_COMMENT_WORD_RE = re.compile(r"[^\W\d]\w*")
+# Whitespace runs collapse to one space, or one newline so line comments still end
+_HSPACE_RE = re.compile(r"[^\S\r\n]+")
+_NEWLINE_RE = re.compile(r"\s*[\r\n]\s*")
+
+# Token kinds
+WORD, STRING, QUOTED, PARAM, NUMBER, OP = "word", "string", "quoted", "param", "number", "op"
+
+
+def tokenize(sql: str) -> tuple[list[tuple[str, str]], list[str]]:
+    """Split SQL into (kind, text) tokens and a separate list of comments.
+
+    Words are upper-cased; whitespace is dropped. Raises SQLValidationError for
+    an unterminated string literal, quoted identifier or comment, which the
+    database would reject anyway and which would otherwise hide the rest of
+    the statement from the checks.
+    """
+    tokens: list[tuple[str, str]] = []
+    comments: list[str] = []
+    append = tokens.append
+    for m in _TOKEN_RE.finditer(sql):
+        kind = m.lastgroup
+        text = m.group(kind)
+        if kind == WORD:
+            append((WORD, text.upper()))
+        elif kind == "comment":
+            comments.append(text)
+        elif kind == "unterminated":
+            raise SQLValidationError("Unterminated string literal, quoted identifier or comment")
+        else:
+            append((kind, text))
+    return tokens, comments
+
+
+def token_spans(sql: str):
+    """Yield (kind, text, start, end) for each token and comment of ``sql``, text as written."""
+    for m in _TOKEN_RE.finditer(sql):
+        kind = m.lastgroup
+        yield kind, m.group(kind), m.start(kind), m.end(kind)
+
+
+def bind_parameters(sql: str) -> list[tuple[str, int, int]]:
+    """Return (name, start, end) of each named bind parameter (``:name``) outside literals and comments."""
+    return [
+        (m.group(PARAM)[1:], *m.span(PARAM))
+        for m in _TOKEN_RE.finditer(sql)
+        if m.lastgroup == PARAM and m.group(PARAM) != "?"
+    ]
+
+
+@dataclass(frozen=True)
+class ValidationPolicy:
+    """Keywords and function names that make a statement fail validation."""
+    dangerous_keywords: frozenset[str] = frozenset(DANGEROUS_KEYWORDS)
+    dangerous_functions: frozenset[str] = frozenset(DANGEROUS_FUNCTIONS)
+
+
+@dataclass(frozen=True)
+class SQLAnalysis:
+    """What the security checks need to know about a statement.
+
+    - statement_kinds: leading keyword of each statement (abbreviations resolved)
+    - operations: prohibited keywords found outside literals and comments
+    - functions: prohibited function names found
+    - unbounded_select_star: SELECT * FROM ... without WHERE, TOP/SAMPLE or a system catalog
+    - warnings: warning codes (WARN_*) for suspicious but allowed patterns
+    """
+    statement_kinds: tuple[str, ...]
+    operations: tuple[str, ...]
+    functions: tuple[str, ...]
+    unbounded_select_star: bool
+    warnings: tuple[str, ...]
+
+    @property
+    def read_only(self) -> bool:
+        """True when every statement is a SELECT or WITH query."""
+        return bool(self.statement_kinds) and all(kind in READ_STATEMENTS for kind in self.statement_kinds)
+
+
+def _statement_kind(tokens: list[tuple[str, str]], i: int, end: int) -> str:
+    """Return the leading keyword of the statement in tokens[i:end]."""
+    while i < end:
+        kind, text = tokens[i]
+        if kind == OP and text == "(":
+            i += 1
+            continue
+        if kind != WORD:
+            return text
+        if text in ("LOCKING", "LOCK"):
+            # LOCKING <object> FOR <lock type> [MODE] [NOWAIT] <statement>
+            while i < end and not (tokens[i][0] == WORD and tokens[i][1] in _LOCK_TYPES):
+                i += 1
+            i += 1
+            while i < end and tokens[i][0] == WORD and tokens[i][1] in ("MODE", "NOWAIT"):
+                i += 1
+            continue
+        return STATEMENT_ABBREVIATIONS.get(text, text)
+    return ""
+
+
+def analyze_sql(sql: str, policy: ValidationPolicy | None = None) -> SQLAnalysis:
+    """Tokenize ``sql`` once and collect statement kinds, violations and warnings."""
+    policy = policy or get_validation_policy()
+    dangerous, dangerous_functions = policy.dangerous_keywords, policy.dangerous_functions
+    tokens, comments = tokenize(sql)
+    n = len(tokens)
+    kinds: list[str] = []
+    operations: dict[str, None] = {}
+    functions: dict[str, None] = {}
+    warnings: dict[str, None] = {}
+    has_where = bounded = system_table = star = False
+
+    statement_start = 0
+    for i in range(n + 1):
+        if i == n or tokens[i] == (OP, ";"):
+            if i > statement_start:
+                statement = _statement_kind(tokens, statement_start, i)
+                kinds.append(statement)
+                if statement in dangerous:
+                    operations.setdefault(statement)
+            statement_start = i + 1
+            continue
+
+        kind, text = tokens[i]
+        nxt = tokens[i + 1] if i + 1 < n else ("", "")
+        if kind == WORD:
+            if text in dangerous:
+                operations.setdefault(text)
+            if text in dangerous_functions:
+                functions.setdefault(text)
+            if nxt == (OP, "("):
+                if text in ("EXEC", "EXECUTE"):
+                    warnings.setdefault(WARN_DYNAMIC_EXEC)
+                elif text == "CONCAT" or (
+                    text in ("CHAR", "CHR") and i + 2 < n and tokens[i + 2][0] == NUMBER
+                ):
+                    warnings.setdefault(WARN_OBFUSCATION)
+            if text.startswith(("SP_", "XP_")):
+                warnings.setdefault(WARN_PROCEDURE)
+            elif text == "UNION" and nxt[0] == WORD and nxt[1] in ("SELECT", "SEL"):
+                warnings.setdefault(WARN_UNION_SELECT)
+            elif text == "WHERE":
+                has_where = True
+            elif text in ("TOP", "SAMPLE") and nxt[0] == NUMBER:
+                bounded = True
+            elif text == "FROM" and nxt[0] == WORD and nxt[1] in _SYSTEM_SCHEMAS:
+                if i + 2 < n and tokens[i + 2] == (OP, "."):
+                    system_table = True
+        elif kind == OP:
+            if text == "||":
+                warnings.setdefault(WARN_OBFUSCATION)
+            elif text == "*" and i > 0 and (
+                tokens[i - 1] in ((WORD, "SELECT"), (WORD, "SEL"))
+                or (tokens[i - 1] == (OP, "(") and i > 1 and tokens[i - 2] == (WORD, "COUNT"))
+            ):
+                star = True
+
+    if len(kinds) > 1:
+        warnings.setdefault(WARN_STACKED)
+    if comments:
+        warnings.setdefault(WARN_COMMENT)
+        if any(not dangerous.isdisjoint(_COMMENT_WORD_RE.findall(c.upper())) for c in comments):
+            warnings.setdefault(WARN_COMMENT_KEYWORD)
+    if star and not (has_where or bounded):
+        warnings.setdefault(WARN_LARGE_RESULT)
+
+    # Legacy rule: only a query that starts with SELECT * FROM is rejected
+    leading_star = n >= 3 and tokens[0] in ((WORD, "SELECT"), (WORD, "SEL")) and tokens[1] == (OP, "*") \
+        and tokens[2] == (WORD, "FROM")
+    return SQLAnalysis(
+        statement_kinds=tuple(kinds),
+        operations=tuple(operations),
+        functions=tuple(functions),
+        unbounded_select_star=leading_star and not (has_where or bounded or system_table),
+        warnings=tuple(warnings),
+    )
+
+
+# --------------------------- Analysis cache --------------------------- #
+def normalize_sql(sql: str) -> str:
+    """Strip the SQL and collapse whitespace runs; the analysis of the result is the same."""
+    return _NEWLINE_RE.sub("\n", _HSPACE_RE.sub(" ", sql.strip()))
+
+
+class ValidationCache:
+    """Bounded LRU cache of SQL analyses keyed by a hash of the normalized SQL.
+
+    Statements rejected by the lexer are cached too. Each entry records the
+    policy it was computed under and is only reused under that same policy.
+    ``max_entries=0`` disables caching.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[bytes, tuple[ValidationPolicy, SQLAnalysis | str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def key(sql: str) -> bytes:
+        return hashlib.blake2b(normalize_sql(sql).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def analyze(self, sql: str) -> SQLAnalysis:
+        """Return the cached analysis of ``sql``, analyzing it on a miss."""
+        policy = get_validation_policy()
+        if not self.max_entries:
+            return analyze_sql(sql, policy)
+        key = self.key(sql)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is policy:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                result = entry[1]
+            else:
+                self._misses += 1
+                result = None
+        if result is None:
+            try:
+                result = analyze_sql(sql, policy)
+            except SQLValidationError as e:
+                result = str(e)
+            with self._lock:
+                self._entries[key] = (policy, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evicted += 1
+        if isinstance(result, str):
+            raise SQLValidationError(result)
+        return result
+
+    def clear(self):
+        """Drop all entries (e.g. after a policy change)."""
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def get_stats(self) -> dict:
+        """Get validation cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evicted": self._evicted,
+                "invalidations": self._invalidations,
+            }
+
+
+_policy = ValidationPolicy()
+_cache = ValidationCache()
+
+
+def get_validation_policy() -> ValidationPolicy:
+    """Return the validation policy in force."""
+    return _policy
+
+
+def set_validation_policy(policy: ValidationPolicy) -> None:
+    """Replace the validation policy and invalidate cached analyses."""
+    global _policy
+    _policy = policy
+    _cache.clear()
+    logger.info("SQL validation policy changed; validation cache cleared")
+
+
+def configure_validation_cache(max_entries: int) -> ValidationCache:
+    """Create the analysis cache with room for ``max_entries`` statements (0 = disabled)."""
+    global _cache
+    _cache = ValidationCache(max_entries)
+    return _cache
+
+
+def get_validation_cache() -> ValidationCache:
+    """Return the analysis cache."""
+    return _cache
+
+
+def validate_sql(sql: str) -> SQLAnalysis:
+    """
+    Validate SQL query to prevent dangerous operations.
+
+    This function implements mandatory security validation that cannot be bypassed.
+    All data modification operations are strictly prohibited.
+
+    Returns:
+        SQLAnalysis: the analysis of the statement, for further checks by the caller
+
+    Raises:
+        SQLValidationError: If the SQL contains prohibited operations
+    """
+    if not sql or not sql.strip():
+        raise SQLValidationError("Empty SQL query not allowed")
+
+    # Log all SQL queries for security audit
+    logger.info(f"SQL Security Validation: {sql[:100]}{'...' if len(sql) > 100 else ''}")
+
+    analysis = _cache.analyze(sql)
+    if analysis.operations:
+        keyword = analysis.operations[0]
+        logger.error(f"SECURITY VIOLATION: Blocked '{keyword}' operation in SQL: {sql[:50]}...")
+        raise SQLValidationError(f"Operation '{keyword}' is strictly prohibited for security reasons")
+
+    for code in analysis.warnings:
+        if code in (WARN_OBFUSCATION, WARN_DYNAMIC_EXEC):
+            logger.warning(f"SECURITY WARNING: Suspicious pattern detected: {code} in SQL: {sql[:50]}...")
+        elif code in (WARN_UNION_SELECT, WARN_STACKED, WARN_COMMENT):
+            logger.warning(f"SECURITY WARNING: Potential SQL injection pattern: {code} in SQL: {sql[:50]}...")
+
+    # Block SELECT * without WHERE clause to prevent full table scans
+    # (system catalogs and TOP/SAMPLE queries are allowed)
+    if analysis.unbounded_select_star:
+        raise SQLValidationError(
+            "SELECT * without WHERE clause is not allowed. "
+            "Use specific columns or add a WHERE clause to limit results."
+        )
+
+    if analysis.functions:
+        raise SQLValidationError(f"Function '{analysis.functions[0]}' is not allowed for security reasons")
+
+    if WARN_LARGE_RESULT in analysis.warnings:
+        logger.warning(f"Query may return large result set: {sql[:100]}...")
+
+    logger.info(f"SQL validation passed for query: {sql[:100]}{'...' if len(sql) > 100 else ''}")
+    return analysis
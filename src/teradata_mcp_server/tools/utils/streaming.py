@@ -0,0 +1,68 @@
+"""Streaming result serialization.
+
+Large query results used to be held in memory several times over: the fetched
+rows, the list of dicts from rows_to_json, the JSON string from create_response
+and the re-parsed, re-indented copy made by format_text_response. The helpers
+below fetch rows in batches with ``fetchmany`` and write each batch straight
+into the final (pretty-printed) response text, so only one batch of row objects
+is alive at any time.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+from .encoder import column_converters, convert_rows
+from .pagination import PageQuery, get_max_rows, mark_truncated
+from .response_format import JSONText, ResultWriter
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def iter_batches(cursor: Any, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[list[Any]]:
+    """Yield lists of rows from a DB-API cursor using fetchmany."""
+    while True:
+        batch = cursor.fetchmany(batch_size)
+        if not batch:
+            return
+        yield batch
+
+
+def stream_response(
+    cursor: Any,
+    metadata: dict[str, Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    page_query: PageQuery | None = None,
+    offset: int = 0,
+) -> JSONText:
+    """Serialize all remaining cursor rows into a success response, batch by batch.
+
+    Rows are written in the current response format; in the default 'rows'
+    format the text is the same as format_text_response(create_response(rows_to_json(...), metadata)).
+    ``metadata["row_count"]`` is set to the number of rows streamed. When a row
+    cap is configured and more rows remain, the response is truncated and, if
+    ``page_query`` is given, a continuation token resuming after ``offset`` plus
+    the rows returned is added to the metadata.
+    """
+    max_rows = get_max_rows()
+    columns = [col[0] for col in cursor.description or []]
+    converters = column_converters(cursor.description)
+    writer = ResultWriter(columns)
+    truncated = False
+    if max_rows:
+        batch_size = min(batch_size, max_rows + 1)
+    for batch in iter_batches(cursor, batch_size):
+        for row in convert_rows(converters, batch):
+            if max_rows and writer.row_count >= max_rows:
+                truncated = True
+                break
+            writer.write(row)
+        if truncated:
+            break
+    metadata["row_count"] = writer.row_count
+    if max_rows:
+        metadata["truncated"] = False
+        if truncated:
+            mark_truncated(metadata, page_query, offset + writer.row_count)
+    return writer.finish(metadata)
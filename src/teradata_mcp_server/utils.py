@@ -4,6 +4,7 @@
 - Configuration loading utilities:
   1. Packaged profiles.yml + working directory profiles.yml (working dir wins)
   2. All src/tools/*/*.yml + working directory *.yml (working dir wins)
+- Profile pattern matching
 """
 
 import sys
@@ -12,8 +13,9 @@ import logging
 import logging.config
 import logging.handlers
 import os
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 from importlib.resources import files as pkg_files
 import yaml
 
@@ -138,7 +140,11 @@ def format_text_response(text: Any):
     """
     import json
     from mcp import types
+    from teradata_mcp_server.tools.utils.response_format import JSONText
 
+    if isinstance(text, JSONText):
+        # Already serialized in its final layout by the streaming path
+        return [types.TextContent(type="text", text=str(text))]
     if isinstance(text, str):
         try:
             parsed = json.loads(text)
@@ -152,6 +158,52 @@ def format_error_response(error: str):
     return format_text_response(f"Error: {error}")
 
 
+# -------------------- Profile matching -------------------- #
+# Constructs that change meaning when patterns are joined into one alternation
+_UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)")
+
+
+class ProfileMatcher:
+    """Decides whether an object name is selected by a profile's patterns.
+
+    Same semantics as ``any(re.match(p, name) for p in patterns)``, but the
+    patterns are compiled once into a single alternation and each name's
+    decision is cached, so registering thousands of objects does not re-run
+    every pattern per name (and per check).
+    """
+
+    def __init__(self, patterns: Optional[Iterable[str]]):
+        self.patterns = tuple(patterns or ())
+        self._decisions: Dict[str, bool] = {}
+        self._match = None
+        if not self.patterns:
+            return
+        if not any(_UNCOMBINABLE.search(p) for p in self.patterns):
+            try:
+                self._match = re.compile("|".join(f"(?:{p})" for p in self.patterns)).match
+            except re.error:
+                # e.g. the same named group in two patterns; match them one by one
+                pass
+        if self._match is None:
+            compiled = [re.compile(p) for p in self.patterns]
+            self._match = lambda name: any(c.match(name) for c in compiled)
+
+    def __call__(self, name: str) -> bool:
+        decision = self._decisions.get(name)
+        if decision is None:
+            decision = self._decisions[name] = self._match is not None and bool(self._match(name))
+        return decision
+
+
+# libyaml's C loader parses large object catalogs several times faster than the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML like yaml.safe_load, using the C loader when PyYAML was built with libyaml."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
 def load_profiles(working_dir: Optional[Path] = None) -> Dict[str, Any]:
     """Load packaged profiles.yml, then working directory profiles.yml (overrides)."""
     if working_dir is None:
@@ -221,7 +273,7 @@ def load_all_objects(working_dir: Optional[Path] = None) -> Dict[str, Any]:
                     for yml_file in subdir.iterdir():
                         if yml_file.is_file() and yml_file.name.endswith('.yml'):
                             try:
-                                loaded = yaml.safe_load(yml_file.read_text(encoding='utf-8')) or {}
+                                loaded = load_yaml(yml_file.read_text(encoding='utf-8')) or {}
                                 # Filter by allowed object types
                                 filtered = {k: v for k, v in loaded.items() 
                                           if isinstance(v, dict) and v.get('type') in allowed_types}
@@ -237,7 +289,7 @@ def load_all_objects(working_dir: Optional[Path] = None) -> Dict[str, Any]:
             continue
         try:
             with open(yml_file, encoding='utf-8') as f:
-                loaded = yaml.safe_load(f) or {}
+                loaded = load_yaml(f) or {}
                 # Filter by allowed object types
                 filtered = {k: v for k, v in loaded.items() 
                           if isinstance(v, dict) and v.get('type') in allowed_types}
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-call overhead of the tool adapter (no database needed).
+
+Builds the MCP app, swaps the Teradata engine for an in-process stub that
+returns a canned one-row result, and times calls through the registered tool
+wrappers (worker pool hop + QueryBand + handler + response formatting).
+It also times the handler-signature introspection that the adapter used to
+repeat on every call, against the dispatch descriptor built at registration,
+and base_readQuery with a bound IN-list under each SQL metadata mode (the
+literal SQL is only rendered in 'full' and 'truncated').
+
+Usage:
+    python tests/mcp_bench/bench_adapter_overhead.py [--calls 20000] [--profile dba] [--in-list 200]
+"""
+
+import argparse
+import asyncio
+import inspect
+import time
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy.engine import Connection, default
+
+from fastmcp.server.context import Context
+from teradata_mcp_server.app import build_dispatch, create_mcp_app
+from teradata_mcp_server.config import Settings
+from teradata_mcp_server.middleware import RequestContext
+from teradata_mcp_server.tools.utils import SQL_METADATA_MODES, configure_sql_metadata
+
+
+DESCRIPTION = [
+    ("DataBaseName", str, None, 128, None, None, True),
+    ("Amount", Decimal, None, 18, 18, 2, True),
+    ("LastAlter", date, None, 10, None, None, True),
+]
+ROWS = [("DBC", Decimal("12.50"), date(2025, 1, 1))]
+
+
+class StubCursor:
+    description = DESCRIPTION
+
+    def __init__(self):
+        self._rows = list(ROWS)
+
+    def execute(self, sql, params=None):
+        self._rows = list(ROWS)
+        return self
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchmany(self, size=1):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class StubDBAPIConnection:
+    def cursor(self):
+        return StubCursor()
+
+    def cancel(self):
+        pass
+
+
+class StubPooledConnection:
+    """Mimics the PoolProxiedConnection returned by Engine.raw_connection()."""
+
+    def __init__(self):
+        self.dbapi_connection = StubDBAPIConnection()
+        self.info = {}
+
+    def cursor(self):
+        return StubCursor()
+
+    def close(self):
+        pass
+
+
+class StubResult:
+    def __init__(self):
+        self.cursor = StubCursor()
+
+    def close(self):
+        pass
+
+
+class StubSQLAConnection:
+    """Mimics the parts of sqlalchemy.engine.Connection used by the handlers."""
+
+    dialect = default.DefaultDialect()
+
+    def __init__(self):
+        self.connection = StubPooledConnection()
+
+    def execute(self, stmt, params=None):
+        return StubResult()
+
+    def exec_driver_sql(self, sql, params=None):
+        return StubResult()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class StubEngine:
+    def connect(self):
+        return StubSQLAConnection()
+
+    def raw_connection(self):
+        return StubPooledConnection()
+
+    def dispose(self):
+        pass
+
+
+def resolve_per_call(handler):
+    """The introspection the adapter used to perform on every call."""
+    sig = inspect.signature(handler)
+    first_param = next(iter(sig.parameters.values()))
+    ann = first_param.annotation
+    return inspect.isclass(ann) and issubclass(ann, Connection)
+
+
+async def time_tool(mcp, tool_name: str, params: dict, calls: int) -> float:
+    tool = await mcp.get_tool(tool_name)
+    async with Context(fastmcp=mcp) as ctx:
+        ctx.set_state("request_context", RequestContext(headers={}, request_id="bench", session_id="bench"))
+        for _ in range(min(calls, 200)):  # warm-up
+            await tool.fn(**params)
+        start = time.perf_counter()
+        for _ in range(calls):
+            await tool.fn(**params)
+        return (time.perf_counter() - start) / calls
+
+
+async def main(calls: int, profile: str, in_list: int):
+    mcp, _ = create_mcp_app(Settings(profile=profile, logging_level="ERROR"))
+    middleware = next(m for m in mcp.middleware if hasattr(m, "tdconn_supplier"))
+    middleware.tdconn_supplier().engine = StubEngine()
+
+    print(f"\nAdapter overhead ({calls} calls per tool, stub connection)")
+    print("-" * 60)
+    cases = [
+        ("base_databaseList", {}),
+        ("base_readQuery", {"sql": "SELECT DataBaseName FROM dbc.DatabasesV WHERE DataBaseName = 'DBC'"}),
+    ]
+    for tool_name, params in cases:
+        per_call = await time_tool(mcp, tool_name, params, calls)
+        print(f"  {tool_name:<24} {per_call * 1e6:10.1f} us/call")
+
+    from teradata_mcp_server.tools.base.base_tools import handle_base_readQuery
+    start = time.perf_counter()
+    for _ in range(calls):
+        resolve_per_call(handle_base_readQuery)
+    introspect = (time.perf_counter() - start) / calls
+    dispatch = build_dispatch(handle_base_readQuery)
+    start = time.perf_counter()
+    for _ in range(calls):
+        dispatch.use_sqla
+    descriptor = (time.perf_counter() - start) / calls
+    print(f"  {'signature per call':<24} {introspect * 1e6:10.2f} us/call")
+    print(f"  {'dispatch descriptor':<24} {descriptor * 1e6:10.2f} us/call")
+
+    print(f"\nbase_readQuery with a {in_list}-value bound IN-list, by SQL metadata mode")
+    print("-" * 60)
+    binds = {f"p{i}": f"DB_{i:05d}" for i in range(in_list)}
+    params = {
+        "sql": "SELECT DataBaseName FROM dbc.DatabasesV WHERE DataBaseName IN ("
+        + ", ".join(f":{name}" for name in binds) + ")",
+        **binds,
+    }
+    results = {}
+    for mode in SQL_METADATA_MODES:
+        configure_sql_metadata(mode)
+        results[mode] = await time_tool(mcp, "base_readQuery", params, max(1, calls // 10))
+    for mode in SQL_METADATA_MODES:
+        print(f"  {mode:<24} {results[mode] * 1e6:10.1f} us/call  ({results['full'] / results[mode]:.2f}x vs full)")
+    configure_sql_metadata("full")
+    print("-" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tool adapter overhead micro-benchmark")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--profile", default="dba")
+    parser.add_argument("--in-list", type=int, default=200, help="bound values in the IN-list case")
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.profile, args.in_list))
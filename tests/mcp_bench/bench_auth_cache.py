@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Auth cache benchmark: concurrent session lookups and memory bound (no database needed).
+
+``--threads`` worker threads each serve requests of ``--sessions`` distinct
+sessions (a get per request, a set on a miss, as RequestContextMiddleware
+does), once against the previous single-RLock cache and once against the
+sharded SecureAuthCache. Reported per cache:
+
+- throughput and p50/p99 latency of a get/set pair,
+- final size after ``--sessions`` one-off sessions whose entries have all
+  expired (unbounded growth vs. sweeper/max_entries), and
+- hit/miss/eviction counts from get_stats.
+
+Usage:
+    python tests/mcp_bench/bench_auth_cache.py [--threads 32] [--sessions 5000] [--requests 20000]
+"""
+
+import argparse
+import random
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from teradata_mcp_server.tools.auth_cache import SecureAuthCache
+
+
+@dataclass
+class _Entry:
+    principal: str
+    auth_hash: str
+    expires_at: float
+    created_at: float
+
+
+class LegacyAuthCache:
+    """The previous implementation: one dict behind one RLock, expiry only on lookup."""
+
+    def __init__(self, ttl_seconds: int = 300):
+        self._cache: dict[str, _Entry] = {}
+        self._lock = threading.RLock()
+        self._ttl = ttl_seconds
+
+    def get(self, session_id: str, auth_hash: str) -> Optional[str]:
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if not entry:
+                return None
+            if time.time() >= entry.expires_at:
+                del self._cache[session_id]
+                return None
+            if entry.auth_hash != auth_hash:
+                return None
+            return entry.principal
+
+    def set(self, session_id: str, principal: str, auth_hash: str):
+        now = time.time()
+        with self._lock:
+            self._cache[session_id] = _Entry(principal, auth_hash, now + self._ttl, now)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+def run_contention(cache, threads: int, sessions: int, requests: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        local = []
+        barrier.wait()
+        for _ in range(requests):
+            sid = f"session-{rng.randrange(sessions)}"
+            start = time.perf_counter()
+            if cache.get(sid, "hash-" + sid) is None:
+                cache.set(sid, "user-" + sid, "hash-" + sid)
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start, latencies
+
+
+def run_churn(cache, sessions: int) -> int:
+    # One-off sessions that never come back: entries expire but are only
+    # removed by a later lookup of the same session, a sweep, or eviction
+    for i in range(sessions):
+        cache.set(f"oneoff-{i}", "user", "hash")
+    time.sleep(2.2)
+    return cache.size()
+
+
+def main(threads: int, sessions: int, requests: int, max_entries: int):
+    total = threads * requests
+    print(f"\nAuth cache: {threads} threads x {requests} requests over {sessions} sessions")
+    print("-" * 78)
+    print(f"  {'cache':<22} {'req/s':>10} {'p50 us':>8} {'p99 us':>8} {'size after churn':>18}")
+    for label, factory in (
+        ("single RLock", lambda: LegacyAuthCache(ttl_seconds=1)),
+        ("sharded + sweeper", lambda: SecureAuthCache(ttl_seconds=1, max_entries=max_entries)),
+    ):
+        cache = factory()
+        elapsed, latencies = run_contention(cache, threads, sessions, requests)
+        latencies.sort()
+        churn_cache = factory()
+        if isinstance(churn_cache, SecureAuthCache):
+            churn_cache.start_sweeper(1)
+        size = run_churn(churn_cache, sessions)
+        if isinstance(churn_cache, SecureAuthCache):
+            churn_cache.stop()
+        print(f"  {label:<22} {total / elapsed:10.0f} {statistics.median(latencies) * 1e6:8.1f} "
+              f"{latencies[int(len(latencies) * 0.99)] * 1e6:8.1f} {size:18d}")
+        if isinstance(cache, SecureAuthCache):
+            stats = cache.get_stats()
+            print(f"  {'':<22} hits={stats['hits']} misses={stats['misses']} "
+                  f"evictions={stats['evictions']} expirations={stats['expirations']}")
+    print("-" * 78)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Auth cache contention benchmark")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--max-entries", type=int, default=10000)
+    args = parser.parse_args()
+    main(args.threads, args.sessions, args.requests, args.max_entries)
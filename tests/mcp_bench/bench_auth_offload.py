@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Auth offload benchmark: event-loop stalls caused by credential validation (no database needed).
+
+``--requests`` concurrent requests arrive with ``--tokens`` distinct
+Authorization headers; each validation is a blocking call of
+``--logon-ms`` (standing in for the teradatasql logon). Meanwhile a ticker
+task measures how late the event loop wakes it up every 10 ms, which is the
+delay every other in-flight request sees. Compared:
+
+- inline:    validation called directly in the coroutine (previous middleware)
+- executor:  AuthValidationExecutor (bounded workers, coalescing per token)
+
+Usage:
+    python tests/mcp_bench/bench_auth_offload.py [--requests 50] [--tokens 10] [--logon-ms 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+from teradata_mcp_server.tools.auth_executor import AuthValidationExecutor
+
+
+async def ticker(stop: asyncio.Event, lags: list[float]):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append((time.perf_counter() - start - 0.01) * 1000)
+
+
+async def run(mode: str, requests: int, tokens: int, logon_ms: float, workers: int) -> dict:
+    logons = 0
+    lock = threading.Lock()
+
+    def logon():
+        nonlocal logons
+        with lock:
+            logons += 1
+        time.sleep(logon_ms / 1000)
+        return "user"
+
+    executor = AuthValidationExecutor(max_workers=workers, timeout=60)
+
+    async def request(i: int):
+        token = f"token-{i % tokens}"
+        if mode == "inline":
+            return logon()
+        return await executor.validate("basic", token, logon)
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    tick = asyncio.create_task(ticker(stop, lags))
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await asyncio.gather(*(request(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick
+    executor.shutdown()
+    return {
+        "elapsed_s": elapsed,
+        "logons": logons,
+        "max_lag_ms": max(lags) if lags else 0.0,
+        "p50_lag_ms": statistics.median(lags) if lags else 0.0,
+        "stats": executor.get_stats(),
+    }
+
+
+def main(requests: int, tokens: int, logon_ms: float, workers: int):
+    print(f"\nCredential validation: {requests} concurrent requests, {tokens} tokens, {logon_ms:g} ms logon")
+    print("-" * 72)
+    print(f"  {'mode':<10} {'total s':>9} {'logons':>8} {'loop lag p50 ms':>16} {'max ms':>10}")
+    for mode in ("inline", "executor"):
+        r = asyncio.run(run(mode, requests, tokens, logon_ms, workers))
+        print(f"  {mode:<10} {r['elapsed_s']:9.2f} {r['logons']:8d} {r['p50_lag_ms']:16.1f} {r['max_lag_ms']:10.1f}")
+    latency = r["stats"]["latency"]["basic"]
+    print(f"  executor histogram: count={latency['count']} mean={latency['mean_ms']} ms, "
+          f"coalesced={r['stats']['coalesced']}")
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Credential validation offload benchmark")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--tokens", type=int, default=10)
+    parser.add_argument("--logon-ms", type=float, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    main(args.requests, args.tokens, args.logon_ms, args.workers)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: value conversion and JSON encoding of result sets (no database needed).
+
+Uses decimal/date/timestamp-heavy generated rows and compares:
+
+- per-cell isinstance chain (the previous rows_to_json) vs. per-column
+  converters built once from cursor.description,
+- the standard library json encoder vs. orjson (when installed).
+
+Usage:
+    python tests/mcp_bench/bench_encoder.py [--rows 50000] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from teradata_mcp_server.tools.utils import encoder, rows_to_json
+
+DESCRIPTION = [
+    ("TxnId", int, None, None, None, None, False),
+    ("Account", str, None, None, None, None, True),
+    ("Amount", Decimal, None, None, 18, 2, True),
+    ("Balance", Decimal, None, None, 18, 2, True),
+    ("Rate", Decimal, None, None, 9, 6, True),
+    ("TxnDate", date, None, None, None, None, True),
+    ("ValueDate", date, None, None, None, None, True),
+    ("CreatedTs", datetime, None, None, None, None, True),
+    ("UpdatedTs", datetime, None, None, None, None, True),
+    ("Fee", Decimal, None, None, 18, 2, True),
+]
+
+
+def make_rows(n: int) -> list[tuple]:
+    base_ts = datetime(2025, 1, 1, 8, 0, 0)
+    rows = []
+    for i in range(n):
+        ts = base_ts + timedelta(seconds=i * 17)
+        rows.append((
+            i,
+            f"ACC{i % 9973:06d}",
+            Decimal(i % 100000) / 100,
+            Decimal(i * 7 % 10000000) / 100,
+            Decimal(i % 1000) / 1000000,
+            ts.date(),
+            None if i % 10 == 0 else (ts + timedelta(days=2)).date(),
+            ts,
+            ts + timedelta(minutes=5),
+            Decimal(i % 500) / 100,
+        ))
+    return rows
+
+
+def legacy_rows_to_json(description, rows):
+    columns = [col[0] for col in description]
+    ser = encoder.serialize_teradata_types
+    return [{col: ser(val) for col, val in zip(columns, row)} for row in rows]
+
+
+def best_of(repeat: int, func, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(n: int, repeat: int):
+    rows = make_rows(n)
+    print(f"\nEncoder ({n} rows x {len(DESCRIPTION)} columns, best of {repeat})")
+    print("-" * 60)
+    legacy_s, legacy = best_of(repeat, legacy_rows_to_json, DESCRIPTION, rows)
+    typed_s, typed = best_of(repeat, rows_to_json, DESCRIPTION, rows)
+    assert legacy == typed, "per-column converters changed the output"
+    print(f"  {'convert: isinstance chain':<32} {legacy_s * 1000:10.1f} ms")
+    print(f"  {'convert: per-column converters':<32} {typed_s * 1000:10.1f} ms  ({legacy_s / typed_s:.2f}x)")
+
+    response = {"status": "success", "results": typed, "metadata": {"row_count": n}}
+    json_s, _ = best_of(repeat, lambda: json.dumps(response, indent=2, ensure_ascii=False))
+    print(f"  {'encode: json':<32} {json_s * 1000:10.1f} ms")
+    if encoder.orjson is not None:
+        encoder.set_json_backend("orjson")
+        orjson_s, _ = best_of(repeat, encoder.dumps, response, True)
+        print(f"  {'encode: orjson':<32} {orjson_s * 1000:10.1f} ms  ({json_s / orjson_s:.2f}x)")
+    else:
+        print(f"  {'encode: orjson':<32} {'not installed':>13}")
+    print("-" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Result encoder micro-benchmark")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""JWT verification benchmark: local JWKS verification vs. database logon (no database needed).
+
+Issues ``--tokens`` distinct RS256 tokens (so the credential cache never
+hits) signed by a key published in a temporary JWKS file, and validates each
+through ``TDConn.validate_auth_header``:
+
+- database: AUTH_JWT_VERIFY=database, i.e. a LOGMECH=JWT logon per token; the
+            logon is simulated by a stub engine that waits ``--logon-ms``
+- local:    AUTH_JWT_VERIFY=local, signature/exp/iss/aud checked against the
+            cached JWKS
+
+Requires PyJWT[crypto] (pip install teradata-mcp-server[jwt]).
+
+Usage:
+    python tests/mcp_bench/bench_jwt_verify.py [--tokens 2000] [--logon-ms 150]
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from teradata_mcp_server.config import Settings
+from teradata_mcp_server.tools import td_connect
+
+
+class StubEngine:
+    """Stands in for the NullPool engine of a LOGMECH=JWT logon."""
+
+    def __init__(self, logon_ms: float):
+        self.logon_ms = logon_ms
+
+    def connect(self):
+        time.sleep(self.logon_ms / 1000)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def exec_driver_sql(self, sql):
+        return self
+
+    def fetchone(self):
+        return ("BENCH_USER",)
+
+    def dispose(self):
+        pass
+
+
+def issue_tokens(count: int, key, kid: str) -> list[str]:
+    now = int(time.time())
+    return [
+        jwt.encode(
+            {"sub": f"user{i % 50}", "iss": "https://idp.example", "aud": "teradata-mcp",
+             "iat": now, "exp": now + 3600, "jti": str(i)},
+            key, algorithm="RS256", headers={"kid": kid},
+        )
+        for i in range(count)
+    ]
+
+
+def run(mode: str, tokens: list[str], jwks_path: str, logon_ms: float) -> tuple[float, int]:
+    settings = Settings(
+        database_uri="teradata://svc:pw@stub:1025/db", auth_mode="basic", auth_rate_limit_attempts=10 ** 9,
+        auth_jwt_verify=mode, auth_jwt_jwks=jwks_path,
+        auth_jwt_issuer="https://idp.example", auth_jwt_audience="teradata-mcp",
+    )
+    original = td_connect.create_engine
+    td_connect.create_engine = lambda url, **kw: StubEngine(logon_ms) if "LOGMECH=JWT" in url else original(url, **kw)
+    try:
+        conn = td_connect.TDConn(settings=settings)
+        start = time.perf_counter()
+        ok = sum(1 for token in tokens if conn.validate_auth_header(f"Bearer {token}"))
+        return time.perf_counter() - start, ok
+    finally:
+        td_connect.create_engine = original
+
+
+def main(count: int, logon_ms: float, db_tokens: int):
+    logging.disable(logging.CRITICAL)
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+    jwk.update({"kid": "bench-1", "use": "sig", "alg": "RS256"})
+    tokens = issue_tokens(count, key, "bench-1")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jwks_path = str(Path(tmp, "jwks.json"))
+        Path(jwks_path).write_text(json.dumps({"keys": [jwk]}))
+        # The database path is slow by nature; time a sample and report the rate
+        db_s, db_ok = run("database", tokens[:db_tokens], jwks_path, logon_ms)
+        local_s, local_ok = run("local", tokens, jwks_path, logon_ms)
+
+    print(f"\nBearer JWT validation of distinct RS256 tokens (simulated logon {logon_ms:g} ms)")
+    print("-" * 64)
+    print(f"  {'path':<12} {'tokens':>8} {'valid':>8} {'total s':>9} {'validations/s':>14}")
+    print(f"  {'database':<12} {db_tokens:8d} {db_ok:8d} {db_s:9.2f} {db_tokens / db_s:14.1f}")
+    print(f"  {'local':<12} {count:8d} {local_ok:8d} {local_s:9.2f} {count / local_s:14.1f}")
+    print("-" * 64)
+    print(f"  local is {(count / local_s) / (db_tokens / db_s):.0f}x the database path")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local JWT verification benchmark")
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--logon-ms", type=float, default=150)
+    parser.add_argument("--db-tokens", type=int, default=20, help="tokens validated through the database path")
+    args = parser.parse_args()
+    main(args.tokens, args.logon_ms, args.db_tokens)
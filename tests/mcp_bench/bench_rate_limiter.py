@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Rate limiter stress benchmark: memory and throughput under a credential-stuffing burst.
+
+Feeds ``--clients`` distinct client ids (one attempt each, as a burst from
+many addresses produces) plus a repeating attacker id into each limiter from
+``--threads`` threads, then reports throughput, the number of clients still
+tracked and the memory they retain (tracemalloc, measured in a second run):
+
+- deque log: the previous limiter, a timestamp deque per client in a
+  defaultdict, kept until cleanup_old_entries is called (nothing calls it)
+- sliding counter: the sharded sliding-window-counter RateLimiter capped at
+  ``--max-clients``
+
+Usage:
+    python tests/mcp_bench/bench_rate_limiter.py [--clients 1000000] [--threads 8] [--max-clients 100000]
+"""
+
+import argparse
+import gc
+import threading
+import time
+import tracemalloc
+from collections import defaultdict, deque
+
+from teradata_mcp_server.tools.auth_validation import RateLimiter
+
+
+class DequeRateLimiter:
+    """The previous implementation: a sliding log of timestamps per client."""
+
+    def __init__(self, max_attempts: int = 5, window_seconds: int = 60):
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self._attempts: dict[str, deque] = defaultdict(deque)
+        self._lock = threading.RLock()
+
+    def is_allowed(self, client_id: str) -> bool:
+        current_time = time.time()
+        window_start = current_time - self.window_seconds
+        with self._lock:
+            attempts_queue = self._attempts[client_id]
+            while attempts_queue and attempts_queue[0] < window_start:
+                attempts_queue.popleft()
+            if len(attempts_queue) >= self.max_attempts:
+                return False
+            attempts_queue.append(current_time)
+            return True
+
+    def size(self) -> int:
+        return len(self._attempts)
+
+
+def run(limiter, clients: int, threads: int, trace: bool) -> tuple[float, int, int]:
+    per_thread = clients // threads
+    denied = [0] * threads
+    thread_ids = [[f"{t:02d}{i:012x}:10.{t}.{i >> 8 & 255}.{i & 255}" for i in range(per_thread)]
+                  for t in range(threads)]
+
+    def worker(t: int):
+        ids = thread_ids[t]
+        attacker = "attacker:203.0.113.7"
+        count = 0
+        for i, client_id in enumerate(ids):
+            limiter.is_allowed(client_id)
+            if i % 100 == 0 and not limiter.is_allowed(attacker):
+                count += 1
+        denied[t] = count
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    retained = 0
+    del thread_ids[:]
+    if trace:
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return per_thread * threads / elapsed, retained, sum(denied)
+
+
+def main(clients: int, threads: int, max_clients: int):
+    print(f"\nRate limiter: {clients} distinct client ids from {threads} threads")
+    print("-" * 74)
+    print(f"  {'limiter':<18} {'attempts/s':>12} {'tracked':>10} {'retained MB':>12} {'attacker denied':>16}")
+    for label, factory in (
+        ("deque log", lambda: DequeRateLimiter()),
+        ("sliding counter", lambda: RateLimiter(max_clients=max_clients)),
+    ):
+        # Throughput untraced (tracemalloc slows every allocation), memory in a second, traced run
+        rate, _, _ = run(factory(), clients, threads, trace=False)
+        limiter = factory()
+        _, retained, denied = run(limiter, clients, threads, trace=True)
+        print(f"  {label:<18} {rate:12.0f} {limiter.size():10d} {retained / 2**20:12.1f} {denied:16d}")
+        if isinstance(limiter, RateLimiter):
+            stats = limiter.get_stats()
+            print(f"  {'':<18} refused={stats['refused_clients']} denied={stats['denied']}")
+        del limiter
+    print("-" * 74)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rate limiter stress benchmark")
+    parser.add_argument("--clients", type=int, default=1_000_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--max-clients", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.clients, args.threads, args.max_clients)
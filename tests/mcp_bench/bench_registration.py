@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Registration benchmark: profile pattern matching and YAML tool registration (no database needed).
+
+Generates ``--tools`` synthetic YAML query tools spread over ``--domains``
+name prefixes, and a profile with one ``^gen_<domain>_.*`` pattern per domain
+(as a large generated cube/query catalog would have), then measures:
+
+- matching: selecting the tools the profile enables, once with the previous
+  ``any(re.match(p, name) for p in patterns)`` per check and once with the
+  precompiled ProfileMatcher (each name is checked twice, as create_mcp_app
+  does for the tool and for its glossary terms),
+- register: create_mcp_app with the synthetic *_objects.yml in the working
+  directory, i.e. the full registration path.
+
+Usage:
+    python tests/mcp_bench/bench_registration.py [--tools 5000] [--domains 50]
+"""
+
+import argparse
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from teradata_mcp_server.utils import ProfileMatcher
+
+
+def synthetic_objects(tools: int, domains: int) -> dict:
+    objects = {}
+    for i in range(tools):
+        domain = i % domains
+        objects[f"gen_dom{domain:03d}_metric{i:05d}"] = {
+            "type": "tool",
+            "description": f"Synthetic metric {i} of domain {domain}.",
+            "parameters": {
+                "start_date": {"description": "Start date (YYYY-MM-DD)", "type_hint": "str"},
+                "end_date": {"description": "End date (YYYY-MM-DD)", "type_hint": "str"},
+            },
+            "sql": (
+                f"SELECT LogDate, SUM(Amount) AS Amount FROM Sales.Fact{i % 97:02d} "
+                f"WHERE Domain = {domain} AND LogDate BETWEEN :start_date AND :end_date GROUP BY LogDate"
+            ),
+        }
+    return objects
+
+
+def profile_patterns(domains: int) -> list[str]:
+    # Every other domain is enabled, so half the names fall through all patterns
+    return ["^base_.*"] + [f"^gen_dom{d:03d}_.*" for d in range(0, domains, 2)]
+
+
+def time_matching(names: list[str], patterns: list[str]) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    legacy = [name for name in names
+              if any(re.match(p, name) for p in patterns) and any(re.match(p, name) for p in patterns)]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = ProfileMatcher(patterns)
+    compiled = [name for name in names if matcher(name) and matcher(name)]
+    compiled_s = time.perf_counter() - start
+    assert legacy == compiled
+    return legacy_s, compiled_s, len(compiled)
+
+
+def time_registration(objects: dict, patterns: list[str]) -> tuple[float, int]:
+    from teradata_mcp_server.app import create_mcp_app
+    from teradata_mcp_server.config import Settings
+    import asyncio
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        Path(tmp, "synthetic_objects.yml").write_text(yaml.dump(objects, Dumper=dumper, sort_keys=False))
+        Path(tmp, "profiles.yml").write_text(yaml.safe_dump({"synthetic": {"tool": patterns, "prompt": [], "resource": []}}))
+        os.chdir(tmp)
+        try:
+            start = time.perf_counter()
+            mcp, _ = create_mcp_app(Settings(profile="synthetic", logging_level="ERROR"))
+            elapsed = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+    return elapsed, len(asyncio.run(mcp.get_tools()))
+
+
+def main(tools: int, domains: int):
+    logging.disable(logging.CRITICAL)
+    objects = synthetic_objects(tools, domains)
+    patterns = profile_patterns(domains)
+    names = list(objects)
+
+    legacy_s, compiled_s, selected = time_matching(names, patterns)
+    print(f"\nProfile matching: {tools} names x {len(patterns)} patterns ({selected} selected)")
+    print("-" * 64)
+    print(f"  {'any(re.match) per check':<28} {legacy_s * 1000:10.1f} ms")
+    print(f"  {'ProfileMatcher':<28} {compiled_s * 1000:10.1f} ms  ({legacy_s / compiled_s:.1f}x)")
+
+    register_s, registered = time_registration(objects, patterns)
+    print(f"\nRegistration of {tools} synthetic YAML tools")
+    print("-" * 64)
+    print(f"  {'create_mcp_app':<28} {register_s * 1000:10.1f} ms  ({registered} tools registered)")
+    print("-" * 64)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile matching and registration benchmark")
+    parser.add_argument("--tools", type=int, default=5000)
+    parser.add_argument("--domains", type=int, default=50)
+    args = parser.parse_args()
+    main(args.tools, args.domains)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: payload size and serialization time per response format (no database needed).
+
+Serializes a generated wide table in each response format through both
+serialization paths used by the tools:
+
+- stream:   cursor -> stream_response (base_readQuery, YAML tools, cubes)
+- buffered: rows_to_json -> create_response (other handle_* tools)
+
+Usage:
+    python tests/mcp_bench/bench_response_formats.py [--rows 5000] [--columns 20] [--repeat 5]
+"""
+
+import argparse
+import time
+from datetime import date
+from decimal import Decimal
+
+from teradata_mcp_server.tools.utils import (
+    RESPONSE_FORMATS,
+    create_response,
+    rows_to_json,
+    stream_response,
+    use_response_format,
+)
+from teradata_mcp_server.utils import format_text_response
+
+
+def make_table(rows: int, columns: int):
+    kinds = [int, str, Decimal, date]
+    description = [
+        (f"Column_{c:02d}_{kinds[c % 4].__name__}", kinds[c % 4], None, None, None, None, True)
+        for c in range(columns)
+    ]
+
+    def value(r, c):
+        kind = kinds[c % 4]
+        if kind is int:
+            return r * columns + c
+        if kind is str:
+            return f"value_{r % 977}_{c}"
+        if kind is Decimal:
+            return Decimal(r % 10000) / 100
+        return date(2025, 1 + r % 12, 1 + c % 28)
+
+    data = [tuple(value(r, c) for c in range(columns)) for r in range(rows)]
+    return description, data
+
+
+class ListCursor:
+    def __init__(self, description, rows):
+        self.description = description
+        self._rows = rows
+        self._pos = 0
+
+    def fetchmany(self, size=1):
+        batch = self._rows[self._pos:self._pos + size]
+        self._pos += len(batch)
+        return batch
+
+
+def metadata_for(description):
+    return {
+        "tool_name": "bench",
+        "sql": "SELECT ...",
+        "columns": [{"name": col[0], "type": col[1].__name__} for col in description],
+        "row_count": 0,
+    }
+
+
+def time_path(path: str, fmt: str, description, rows, repeat: int):
+    best, text = float("inf"), ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with use_response_format(fmt):
+            if path == "stream":
+                text = format_text_response(stream_response(ListCursor(description, rows), metadata_for(description)))[0].text
+            else:
+                metadata = metadata_for(description)
+                data = rows_to_json(description, rows)
+                metadata["row_count"] = len(data)
+                text = format_text_response(create_response(data, metadata))[0].text
+        best = min(best, time.perf_counter() - start)
+    return best, len(text.encode("utf-8"))
+
+
+def main(rows: int, columns: int, repeat: int):
+    description, data = make_table(rows, columns)
+    print(f"\nResponse formats ({rows} rows x {columns} columns, best of {repeat})")
+    print("-" * 72)
+    print(f"  {'format':<10} {'payload KB':>11} {'vs rows':>8} {'stream ms':>11} {'buffered ms':>12}")
+    baseline = None
+    for fmt in RESPONSE_FORMATS:
+        stream_s, size = time_path("stream", fmt, description, data, repeat)
+        buffered_s, _ = time_path("buffered", fmt, description, data, repeat)
+        baseline = baseline or size
+        print(f"  {fmt:<10} {size / 1024:>11.1f} {size / baseline:>7.0%} {stream_s * 1000:>11.1f} {buffered_s * 1000:>12.1f}")
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Response format size/time micro-benchmark")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.columns, args.repeat)
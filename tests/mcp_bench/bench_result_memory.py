@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Memory benchmark: buffered vs streaming result serialization (no database needed).
+
+A stub cursor generates rows on demand (like a driver fetching from the
+database). For each row count the response is built twice, each in a fresh
+subprocess so peak RSS is not shared between runs:
+
+- buffered:  fetchall -> rows_to_json -> create_response -> format_text_response
+- streaming: fetchmany batches -> stream_response -> format_text_response
+
+Usage:
+    python tests/mcp_bench/bench_result_memory.py [--rows 10000,100000,500000] [--batch-size 1000]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import date
+from decimal import Decimal
+
+
+DESCRIPTION = [
+    ("OrderId", int, None, 10, None, None, False),
+    ("Customer", str, None, 64, None, None, True),
+    ("Amount", Decimal, None, 18, 18, 2, True),
+    ("OrderDate", date, None, 10, None, None, True),
+]
+
+
+class GeneratedCursor:
+    """DB-API cursor stub that produces ``rows`` rows lazily."""
+
+    description = DESCRIPTION
+
+    def __init__(self, rows: int):
+        self._remaining = rows
+        self._next = 0
+
+    def _take(self, n: int):
+        n = min(n, self._remaining)
+        start = self._next
+        self._next += n
+        self._remaining -= n
+        return [
+            (i, f"customer_{i % 5000:05d}", Decimal(i % 100000) / 100, date(2025, 1, 1 + i % 28))
+            for i in range(start, start + n)
+        ]
+
+    def fetchall(self):
+        return self._take(self._remaining)
+
+    def fetchmany(self, size=1):
+        return self._take(size)
+
+
+def run_case(mode: str, rows: int, batch_size: int) -> dict:
+    from teradata_mcp_server.tools.utils import create_response, rows_to_json, stream_response
+    from teradata_mcp_server.utils import format_text_response
+
+    metadata = {"tool_name": "base_readQuery", "sql": "SELECT ...", "columns": [], "row_count": 0}
+    tracemalloc.start()
+    start = time.perf_counter()
+    cursor = GeneratedCursor(rows)
+    if mode == "buffered":
+        data = rows_to_json(cursor.description, cursor.fetchall())
+        metadata["row_count"] = len(data)
+        content = format_text_response(create_response(data, metadata))
+    else:
+        content = format_text_response(stream_response(cursor, metadata, batch_size=batch_size))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": mode,
+        "rows": rows,
+        "seconds": round(elapsed, 3),
+        "tracemalloc_peak_mb": round(peak / 2**20, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "response_mb": round(len(content[0].text) / 2**20, 1),
+    }
+
+
+def main(row_counts: list[int], batch_size: int):
+    print(f"\nResult memory (batch size {batch_size})")
+    print("-" * 84)
+    print(f"  {'rows':>9} {'mode':<10} {'time s':>8} {'traced peak MB':>15} {'peak RSS MB':>12} {'response MB':>12}")
+    for rows in row_counts:
+        for mode in ("buffered", "streaming"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--case", mode, "--rows", str(rows), "--batch-size", str(batch_size)],
+                capture_output=True, text=True, check=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"  {r['rows']:>9} {r['mode']:<10} {r['seconds']:>8} {r['tracemalloc_peak_mb']:>15} "
+                  f"{r['peak_rss_mb']:>12} {r['response_mb']:>12}")
+    print("-" * 84)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Buffered vs streaming result memory benchmark")
+    parser.add_argument("--rows", default="10000,100000,500000", help="Comma-separated row counts")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--case", choices=["buffered", "streaming"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.case:
+        print(json.dumps(run_case(args.case, int(args.rows), args.batch_size)))
+    else:
+        main([int(r) for r in args.rows.split(",")], args.batch_size)
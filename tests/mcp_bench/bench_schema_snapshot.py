@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: whole-database schema discovery, per-table loop vs. one snapshot (no database needed).
+
+A stub cursor serves a synthetic database of ``--tables`` tables with
+``--columns`` columns each and sleeps ``--latency-ms`` per statement to stand
+in for the network and DBC round trip. The schema is collected with:
+
+- per-table: base_tableList, then base_columnDescription for every table
+  (N+1 round trips, how agents explore a database today),
+- snapshot:  base_schemaSnapshot (one set-based query over
+  DBC.TablesV/ColumnsV/IndicesV).
+
+Usage:
+    python tests/mcp_bench/bench_schema_snapshot.py [--tables 300] [--columns 12] [--latency-ms 5]
+"""
+
+import argparse
+import json
+import time
+
+from teradata_mcp_server.tools.base.base_tools import (
+    handle_base_columnDescription,
+    handle_base_schemaSnapshot,
+    handle_base_tableList,
+)
+
+
+class CatalogCursor:
+    """DB-API cursor stub answering the three catalog queries for one synthetic database."""
+
+    def __init__(self, catalog, latency_s: float):
+        self.catalog = catalog
+        self.latency_s = latency_s
+        self.statements = 0
+        self.description = None
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        time.sleep(self.latency_s)
+        self.statements += 1
+        if "DBC.IndicesV" in sql:
+            self.description = [(name, str) for name in (
+                "TableName", "TableKind", "TableComment", "ColumnName", "ColumnType", "ColumnLength",
+                "DecimalTotalDigits", "DecimalFractionalDigits", "CharType", "Nullable", "ColumnComment",
+                "PIPosition")]
+            self._rows = [
+                (table, "T", f"{table} table", column, "CV", 200, None, None, 2, "Y", None, 1 if i == 0 else None)
+                for table, columns in self.catalog.items()
+                for i, column in enumerate(columns)
+            ]
+        elif "ColumnsVX" in sql:
+            table = params[0]
+            self.description = [("TableName", str), ("ColumnName", str), ("CType", str)]
+            self._rows = [(table, column, "VARCHAR") for column in self.catalog.get(table, [])]
+        else:
+            self.description = [("TableName", str)]
+            self._rows = [(table,) for table in self.catalog]
+        return self
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CatalogConnection:
+    def __init__(self, catalog, latency_s: float):
+        self.cur = CatalogCursor(catalog, latency_s)
+
+    def cursor(self):
+        return self.cur
+
+
+def per_table(conn) -> int:
+    tables = json.loads(handle_base_tableList(conn, "SALES"))["results"]
+    columns = 0
+    for table in tables:
+        response = handle_base_columnDescription(conn, "SALES", table["TableName"])
+        columns += len(json.loads(response)["results"])
+    return columns
+
+
+def snapshot(conn) -> int:
+    document = json.loads(handle_base_schemaSnapshot(conn, "SALES"))["results"]
+    return sum(len(table["columns"]) for table in document["tables"])
+
+
+def main(tables: int, columns: int, latency_ms: float):
+    catalog = {f"T{t:04d}": [f"C{c:03d}" for c in range(columns)] for t in range(tables)}
+    print(f"\nSchema discovery: {tables} tables x {columns} columns, {latency_ms} ms per statement")
+    print("-" * 72)
+    results = {}
+    for name, fn in (("per-table loop", per_table), ("schema snapshot", snapshot)):
+        conn = CatalogConnection(catalog, latency_ms / 1000)
+        start = time.perf_counter()
+        found = fn(conn)
+        elapsed = time.perf_counter() - start
+        results[name] = elapsed
+        print(f"  {name:<18} {elapsed * 1000:10.1f} ms  {conn.cur.statements:6d} statements  {found} columns")
+    print("-" * 72)
+    print(f"  speedup {results['per-table loop'] / results['schema snapshot']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Schema snapshot micro-benchmark")
+    parser.add_argument("--tables", type=int, default=300)
+    parser.add_argument("--columns", type=int, default=12)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    main(args.tables, args.columns, args.latency_ms)
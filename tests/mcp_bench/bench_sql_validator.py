@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: SQL security validation, regex loops vs. single-pass lexer (no database needed).
+
+Validates the SQL of the YAML tools in dba_objects.yml (or the files given)
+with:
+
+- regex:  the previous validate_sql (14 keywords x 10 patterns plus the
+          suspicious/injection/large-result scans) followed by the final
+          keyword check of base_readQuery,
+- lexer:  validate_sql on the shared tokenizer, whose analysis also answers
+          the base_readQuery checks, with the analysis cache disabled,
+- cached: the same with the analysis cache on, as for template tools that
+          submit the same SQL on every call.
+
+Both verdicts (accepted / rejected) are printed per statement so differences
+in behaviour are visible next to the timings.
+
+Usage:
+    python tests/mcp_bench/bench_sql_validator.py [--files path/to/x_objects.yml ...] [--repeat 2000]
+"""
+
+import argparse
+import logging
+import re
+import time
+from pathlib import Path
+
+import yaml
+
+from teradata_mcp_server.tools.utils import SQLValidationError, configure_validation_cache, validate_sql
+
+DEFAULT_FILE = Path(__file__).resolve().parents[2] / "src/teradata_mcp_server/tools/dba/dba_objects.yml"
+
+
+def legacy_validate_sql(sql: str) -> None:
+    """The regex validator as it was before the lexer (logging removed)."""
+    if not sql or not sql.strip():
+        raise SQLValidationError("Empty SQL query not allowed")
+    sql_normalized = re.sub(r'\s+', ' ', sql.upper().strip())
+    for keyword in ['UPDATE', 'DELETE', 'INSERT', 'DROP', 'CREATE', 'ALTER', 'TRUNCATE',
+                    'MERGE', 'REPLACE', 'GRANT', 'REVOKE', 'CALL', 'EXECUTE', 'UPSERT']:
+        patterns = [
+            rf'^{keyword}\s', rf';\s*{keyword}\s', rf'^{keyword}$', rf';\s*{keyword}$',
+            rf'\s{keyword}\s', rf'^\s*{keyword}\s', rf'\(\s*{keyword}\s', rf'\s{keyword}\s*\(',
+            rf'/\*.*\*/\s*{keyword}', rf'{keyword}\s*/\*',
+        ]
+        for pattern in patterns:
+            if re.search(pattern, sql_normalized):
+                raise SQLValidationError(f"Operation '{keyword}' is strictly prohibited for security reasons")
+    for pattern in [r'CHAR\(\d+\)', r'CHR\(\d+\)', r'CONCAT\(', r'\|\|', r'EXEC\s*\(', r'EXECUTE\s*\(']:
+        re.search(pattern, sql_normalized)
+    for pattern in [r'UNION\s+SELECT', r';\s*SELECT', r'--\s*', r'/\*.*\*/']:
+        re.search(pattern, sql_normalized)
+    if re.search(r'^SELECT\s+\*\s+FROM', sql_normalized) and not re.search(r'\bWHERE\b', sql_normalized):
+        system = [r'FROM\s+DBC\.', r'FROM\s+INFORMATION_SCHEMA\.', r'TOP\s+\d+', r'SAMPLE\s+\d+']
+        if not any(re.search(pattern, sql_normalized) for pattern in system):
+            raise SQLValidationError("SELECT * without WHERE clause is not allowed.")
+    for func in ['EXEC', 'EXECUTE', 'SP_', 'XP_']:
+        if re.search(rf'\b{func}\b', sql_normalized):
+            raise SQLValidationError(f"Function '{func}' is not allowed for security reasons")
+    for pattern in [r'SELECT\s+\*.*FROM.*(?!.*LIMIT|.*TOP|.*SAMPLE|.*WHERE)', r'COUNT\(\*\).*FROM.*(?!.*WHERE)']:
+        re.search(pattern, sql_normalized)
+
+
+def legacy_read_query(sql: str) -> None:
+    legacy_validate_sql(sql)
+    sql_final_check = sql.upper().strip()
+    for dangerous_op in ['DELETE', 'UPDATE', 'INSERT', 'DROP', 'CREATE', 'ALTER', 'TRUNCATE', 'MERGE']:
+        if re.search(rf'\b{dangerous_op}\b', sql_final_check):
+            raise SQLValidationError(f"Operation '{dangerous_op}' blocked at final execution stage")
+
+
+def lexer_read_query(sql: str) -> None:
+    analysis = validate_sql(sql)
+    for dangerous_op in ['DELETE', 'UPDATE', 'INSERT', 'DROP', 'CREATE', 'ALTER', 'TRUNCATE', 'MERGE']:
+        if dangerous_op in analysis.operations:
+            raise SQLValidationError(f"Operation '{dangerous_op}' blocked at final execution stage")
+
+
+def load_statements(files: list[Path]) -> list[tuple[str, str]]:
+    statements = []
+    for path in files:
+        objects = yaml.safe_load(path.read_text()) or {}
+        for name, obj in objects.items():
+            if isinstance(obj, dict) and isinstance(obj.get("sql"), str):
+                statements.append((name, obj["sql"]))
+    return statements
+
+
+def verdict(check, sql: str) -> str:
+    try:
+        check(sql)
+        return "ok"
+    except SQLValidationError as e:
+        return f"rejected ({str(e)[:40]})"
+
+
+def best_of(repeat: int, check, statements):
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for _, sql in statements:
+                try:
+                    check(sql)
+                except SQLValidationError:
+                    pass
+        best = min(best, time.perf_counter() - start)
+    return best / (repeat * len(statements))
+
+
+def main(files: list[Path], repeat: int):
+    logging.disable(logging.CRITICAL)  # validate_sql logs every call
+    statements = load_statements(files)
+    if not statements:
+        raise SystemExit("No SQL statements found")
+    print(f"\nSQL validation ({len(statements)} statements from {', '.join(p.name for p in files)})")
+    print("-" * 78)
+    for name, sql in statements:
+        print(f"  {name:<28} {len(sql):>6} chars  regex: {verdict(legacy_read_query, sql):<12} "
+              f"lexer: {verdict(lexer_read_query, sql)}")
+    regex_s = best_of(repeat, legacy_read_query, statements)
+    configure_validation_cache(0)
+    lexer_s = best_of(repeat, lexer_read_query, statements)
+    cache = configure_validation_cache(1024)
+    cached_s = best_of(repeat, lexer_read_query, statements)
+    print("-" * 78)
+    print(f"  {'regex loops':<28} {regex_s * 1e6:10.1f} us/statement")
+    print(f"  {'single-pass lexer':<28} {lexer_s * 1e6:10.1f} us/statement  ({regex_s / lexer_s:.2f}x)")
+    print(f"  {'lexer + analysis cache':<28} {cached_s * 1e6:10.1f} us/statement  ({regex_s / cached_s:.2f}x)"
+          f"  hit rate {cache.get_stats()['hit_rate']:.2%}")
+    print("-" * 78)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQL validator micro-benchmark")
+    parser.add_argument("--files", nargs="+", type=Path, default=[DEFAULT_FILE])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.files, args.repeat)
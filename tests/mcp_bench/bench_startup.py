@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Startup benchmark: import and tool registration cost of a profile (no database needed).
+
+Each run starts a fresh interpreter (so no module is already imported) and
+measures:
+
+- import:  importing teradata_mcp_server.app
+- app:     create_mcp_app for the profile: importing the tool modules it
+           needs, collecting their handlers and registering the Python and
+           YAML tools
+- lookup:  one ``td.<handler>`` lookup, as done for every YAML tool
+
+The handler count and any duplicate handler names found by the module loader
+are printed with the median timings.
+
+Usage:
+    python tests/mcp_bench/bench_startup.py [--profile dba] [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = r"""
+import json, sys, time
+start = time.perf_counter()
+import teradata_mcp_server.app as app_module
+from teradata_mcp_server import tools as td
+from teradata_mcp_server.config import Settings
+imported = time.perf_counter()
+
+mcp, _ = app_module.create_mcp_app(Settings(profile=sys.argv[1], logging_level="ERROR"))
+app = time.perf_counter()
+
+lookup_start = time.perf_counter()
+for _ in range(100):
+    td.util_base_dynamicQuery
+lookup = (time.perf_counter() - lookup_start) / 100
+
+loader = td.get_module_loader()
+functions = loader.get_all_functions()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "app_ms": (app - imported) * 1000,
+    "lookup_ms": lookup * 1000,
+    "handlers": sum(1 for name in functions if name.startswith("handle_")),
+    "duplicates": sorted(getattr(loader, "get_duplicates", dict)()),
+}))
+"""
+
+
+def run_once(profile: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", CHILD, profile],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(profile: str, runs: int):
+    results = [run_once(profile) for _ in range(runs)]
+    print(f"\nStartup of profile '{profile}' (median of {runs} fresh interpreters)")
+    print("-" * 60)
+    for key, label in (("import_ms", "import app"), ("app_ms", "create_mcp_app"), ("lookup_ms", "handler lookup")):
+        print(f"  {label:<20} {statistics.median(r[key] for r in results):10.3f} ms")
+    last = results[-1]
+    print(f"  {'handlers':<20} {last['handlers']:10d}")
+    print(f"  {'duplicate names':<20} {len(last['duplicates']):10d}  {', '.join(last['duplicates'])[:60]}")
+    print("-" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup micro-benchmark")
+    parser.add_argument("--profile", default="dba")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    main(args.profile, args.runs)
@@ -7,6 +7,7 @@ import asyncio
 import base64
 import json
 import logging
+import math
 import time
 from datetime import datetime
 from typing import Optional, Dict, Any, List
@@ -42,6 +43,14 @@ class ClientMetrics:
     def max_response_time(self) -> float:
         return max(self.request_times) if self.request_times else 0
 
+    def percentile_response_time(self, pct: float) -> float:
+        """Nearest-rank percentile of successful response times."""
+        if not self.request_times:
+            return 0
+        ordered = sorted(self.request_times)
+        rank = math.ceil(pct / 100 * len(ordered))
+        return ordered[max(0, min(len(ordered), rank) - 1)]
+
     @property
     def success_rate(self) -> float:
         return (self.successful_requests / self.total_requests * 100) if self.total_requests > 0 else 0
@@ -324,6 +333,9 @@ class MCPStreamableClient:
             'avg_response_time': self.metrics.avg_response_time,
             'min_response_time': self.metrics.min_response_time,
             'max_response_time': self.metrics.max_response_time,
+            'p50_response_time': self.metrics.percentile_response_time(50),
+            'p95_response_time': self.metrics.percentile_response_time(95),
+            'p99_response_time': self.metrics.percentile_response_time(99),
             'requests_per_second': self.metrics.requests_per_second,
             'errors': self.metrics.errors
         }
\ No newline at end of file
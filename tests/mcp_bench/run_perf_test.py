@@ -118,6 +118,8 @@ async def run_test(config_file: str, verbose: bool = False):
         print(f"  Requests: {metrics['total_requests']}")
         print(f"  Success Rate: {metrics['success_rate']:.1f}%")
         print(f"  Avg Response: {metrics['avg_response_time']*1000:.2f}ms")
+        print(f"  p50/p95/p99: {metrics['p50_response_time']*1000:.2f}ms / "
+              f"{metrics['p95_response_time']*1000:.2f}ms / {metrics['p99_response_time']*1000:.2f}ms")
         print(f"  Throughput: {metrics['requests_per_second']:.2f} req/s")
 
     print(f"\nOVERALL:")
@@ -183,6 +185,9 @@ def generate_report(config: Dict, metrics_list: List[Dict], start_time: float, e
                 "avg_response_time_ms": metrics['avg_response_time'] * 1000,
                 "min_response_time_ms": metrics['min_response_time'] * 1000,
                 "max_response_time_ms": metrics['max_response_time'] * 1000,
+                "p50_response_time_ms": metrics['p50_response_time'] * 1000,
+                "p95_response_time_ms": metrics['p95_response_time'] * 1000,
+                "p99_response_time_ms": metrics['p99_response_time'] * 1000,
                 "throughput_rps": metrics['requests_per_second'],
                 "duration": metrics['duration']
             }